@@ -0,0 +1,104 @@
+# benchmark_translation_memory.py
+"""
+번역 캐시 메모리 사용량 비교 (딕셔너리 vs TranslationRecord)
+
+TranslationApplyManager.load_translation_cache_from_db와 같은 구조
+(translation_cache / translation_file_cache / translation_sheet_cache / kr_reverse_cache)를
+가상의 데이터로 만들어 tracemalloc으로 측정합니다.
+
+사용법:
+    python benchmark_translation_memory.py [행 수] [파일 수]
+    예) python benchmark_translation_memory.py 500000 300
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from utils.translation_record import TranslationRecord, intern_text
+
+DB_COLUMNS = ("id", "file_name", "sheet_name", "string_id", "kr", "en", "cn", "tw", "th", "status", "update_date")
+
+
+def generate_rows(row_count, file_count):
+    """DB에서 읽은 것처럼 행마다 새 문자열 객체를 가진 튜플을 생성합니다."""
+    for i in range(row_count):
+        file_no = i % file_count
+        yield (
+            i + 1,
+            "".join(("String", str(file_no), ".xlsx")),
+            "".join(("String", str(file_no % 7))),
+            "".join(("STR_", str(i))),
+            "".join(("한국어 문장 ", str(i))),
+            "".join(("English sentence ", str(i))),
+            "".join(("中文句子 ", str(i))),
+            "".join(("繁體句子 ", str(i))),
+            "".join(("ประโยคภาษาไทย ", str(i))),
+            "".join(("act", "ive")),
+            "".join(("2025-06-21 ", "10:00:00")),
+        )
+
+
+def build_dict_caches(rows):
+    """기존 방식: 행마다 딕셔너리, KR 역방향 캐시는 복사본"""
+    caches = ({}, {}, {}, {})
+    translation_cache, file_cache, sheet_cache, kr_reverse_cache = caches
+    for row in rows:
+        data = dict(zip(DB_COLUMNS, row))
+        string_id = data["string_id"]
+        file_cache.setdefault(data["file_name"].lower(), {})[string_id] = data
+        sheet_cache.setdefault(data["sheet_name"].lower(), {})[string_id] = data
+        translation_cache[string_id] = data
+        kr_text = data["kr"].strip()
+        if kr_text and kr_text not in kr_reverse_cache:
+            kr_reverse_cache[kr_text] = {**data}
+    return caches
+
+
+def build_record_caches(rows):
+    """새 방식: 필요한 컬럼만 담은 TranslationRecord를 모든 캐시가 공유"""
+    caches = ({}, {}, {}, {})
+    translation_cache, file_cache, sheet_cache, kr_reverse_cache = caches
+    columns = DB_COLUMNS[1:]
+    for row in rows:
+        data = TranslationRecord.from_row(row[1:], columns)
+        string_id = data["string_id"]
+        file_cache.setdefault(intern_text(data["file_name"].lower()), {})[string_id] = data
+        sheet_cache.setdefault(intern_text(data["sheet_name"].lower()), {})[string_id] = data
+        translation_cache[string_id] = data
+        kr_text = data["kr"].strip()
+        if kr_text and kr_text not in kr_reverse_cache:
+            kr_reverse_cache[kr_text] = data
+    return caches
+
+
+def measure(builder, row_count, file_count):
+    """캐시를 만든 뒤 남아 있는 메모리와 최대 메모리(바이트)를 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    caches = builder(generate_rows(row_count, file_count))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del caches
+    gc.collect()
+    return current, peak
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    file_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    print(f"측정 데이터: {row_count:,}행 / {file_count}개 파일")
+    dict_current, dict_peak = measure(build_dict_caches, row_count, file_count)
+    record_current, record_peak = measure(build_record_caches, row_count, file_count)
+
+    mb = 1024 * 1024
+    print(f"{'방식':<20}{'사용 (MB)':>12}{'최대 (MB)':>12}")
+    print(f"{'dict':<20}{dict_current / mb:>12.1f}{dict_peak / mb:>12.1f}")
+    print(f"{'TranslationRecord':<20}{record_current / mb:>12.1f}{record_peak / mb:>12.1f}")
+    print(f"절감: {(1 - record_current / dict_current) * 100:.1f}% "
+          f"({(dict_current - record_current) / mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# tests/test_xlsx_finalize.py
+"""xlsx 후처리(utils.xlsx_finalize) 왕복 테스트: 직접 수정 -> 후처리 -> openpyxl로 다시 열기"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from utils.xlsx_finalize import finalize_workbook
+from utils.xlsx_patch_writer import CellEdit, save_edits
+
+openpyxl = pytest.importorskip("openpyxl")
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _sheet_values(path, sheet_name="String"):
+    wb = openpyxl.load_workbook(path)
+    try:
+        return [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+def _write_minimal_xlsx(path, sheet_xml, sst_xml):
+    """openpyxl을 거치지 않은 최소 xlsx (시트/sst XML을 그대로 넣음)"""
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '</Types>'),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'),
+        "xl/workbook.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f'<sheets><sheet name="String" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+        "xl/_rels/workbook.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+            '</Relationships>'),
+        "xl/worksheets/sheet1.xml": sheet_xml,
+        "xl/sharedStrings.xml": sst_xml,
+    }
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+
+def test_patch_finalize_reload_round_trip(tmp_path):
+    path = str(tmp_path / "round_trip.xlsx")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "String"
+    ws.append(["STRING_ID", "KR", "CN"])
+    ws.append(["ID_1", "사과", None])
+    ws.append(["ID_2", "사과", None])
+    ws.append(["ID_3", "  공백 ", "old"])
+    wb.save(path)
+    wb.close()
+
+    save_edits(path, [
+        CellEdit("String", 2, 3, "苹果", "DAF2D0"),
+        CellEdit("String", 3, 3, "苹果"),
+        CellEdit("String", 4, 3, "  空白 "),
+    ])
+    expected = _sheet_values(path)
+
+    result = finalize_workbook(path)
+    assert result["status"] == "success"
+    assert result["strings_skipped"] is None
+    assert result["inline_converted"] >= 3
+    assert _sheet_values(path) == expected
+
+    with zipfile.ZipFile(path) as archive:
+        assert b"inlineStr" not in archive.read("xl/worksheets/sheet1.xml")
+        sst = archive.read("xl/sharedStrings.xml")
+    assert sst.count("苹果".encode("utf-8")) == 1
+
+    # 두 번째 실행은 바꿀 것이 없음
+    assert finalize_workbook(path)["rewritten_parts"] == 0
+    assert _sheet_values(path) == expected
+
+
+def test_prefixed_xml_keeps_shared_strings(tmp_path):
+    path = str(tmp_path / "prefixed.xlsx")
+    sheet_xml = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<x:worksheet xmlns:x="{_MAIN_NS}"><x:sheetData>'
+        f'<x:row r="1"><x:c r="A1" t="s"><x:v>0</x:v></x:c><x:c r="B1" t="s"><x:v>1</x:v></x:c></x:row>'
+        f'</x:sheetData></x:worksheet>')
+    sst_xml = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<x:sst xmlns:x="{_MAIN_NS}" count="2" uniqueCount="2">'
+        f'<x:si><x:t>STRING_ID</x:t></x:si><x:si><x:t>KR</x:t></x:si></x:sst>')
+    _write_minimal_xlsx(path, sheet_xml, sst_xml)
+    expected = _sheet_values(path)
+
+    result = finalize_workbook(path)
+    assert result["status"] == "success"
+    assert result["strings_skipped"]
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read("xl/sharedStrings.xml") == sst_xml.encode("utf-8")
+    assert _sheet_values(path) == expected == [["STRING_ID", "KR"]]
+
+
+def test_unresolved_shared_string_cell_keeps_table(tmp_path):
+    path = str(tmp_path / "unresolved.xlsx")
+    sheet_xml = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<worksheet xmlns="{_MAIN_NS}"><sheetData>'
+        f'<row r="1"><c r="A1" t="s"><v>1</v></c><c r="B1" t="s"><v> 0</v></c></row>'
+        f'</sheetData></worksheet>')
+    sst_xml = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<sst xmlns="{_MAIN_NS}" count="2" uniqueCount="2"><si><t>unused</t></si><si><t>KR</t></si></sst>')
+    _write_minimal_xlsx(path, sheet_xml, sst_xml)
+
+    result = finalize_workbook(path)
+    assert result["strings_skipped"]
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read("xl/sharedStrings.xml") == sst_xml.encode("utf-8")
+        assert archive.read("xl/worksheets/sheet1.xml") == sheet_xml.encode("utf-8")
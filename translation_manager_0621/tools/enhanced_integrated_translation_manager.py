@@ -5,11 +5,15 @@ import sqlite3
 import pandas as pd
 from collections import defaultdict
 from datetime import datetime
-from openpyxl import load_workbook
 import gc
 import threading
 import time
 import re
+from types import MappingProxyType
+from utils.cache_registry import get_cache_registry
+from utils.translation_cache import db_signature
+from utils.xlsx_stream_reader import open_workbook_for_read
+from utils.string_sheet_reader import is_string_sheet, open_string_sheet, read_header, LANGUAGE_ALIASES
 
 class EnhancedIntegratedTranslationManager:
     def __init__(self, parent_window=None):
@@ -41,49 +45,6 @@ class EnhancedIntegratedTranslationManager:
             return ""
         return str(value).lower().strip()
 
-    def find_string_id_position(self, worksheet):
-        """STRING_ID 컬럼 위치 찾기 (lower 적용)"""
-        for row in worksheet.iter_rows(min_row=1, max_row=6, max_col=5):
-            for cell in row:
-                if cell.value and isinstance(cell.value, str):
-                    # [개선] lower() 적용하여 대소문자 무관하게 검색
-                    if "string_id" in self.safe_lower(cell.value):
-                        return cell.column, cell.row
-        return None, None
-
-    def find_language_columns(self, worksheet, header_row, langs, language_mapping=None):
-        """언어 컬럼 매핑 찾기 (lower 적용)"""
-        if not header_row: 
-            return {}
-        
-        lang_cols = {}
-        extended_mapping = {}
-        
-        # [수정] 언어 매핑도 소문자로 처리
-        if language_mapping:
-            for alt, main in language_mapping.items():
-                extended_mapping[alt.upper()] = main.upper()
-        
-        # [수정] 언어 목록을 대문자로 변환
-        langs_upper = [lang.upper() for lang in langs]
-        
-        for row in worksheet.iter_rows(min_row=header_row, max_row=header_row):
-            for cell in row:
-                if not cell.value: 
-                    continue
-                    
-                # [개선] lower() 적용 후 비교
-                header_text = self.safe_strip(cell.value).upper()
-                
-                if header_text in langs_upper:
-                    lang_cols[header_text] = cell.column
-                elif header_text in extended_mapping:
-                    mapped_lang = extended_mapping[header_text]
-                    if mapped_lang in langs_upper:
-                        lang_cols[mapped_lang] = cell.column
-        
-        return lang_cols
-
     def detect_special_columns(self, worksheet, header_row):
         """[신규] 특수 컬럼 감지 (#으로 시작하는 컬럼들)"""
         special_cols = {}
@@ -158,7 +119,7 @@ class EnhancedIntegratedTranslationManager:
         [개선] 엑셀 파일들을 메모리로 로드하여 데이터와 중복 정보 반환
         special_column_filter = {"column_name": "#수정요청", "condition_value": "요청"}
         """
-        language_mapping = {"ZH": "CN"}
+        language_mapping = LANGUAGE_ALIASES
         unique_data = {}
         duplicate_data = defaultdict(list)
         special_filtered_data = {}  # [신규] 특수 컬럼 필터링된 데이터
@@ -174,34 +135,28 @@ class EnhancedIntegratedTranslationManager:
             
             try:
                 gc.collect()
-                workbook = load_workbook(file_path, read_only=True, data_only=True)
+                workbook = open_workbook_for_read(file_path)
                 
                 file_special_columns = {}  # 현재 파일의 특수 컬럼
                 
                 for sheet_name in workbook.sheetnames:
-                    if not sheet_name.lower().startswith("string") or sheet_name.startswith("#"):
+                    if not is_string_sheet(sheet_name):
                         continue
                     
                     worksheet = workbook[sheet_name]
-                    string_id_col, header_row = self.find_string_id_position(worksheet)
-                    if not string_id_col or not header_row:
-                        continue
-                    
-                    # [개선] 지원되는 언어만 사용
-                    lang_cols = self.find_language_columns(worksheet, header_row, self.supported_languages, language_mapping)
-                    if not lang_cols:
+                    header = read_header(worksheet)
+                    # [개선] 지원되는 언어만 사용 (헤더는 공용 리더에서 한 번만 탐지)
+                    if header is None or not header.language_columns(self.supported_languages, language_mapping):
                         continue
                     
                     # [신규] 특수 컬럼 감지
                     special_cols = {}
                     if special_column_filter and special_column_filter.get("column_name"):
                         target_column = special_column_filter["column_name"]
-                        special_cols = self.detect_special_columns_fast(worksheet, header_row, target_column)
+                        special_cols = self.detect_special_columns_fast(header, target_column)
                         
                         if special_cols:
-                            # 간단한 통계만 수집 (전체 스캔 생략)
                             col_name = list(special_cols.keys())[0]
-                            col_idx = special_cols[col_name]
                             
                             if col_name not in all_special_columns:
                                 all_special_columns[col_name] = {
@@ -211,42 +166,30 @@ class EnhancedIntegratedTranslationManager:
                                 }
                             
                             all_special_columns[col_name]['files'].append(f"{file_name}:{sheet_name}")
-                            # 대략적인 데이터 행 수만 계산
-                            data_row_count = max(0, worksheet.max_row - header_row)
-                            all_special_columns[col_name]['total_occurrences'] += data_row_count
                     
-                    for row_cells in worksheet.iter_rows(min_row=header_row + 1, values_only=True):
-                        if not row_cells or string_id_col - 1 >= len(row_cells):
-                            continue
-                        
-                        string_id = self.safe_strip(row_cells[string_id_col - 1]) if string_id_col - 1 < len(row_cells) else ""
+                    sheet = open_string_sheet(worksheet, self.supported_languages, list(special_cols),
+                                              aliases=language_mapping, header=header)
+                    
+                    sheet_row_count = 0
+                    for row in sheet.rows():
+                        string_id = self.safe_strip(row.string_id)
                         if not string_id:
                             continue
-                        
-                        # [개선] 상태 판단 시 TRIM 적용
-                        first_cell = self.safe_strip(row_cells[0]) if row_cells else ""
-                        status = '비활성' if first_cell.startswith('#') else 'active'
+                        sheet_row_count += 1
                         
                         # 데이터 구조 생성
                         data_dict = {
                             'string_id': string_id,
                             'file_name': file_name,
                             'sheet_name': sheet_name,
-                            'status': status,
+                            'status': row.status,
                             'update_date': current_time
                         }
                         
-                        # [개선] 언어 데이터 추가 시 TRIM 적용
-                        for lang, col in lang_cols.items():
-                            if col - 1 < len(row_cells):
-                                raw_value = row_cells[col - 1]
-                                data_dict[lang.lower()] = self.safe_strip(raw_value)
-                        
-                        # [신규] 특수 컬럼 데이터 추가
-                        for special_col_name, special_col_idx in special_cols.items():
-                            if special_col_idx - 1 < len(row_cells):
-                                special_value = row_cells[special_col_idx - 1]
-                                data_dict[special_col_name] = self.safe_strip(special_value)
+                        # [개선] 언어 데이터 및 특수 컬럼 데이터 추가 시 TRIM 적용
+                        for field, raw_value in zip(sheet.fields, row.values):
+                            key = field if field in special_cols else field.lower()
+                            data_dict[key] = self.safe_strip(raw_value)
                         
                         # 중복 검사 및 데이터 저장
                         if string_id not in unique_data and string_id not in duplicate_data:
@@ -258,6 +201,9 @@ class EnhancedIntegratedTranslationManager:
                         else:
                             # 이미 중복 리스트에 있으면 추가
                             duplicate_data[string_id].append(data_dict)
+                    
+                    for special_col_name in special_cols:
+                        all_special_columns[special_col_name]['total_occurrences'] += sheet_row_count
 
                 workbook.close()
                 processed_count += 1
@@ -297,22 +243,37 @@ class EnhancedIntegratedTranslationManager:
         }
 
     def load_db_data_to_memory(self, db_path):
-        """[개선] 기존 DB 파일을 메모리로 로드 (TRIM 적용)"""
+        """
+        [개선] 기존 DB 파일을 메모리로 로드 (TRIM 적용)
+        같은 DB를 불러온 다른 탭과 읽기 전용 스냅샷 하나를 함께 씁니다. (utils.cache_registry)
+        행 딕셔너리도 읽기 전용 매핑이므로 수정하려면 copy()로 복사해서 씁니다.
+        """
         if not os.path.exists(db_path):
             return {}
         
         try:
-            conn = sqlite3.connect(db_path)
+            db_data, _ = get_cache_registry().get(
+                db_path, tuple(db_signature(db_path)),
+                lambda: MappingProxyType(self._read_db_rows(db_path)),
+                filter_key=("integrated_master", "active"),
+            )
+            return db_data
+        except Exception as e:
+            print(f"DB 로드 중 오류: {e}")
+            return {}
+
+    def _read_db_rows(self, db_path):
+        """translation_data의 활성 행을 {STRING_ID: 읽기 전용 행 매핑}으로 읽습니다."""
+        conn = sqlite3.connect(db_path)
+        try:
             cursor = conn.cursor()
-            
             cursor.execute("SELECT * FROM translation_data WHERE status = 'active'")
-            rows = cursor.fetchall()
             
             # 컬럼 정보 가져오기
             column_names = [description[0] for description in cursor.description]
             
             db_data = {}
-            for row in rows:
+            for row in cursor:
                 row_dict = dict(zip(column_names, row))
                 string_id = self.safe_strip(row_dict.get('string_id'))
                 if string_id:
@@ -323,14 +284,10 @@ class EnhancedIntegratedTranslationManager:
                             cleaned_dict[key] = self.safe_strip(value)
                         else:
                             cleaned_dict[key] = value
-                    db_data[string_id] = cleaned_dict
-            
-            conn.close()
+                    db_data[string_id] = MappingProxyType(cleaned_dict)
             return db_data
-            
-        except Exception as e:
-            print(f"DB 로드 중 오류: {e}")
-            return {}
+        finally:
+            conn.close()
 
     def compare_data_in_memory(self, master_data, target_data, language_list, comparison_options):
         """[개선] 메모리 내 데이터 비교 (TRIM 적용)"""
@@ -586,7 +543,7 @@ class EnhancedIntegratedTranslationManager:
 
     def clear_data(self):
         """[개선] 메모리 데이터 초기화 (특수 컬럼 데이터 포함)"""
-        self.master_data.clear()
+        self.master_data = {}  # 공유 스냅샷일 수 있으므로 비우지 않고 참조만 해제
         self.target_data.clear()
         self.duplicate_data.clear()
         self.comparison_results.clear()
@@ -596,28 +553,16 @@ class EnhancedIntegratedTranslationManager:
         gc.collect()
 
     
-    def detect_special_columns_fast(self, worksheet, header_row, target_column_name=None):
-        """[최적화] 빠른 특수 컬럼 감지 (지정된 컬럼명만 검색)"""
+    def detect_special_columns_fast(self, header, target_column_name=None):
+        """[최적화] 빠른 특수 컬럼 감지 (이미 읽은 헤더에서 지정된 컬럼명만 검색)"""
         special_cols = {}
         
-        if not header_row or not target_column_name:
+        if not header or not target_column_name:
             return special_cols
         
-        target_clean = target_column_name.strip().lower()
-        
-        # 지정된 헤더 행에서만 검색
-        for row in worksheet.iter_rows(min_row=header_row, max_row=header_row):
-            for cell in row:
-                if not cell.value:
-                    continue
-                    
-                header_text = self.safe_strip(cell.value)
-                header_clean = header_text.strip().lower()
-                
-                # 지정된 컬럼명과 정확히 일치하는지 확인
-                if header_clean == target_clean:
-                    special_cols[header_text] = cell.column
-                    break  # 찾았으면 즉시 중단
+        col_idx = header.find(target_column_name)
+        if col_idx:
+            special_cols[header.labels[col_idx]] = col_idx
         
         return special_cols
     
@@ -684,34 +629,24 @@ class EnhancedIntegratedTranslationManager:
                 progress_callback(f"파일 로드: {file_name}", idx, len(file_list))
             
             try:
-                workbook = load_workbook(file_path, read_only=True, data_only=True)
+                workbook = open_workbook_for_read(file_path)
                 
                 for sheet_name in workbook.sheetnames:
-                    if not sheet_name.lower().startswith("string") or sheet_name.startswith("#"):
+                    if not is_string_sheet(sheet_name):
                         continue
                     
-                    worksheet = workbook[sheet_name]
-                    string_id_col, header_row = self.find_string_id_position(worksheet)
-                    if not string_id_col or not header_row:
-                        continue
-                    
-                    lang_cols = self.find_language_columns(worksheet, header_row, languages + ['KR'])
-                    if not lang_cols:
+                    sheet = open_string_sheet(workbook[sheet_name], languages + ['KR'])
+                    if sheet is None or not sheet.fields:
                         continue
+                    lang_keys = [lang.lower() for lang in sheet.fields]
                     
-                    for row_cells in worksheet.iter_rows(min_row=header_row + 1, values_only=True):
-                        if not row_cells or string_id_col - 1 >= len(row_cells):
-                            continue
-                        
-                        string_id = self.safe_strip(row_cells[string_id_col - 1]) if string_id_col - 1 < len(row_cells) else ""
+                    for row in sheet.rows():
+                        string_id = self.safe_strip(row.string_id)
                         if not string_id:
                             continue
                         
                         # 상태 판단
-                        first_cell = self.safe_strip(row_cells[0]) if row_cells else ""
-                        status = '비활성' if first_cell.startswith('#') else 'active'
-                        
-                        if status == '비활성':
+                        if row.status == '비활성':
                             continue  # 비활성 항목은 제외
                         
                         # 데이터 구조 생성
@@ -720,14 +655,12 @@ class EnhancedIntegratedTranslationManager:
                             'file_name': file_name,
                             'sheet_name': sheet_name,
                             'file_path': file_path,
-                            'status': status
+                            'status': row.status
                         }
                         
                         # 언어 데이터 추가
-                        for lang, col in lang_cols.items():
-                            if col - 1 < len(row_cells):
-                                raw_value = row_cells[col - 1]
-                                data_dict[lang.lower()] = self.safe_strip(raw_value)
+                        for key, raw_value in zip(lang_keys, row.values):
+                            data_dict[key] = self.safe_strip(raw_value)
                         
                         # 키 생성 (파일별로 고유한 키)
                         unique_key = f"{file_name}:{sheet_name}:{string_id}"
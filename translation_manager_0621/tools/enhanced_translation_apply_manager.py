@@ -1,7 +1,4 @@
 import os
-from datetime import datetime
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
 import pandas as pd
 import sqlite3
 import tkinter as tk
@@ -11,10 +8,32 @@ import xlwings as xw
 from collections import defaultdict
 import hashlib
 import json
+import marshal
+from utils.string_sheet_reader import is_string_sheet, open_string_sheet, read_header
+from utils.translation_record import TranslationRecord
+from utils.parallel_apply import iter_parallel_apply
+from utils.resolution_store import ResolutionStore
+from utils.translation_apply_engine import (
+    ApplyRules, REQUEST_COLUMN, plan_hash, plan_sheet_changes, write_file_changes
+)
+from utils.xlsx_stream_reader import open_workbook_for_read, sheet_fingerprints
+from ui.event_bus import get_event_bus
+
+# DB 캐시 형식 (바뀌면 기존 캐시를 전체 재구성)
+EXCEL_CACHE_FORMAT = "3"
+
+# STRING_ID별로 우선하는 행 (여러 시트에 있으면 뒤쪽 시트)
+_WINNING_ROWS_SQL = """winners AS (
+    SELECT source_sheet, string_id, kr, cn, tw, file_name, sheet_name, MAX(sheet_index) AS sheet_index
+    FROM translation_data GROUP BY string_id
+)"""
+
 
 class EnhancedTranslationApplyManager:
     def __init__(self, parent_window=None):
         self.parent_ui = parent_window
+        # [개선] 로그는 이벤트 버스로 모아 메인 루프에서 일정 주기로 반영
+        self.event_bus = get_event_bus(parent_window) if isinstance(parent_window, tk.Misc) else None
         
         # 기본 캐시
         self.translation_cache = {}
@@ -29,8 +48,9 @@ class EnhancedTranslationApplyManager:
         os.makedirs(self.db_dir, exist_ok=True)
         self.resolution_db_path = os.path.join(self.db_dir, "user_resolutions.db")
         self.user_resolutions = {} # 사용자가 해결한 내용을 담을 딕셔너리
-        self._init_resolution_db() # DB 파일 및 테이블 초기화
-        self.load_user_resolutions() # 기존 해결 내용 로드
+        self.resolution_store = None
+        self.cache_source = None  # [신규] 현재 캐시의 출처 지문 (적용 작업 저널의 작업 키에 사용)
+        self._init_resolution_db() # DB 파일 및 테이블 초기화 (해결 내용은 캐시 로드 시 현재 KR 목록만 조회)
         # -----------------------------------------
         
         # 지원 언어 제한
@@ -59,64 +79,46 @@ class EnhancedTranslationApplyManager:
             return default_columns
 
     def _init_resolution_db(self):
-        """[신규] 충돌 해결 내용을 저장할 DB를 초기화합니다."""
+        """[개선] 충돌 해결 저장소를 엽니다. (연결 하나를 WAL 모드로 유지, 저장은 모아서 기록)"""
         try:
-            conn = sqlite3.connect(self.resolution_db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS resolved_translations (
-                    kr_text TEXT PRIMARY KEY,
-                    cn_text TEXT,
-                    tw_text TEXT,
-                    resolved_at TEXT
-                )
-            ''')
-            conn.commit()
-            conn.close()
+            self.resolution_store = ResolutionStore(self.resolution_db_path)
         except Exception as e:
             self.log_message(f"❌ 사용자 해결 DB 초기화 오류: {e}")
 
-    def load_user_resolutions(self):
+    def load_user_resolutions(self, kr_texts=None):
+        """
+        [개선] 해결 내용을 메모리로 불러옵니다.
+
+        Args:
+            kr_texts: 불러올 KR 목록 (None이면 전체). 임시 테이블 조인 한 번으로 조회합니다.
+        """
         try:
-            conn = sqlite3.connect(self.resolution_db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT kr_text, cn_text, tw_text FROM resolved_translations")
-            rows = cursor.fetchall()
-            self.user_resolutions.clear() # 기존 내용을 비우고 새로 로드
-            for row in rows:
-                self.user_resolutions[row['kr_text']] = {'cn': row['cn_text'], 'tw': row['tw_text']}
-            conn.close()
+            self.user_resolutions = self.resolution_store.load(kr_texts)
             if self.user_resolutions:
                 self.log_message(f"✅ 기존에 해결한 번역 충돌 {len(self.user_resolutions)}건을 불러왔습니다.")
         except Exception as e:
             self.log_message(f"❌ 사용자 해결 내용 로드 오류: {e}")
 
     def _save_resolution_to_db(self, kr_text, selected_data):
+        """[개선] 해결 내용을 저장 대기열에 넣습니다. (flush_resolutions 또는 임계값 도달 시 일괄 기록)"""
         try:
-            conn = sqlite3.connect(self.resolution_db_path)
-            cursor = conn.cursor()
-            resolved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cursor.execute('''
-                INSERT OR REPLACE INTO resolved_translations (kr_text, cn_text, tw_text, resolved_at)
-                VALUES (?, ?, ?, ?)
-            ''', (kr_text, selected_data['cn'], selected_data['tw'], resolved_at))
-            conn.commit()
-            conn.close()
+            self.resolution_store.queue(kr_text, selected_data['cn'], selected_data['tw'])
+        except Exception as e:
+            self.log_message(f"❌ 해결 내용 DB 저장 오류: {e}")
+
+    def flush_resolutions(self):
+        """[신규] 대기 중인 해결 내용을 트랜잭션 하나로 기록합니다."""
+        try:
+            return self.resolution_store.flush()
         except Exception as e:
             self.log_message(f"❌ 해결 내용 DB 저장 오류: {e}")
+            return 0
 
     # --- [신규] 해결 DB 관리용 함수들 ---
     def get_all_resolutions(self):
         """DB에서 모든 해결 내역을 가져옵니다."""
         try:
-            conn = sqlite3.connect(self.resolution_db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT kr_text, cn_text, tw_text, resolved_at FROM resolved_translations ORDER BY resolved_at DESC")
-            rows = cursor.fetchall()
-            conn.close()
-            return [dict(row) for row in rows]
+            return self.resolution_store.all()
         except Exception as e:
             self.log_message(f"❌ 해결 내역 전체 조회 오류: {e}")
             return []
@@ -124,17 +126,9 @@ class EnhancedTranslationApplyManager:
     def update_resolution(self, kr_text, new_cn, new_tw):
         """DB의 특정 해결 내역을 수정합니다."""
         try:
-            conn = sqlite3.connect(self.resolution_db_path)
-            cursor = conn.cursor()
-            resolved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cursor.execute('''
-                UPDATE resolved_translations 
-                SET cn_text = ?, tw_text = ?, resolved_at = ?
-                WHERE kr_text = ?
-            ''', (new_cn, new_tw, resolved_at, kr_text))
-            conn.commit()
-            conn.close()
-            self.load_user_resolutions() # 메모리에도 변경사항 반영
+            self.resolution_store.update(kr_text, new_cn, new_tw)
+            if kr_text in self.user_resolutions:
+                self.user_resolutions[kr_text] = {'cn': new_cn, 'tw': new_tw} # 메모리에도 변경사항 반영
             return True
         except Exception as e:
             self.log_message(f"❌ 해결 내역 수정 오류: {e}")
@@ -143,17 +137,13 @@ class EnhancedTranslationApplyManager:
     def delete_resolution(self, kr_text):
         """DB에서 특정 해결 내역을 삭제합니다."""
         try:
-            conn = sqlite3.connect(self.resolution_db_path)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM resolved_translations WHERE kr_text = ?", (kr_text,))
-            conn.commit()
-            conn.close()
-            self.load_user_resolutions() # 메모리에도 변경사항 반영
+            self.resolution_store.delete(kr_text)
+            self.user_resolutions.pop(kr_text, None) # 메모리에도 변경사항 반영
             return True
         except Exception as e:
             self.log_message(f"❌ 해결 내역 삭제 오류: {e}")
             return False
-                    
+
     def safe_strip(self, value):
         if value is None:
             return ""
@@ -165,10 +155,9 @@ class EnhancedTranslationApplyManager:
         return str(value).lower().strip()
 
     def log_message(self, message):
-        if self.parent_ui and hasattr(self.parent_ui, 'log_text'):
-            self.parent_ui.log_text.insert(tk.END, f"{message}\n")
-            self.parent_ui.log_text.see(tk.END)
-            self.parent_ui.update_idletasks()
+        """UI의 로그 텍스트 영역에 메시지를 기록합니다. (작업 스레드에서도 이벤트 버스로 안전하게 전달)"""
+        if self.event_bus and hasattr(self.parent_ui, 'log_text'):
+            self.event_bus.log(self.parent_ui.log_text, message)
         else:
             print(message)
 
@@ -182,91 +171,229 @@ class EnhancedTranslationApplyManager:
         try:
             excel_mod_time = os.path.getmtime(excel_path)
             conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM metadata WHERE key = 'source_mod_time'")
-            stored_mod_time = cursor.fetchone()
-            conn.close()
-            if stored_mod_time and float(stored_mod_time[0]) == excel_mod_time:
+            try:
+                metadata = dict(conn.execute(
+                    "SELECT key, value FROM metadata WHERE key IN ('source_mod_time', 'cache_format')"
+                ).fetchall())
+            finally:
+                conn.close()
+            if metadata.get('cache_format') != EXCEL_CACHE_FORMAT:
+                self.log_message("⚠️ 이전 형식의 DB 캐시입니다. DB 캐시를 재구성합니다.")
+                return False
+            if float(metadata.get('source_mod_time', -1)) == excel_mod_time:
                 self.log_message("✅ 유효한 DB 캐시를 발견했습니다.")
                 return True
-            else:
-                self.log_message("⚠️ 원본 파일이 변경되었습니다. DB 캐시를 재구성합니다.")
-                return False
+            self.log_message("⚠️ 원본 파일이 변경되었습니다. 변경된 시트만 DB 캐시에 반영합니다.")
+            return False
         except Exception as e:
             self.log_message(f"DB 캐시 유효성 검사 오류: {e}. 캐시를 재구성합니다.")
             return False
 
-    def _build_db_from_excel(self, excel_path, db_path, progress_callback=None):
+    def _create_excel_cache_schema(self, cursor):
+        """[개선] DB 캐시 테이블 생성 (시트 단위 갱신 + 특수 컬럼 정규화 테이블)"""
+        cursor.execute('DROP TABLE IF EXISTS metadata')
+        cursor.execute('DROP TABLE IF EXISTS translation_data')
+        cursor.execute('DROP TABLE IF EXISTS special_values')
+        cursor.execute('DROP TABLE IF EXISTS kr_index')
+        cursor.execute('DROP TABLE IF EXISTS kr_conflicts')
+        cursor.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)')
+        # source_sheet: 행을 읽은 실제 시트 (sheet_name은 데이터의 SheetName 컬럼일 수 있음)
+        # sheet_index: 같은 STRING_ID가 여러 시트에 있으면 뒤쪽 시트가 우선
+        cursor.execute('''
+            CREATE TABLE translation_data (
+                source_sheet TEXT NOT NULL, string_id TEXT NOT NULL, kr TEXT, cn TEXT, tw TEXT,
+                file_name TEXT, sheet_name TEXT, sheet_index INTEGER,
+                PRIMARY KEY (source_sheet, string_id)
+            )
+        ''')
+        cursor.execute('CREATE INDEX idx_translation_data_id ON translation_data (string_id, sheet_index)')
+        cursor.execute('''
+            CREATE TABLE special_values (
+                source_sheet TEXT NOT NULL, string_id TEXT NOT NULL, column_name TEXT NOT NULL,
+                value TEXT, value_lower TEXT,
+                PRIMARY KEY (source_sheet, string_id, column_name)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE INDEX idx_special_values_column ON special_values (column_name, value)')
+        # KR 역색인: 데이터 sheet_name별 (KR, CN, TW) 조합의 행 수와 대표 STRING_ID
+        cursor.execute('''
+            CREATE TABLE kr_index (
+                sheet_name TEXT, kr TEXT NOT NULL, cn TEXT, tw TEXT, row_count INTEGER, string_id TEXT,
+                PRIMARY KEY (sheet_name, kr, cn, tw)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE INDEX idx_kr_index_kr ON kr_index (kr)')
+        # 충돌 후보: 캐시 전체에서 (CN, TW) 조합이 둘 이상인 KR
+        cursor.execute('CREATE TABLE kr_conflicts (kr TEXT PRIMARY KEY) WITHOUT ROWID')
+        cursor.execute("INSERT INTO metadata (key, value) VALUES ('cache_format', ?)", (EXCEL_CACHE_FORMAT,))
+
+    def _refresh_kr_index(self, cursor):
+        """[신규] translation_data로 KR 역색인(kr_index)과 충돌 후보(kr_conflicts)를 다시 계산합니다."""
+        cursor.execute("DELETE FROM kr_index")
+        cursor.execute("DELETE FROM kr_conflicts")
+        cursor.execute(f'''
+            INSERT INTO kr_index (sheet_name, kr, cn, tw, row_count, string_id)
+            WITH {_WINNING_ROWS_SQL}
+            SELECT sheet_name, kr, cn, tw, COUNT(*), MIN(string_id) FROM winners
+            WHERE kr <> '' GROUP BY sheet_name, kr, cn, tw
+        ''')
+        cursor.execute('''
+            INSERT INTO kr_conflicts (kr)
+            SELECT kr FROM (SELECT DISTINCT kr, cn, tw FROM kr_index) GROUP BY kr HAVING COUNT(*) > 1
+        ''')
+
+    def _read_sheet_for_cache(self, ws, excel_path, sheet_name):
+        """
+        String 시트 하나를 DB 캐시 행으로 변환합니다.
+
+        Returns:
+            (translation_data 행 목록, special_values 행 목록) - 같은 STRING_ID는 시트 안에서 마지막 행 우선
+        """
+        header = read_header(ws)
+        if header is None:
+            return [], []
+        sheet = open_string_sheet(ws, extra_columns=header.labels.values(), header=header)
+        # 헤더별 저장 위치(특수 컬럼 / 일반 컬럼)는 시트당 한 번만 계산
+        field_targets = []
+        for header_text in sheet.fields:
+            normalized_header = header_text.lstrip('#').replace(' ', '')
+            if normalized_header in self.SPECIAL_COLUMN_NAMES:
+                field_targets.append((True, normalized_header))
+            else:
+                field_targets.append((False, self.safe_lower(header_text)))
+        default_file = os.path.basename(excel_path)
+        records = {}
+        specials = {}
+        for row in sheet.rows():
+            string_id = self.safe_strip(str(row.string_id))
+            if not string_id:
+                continue
+            data = {}
+            special_data = {}
+            for (is_special, key), raw_value in zip(field_targets, row.values):
+                value = self.safe_strip(raw_value)
+                if is_special:
+                    special_data[key] = value
+                else:
+                    data[key] = value
+            records[string_id] = (
+                data.get("kr", ""), data.get("cn", ""), data.get("tw", ""),
+                data.get("filename", data.get("file_name", default_file)),
+                data.get("sheetname", data.get("sheet_name", sheet_name)),
+            )
+            specials[string_id] = special_data
+        rows = [(string_id,) + values for string_id, values in records.items()]
+        special_rows = [
+            (string_id, column_name, value, value.lower())
+            for string_id, special_data in specials.items() for column_name, value in special_data.items()
+        ]
+        return rows, special_rows
+
+    def _build_db_from_excel(self, excel_path, db_path, progress_callback=None, force_rebuild=False):
+        """
+        [개선] 원본 엑셀로 DB 캐시를 갱신합니다. (변경된 시트만 다시 저장)
+
+        시트별 지문(시트 XML/sharedStrings CRC)과 내용 해시를 metadata에 보관하고,
+        지문이 같으면 시트를 읽지 않으며, 지문이 달라도 내용 해시가 같으면 다시 저장하지 않습니다.
+        """
+        wb = None
+        conn = None
         try:
             self.log_message(f"⚙️ DB 캐시 구축 시작: {os.path.basename(excel_path)}")
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
-            cursor.execute('DROP TABLE IF EXISTS metadata')
-            cursor.execute('DROP TABLE IF EXISTS translation_data')
-            cursor.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)')
-            cursor.execute('''
-                CREATE TABLE translation_data (
-                    string_id TEXT PRIMARY KEY, kr TEXT, cn TEXT, tw TEXT,
-                    file_name TEXT, sheet_name TEXT, special_columns TEXT 
-                )
-            ''')
-            wb = load_workbook(excel_path, read_only=True, data_only=True)
+            try:
+                cache_format = cursor.execute("SELECT value FROM metadata WHERE key = 'cache_format'").fetchone()
+            except sqlite3.Error:
+                cache_format = None
+            index_dirty = force_rebuild or not cache_format or cache_format[0] != EXCEL_CACHE_FORMAT
+            if index_dirty:
+                self._create_excel_cache_schema(cursor)
+
+            stored = {}
+            for key, value in cursor.execute("SELECT key, value FROM metadata WHERE key LIKE 'sheet:%'").fetchall():
+                index, fingerprint, digest = value.split('|', 2)
+                stored[key[len('sheet:'):]] = (int(index), fingerprint, digest)
+
+            try:
+                fingerprints = sheet_fingerprints(excel_path)
+            except Exception as e:
+                self.log_message(f"   시트 지문 계산 실패, 모든 시트를 확인합니다: {e}")
+                fingerprints = {}
+
+            wb = open_workbook_for_read(excel_path, use_cache=False)
             all_sheets = wb.sheetnames
+            string_sheets = [name for name in all_sheets if is_string_sheet(name)]
+            rebuilt, unchanged = [], 0
             for idx, sheet_name in enumerate(all_sheets):
                 if progress_callback:
                     progress_callback((idx / len(all_sheets)) * 100, f"시트 처리 중 ({idx+1}/{len(all_sheets)}): {sheet_name}")
-                if not sheet_name.lower().startswith("string") or sheet_name.startswith("#"):
-                    continue
-                ws = wb[sheet_name]
-                header_map = {}
-                header_row_idx = -1
-                for i, row in enumerate(ws.iter_rows(min_row=1, max_row=10, values_only=True)):
-                    cleaned_row = [self.safe_lower(str(cell)) for cell in row if cell is not None]
-                    if 'string_id' in cleaned_row:
-                        header_row_idx = i + 1
-                        for col_idx, header_val in enumerate(row, 1):
-                            if header_val:
-                                header_map[self.safe_strip(str(header_val))] = col_idx
-                        break
-                if 'string_id' not in [self.safe_lower(k) for k in header_map.keys()]:
+                if not is_string_sheet(sheet_name):
                     continue
-                string_id_col_key = [k for k in header_map if self.safe_lower(k) == 'string_id'][0]
-                string_id_col = header_map[string_id_col_key]
-                rows_to_insert = []
-                for row_data in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-                    if not row_data or len(row_data) < string_id_col or not row_data[string_id_col-1]:
-                        continue
-                    string_id = self.safe_strip(str(row_data[string_id_col-1]))
-                    if not string_id:
-                        continue
-                    data = {}
-                    special_data = {}
-                    for header, col in header_map.items():
-                        value = self.safe_strip(row_data[col-1]) if len(row_data) >= col else ""
-                        normalized_header = header.lstrip('#').replace(' ', '')
-                        if normalized_header in self.SPECIAL_COLUMN_NAMES:
-                            special_data[normalized_header] = value
-                        else:
-                            data[self.safe_lower(header)] = value
-                    special_columns_json = json.dumps(special_data, ensure_ascii=False)
-                    kr_val = data.get("kr", "")
-                    cn_val = data.get("cn", "")
-                    tw_val = data.get("tw", "")
-                    file_val = data.get("filename", data.get("file_name", os.path.basename(excel_path)))
-                    sheet_val = data.get("sheetname", data.get("sheet_name", sheet_name))
-                    rows_to_insert.append((string_id, kr_val, cn_val, tw_val, file_val, sheet_val, special_columns_json))
-                cursor.executemany('INSERT OR REPLACE INTO translation_data (string_id, kr, cn, tw, file_name, sheet_name, special_columns) VALUES (?, ?, ?, ?, ?, ?, ?)', rows_to_insert)
+                fingerprint = fingerprints.get(sheet_name, "")
+                previous = stored.get(sheet_name)
+                if previous and fingerprint and previous[1] == fingerprint:
+                    digest = previous[2]
+                    changed = False
+                else:
+                    rows, special_rows = self._read_sheet_for_cache(wb[sheet_name], excel_path, sheet_name)
+                    digest = hashlib.md5(marshal.dumps((rows, special_rows))).hexdigest()
+                    changed = not previous or previous[2] != digest
+                if changed:
+                    cursor.execute("DELETE FROM translation_data WHERE source_sheet = ?", (sheet_name,))
+                    cursor.execute("DELETE FROM special_values WHERE source_sheet = ?", (sheet_name,))
+                    cursor.executemany(
+                        'INSERT OR REPLACE INTO translation_data (source_sheet, string_id, kr, cn, tw, file_name, sheet_name, sheet_index) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        [(sheet_name,) + row + (idx,) for row in rows]
+                    )
+                    cursor.executemany(
+                        'INSERT OR REPLACE INTO special_values (source_sheet, string_id, column_name, value, value_lower) VALUES (?, ?, ?, ?, ?)',
+                        [(sheet_name,) + row for row in special_rows]
+                    )
+                    rebuilt.append(sheet_name)
+                else:
+                    unchanged += 1
+                    if previous[0] != idx:
+                        cursor.execute("UPDATE translation_data SET sheet_index = ? WHERE source_sheet = ?", (idx, sheet_name))
+                        index_dirty = True
+                cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                               (f"sheet:{sheet_name}", f"{idx}|{fingerprint}|{digest}"))
+
+            # 원본에서 사라진 시트 정리
+            for sheet_name in set(stored) - set(string_sheets):
+                cursor.execute("DELETE FROM translation_data WHERE source_sheet = ?", (sheet_name,))
+                cursor.execute("DELETE FROM special_values WHERE source_sheet = ?", (sheet_name,))
+                cursor.execute("DELETE FROM metadata WHERE key = ?", (f"sheet:{sheet_name}",))
+                rebuilt.append(sheet_name)
+
+            # 행이나 시트 우선순위가 바뀐 경우에만 KR 역색인/충돌 후보 재계산
+            if index_dirty or rebuilt:
+                self._refresh_kr_index(cursor)
+
             excel_mod_time = os.path.getmtime(excel_path)
-            cursor.execute("INSERT INTO metadata (key, value) VALUES (?, ?)", ('source_mod_time', str(excel_mod_time)))
+            cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", ('source_mod_time', str(excel_mod_time)))
             conn.commit()
-            conn.close()
-            self.log_message("✅ DB 캐시 구축 완료.")
-            return {"status": "success"}
+            self.log_message(f"✅ DB 캐시 구축 완료. (갱신 {len(rebuilt)}개 시트 / 변경 없음 {unchanged}개 시트)")
+            return {"status": "success", "rebuilt_sheets": rebuilt}
         except Exception as e:
             self.log_message(f"❌ DB 캐시 구축 중 오류 발생: {e}")
             import traceback
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
+        finally:
+            if wb is not None:
+                wb.close()
+            if conn is not None:
+                conn.close()
+
+    def _cached_sheet_names(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT sheet_name FROM translation_data ORDER BY sheet_name")
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            conn.close()
 
     def initiate_excel_caching(self, excel_path, force_rebuild=False, progress_callback=None):
         db_path = self._get_db_path(excel_path)
@@ -274,23 +401,13 @@ class EnhancedTranslationApplyManager:
             self.log_message("ℹ️ 사용자의 요청으로 DB 캐시를 강제 재구성합니다.")
         elif self._is_db_cache_valid(excel_path, db_path):
             try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                cursor.execute("SELECT DISTINCT sheet_name FROM translation_data ORDER BY sheet_name")
-                sheets = [row[0] for row in cursor.fetchall()]
-                conn.close()
-                return {"status": "success", "source_type": "DB_Cache", "sheets": sheets}
+                return {"status": "success", "source_type": "DB_Cache", "sheets": self._cached_sheet_names(db_path)}
             except Exception as e:
                 self.log_message(f"캐시된 시트 목록 로드 오류: {e}")
-        build_result = self._build_db_from_excel(excel_path, db_path, progress_callback)
+        build_result = self._build_db_from_excel(excel_path, db_path, progress_callback, force_rebuild=force_rebuild)
         if build_result["status"] == "success":
             try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                cursor.execute("SELECT DISTINCT sheet_name FROM translation_data ORDER BY sheet_name")
-                sheets = [row[0] for row in cursor.fetchall()]
-                conn.close()
-                return {"status": "success", "source_type": "DB_Cache", "sheets": sheets}
+                return {"status": "success", "source_type": "DB_Cache", "sheets": self._cached_sheet_names(db_path)}
             except Exception as e:
                 self.log_message(f"재구축 후 시트 목록 로드 오류: {e}")
                 return {"status": "error", "message": "DB 재구축 후 시트 목록을 가져오는 데 실패했습니다."}
@@ -307,64 +424,51 @@ class EnhancedTranslationApplyManager:
             self.translation_cache = {}
             self.kr_reverse_cache = {}
             self.kr_translation_conflicts = defaultdict(list)
+            self.cache_source = None
             
             conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            query = "SELECT * FROM translation_data"
+            # [개선] 특수 컬럼 필터는 special_values 테이블 조인으로 SQL에서 처리
+            record_columns = ("string_id", "kr", "cn", "tw", "file_name", "sheet_name")
+            source_sql = " FROM winners t"
             params = []
-            if sheet_names:
-                query += f" WHERE sheet_name IN ({','.join('?' for _ in sheet_names)})"
-                params.extend(sheet_names)
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            conn.close()
-
-            temp_translation_cache = {}
             normalized_filter_column = ""
             if special_column_filter:
                 raw_filter_column = special_column_filter.get('column_name', '')
                 normalized_filter_column = raw_filter_column.lstrip('#').replace(' ', '')
                 filter_value = special_column_filter.get('condition_value', '')
+                source_sql += (" JOIN special_values s ON s.source_sheet = t.source_sheet AND s.string_id = t.string_id"
+                               " AND s.column_name = ? AND instr(s.value_lower, ?) > 0")
+                params.extend([normalized_filter_column, self.safe_lower(filter_value)])
+            sheet_condition = ""
+            if sheet_names:
+                sheet_condition = f" WHERE sheet_name IN ({','.join('?' for _ in sheet_names)})"
+                source_sql += f" WHERE t.sheet_name IN ({','.join('?' for _ in sheet_names)})"
+                params.extend(sheet_names)
 
-            for row in rows:
-                data = dict(row)
-                if special_column_filter:
-                    special_columns = json.loads(data.get('special_columns', '{}'))
-                    if normalized_filter_column in special_columns:
-                        special_cell_value = special_columns[normalized_filter_column]
-                        if self.safe_lower(filter_value) in self.safe_lower(special_cell_value):
-                            temp_translation_cache[data["string_id"]] = data
-                    else:
-                        continue
-                else:
+            temp_translation_cache = {}
+            try:
+                cursor.execute(f"WITH {_WINNING_ROWS_SQL} SELECT {', '.join('t.' + col for col in record_columns)}{source_sql}", params)
+                for row in cursor:
+                    data = TranslationRecord.from_row(row, record_columns)
                     temp_translation_cache[data["string_id"]] = data
-            self.translation_cache = temp_translation_cache
-            
-            kr_candidates = defaultdict(lambda: defaultdict(list))
-            for string_id, data in self.translation_cache.items():
-                kr_text = self.safe_strip(data.get("kr", ""))
-                if not kr_text: continue
-                
-                # [수정] 사용자가 이미 해결한 내용이 있다면, 그것으로 데이터를 통일
-                if kr_text in self.user_resolutions:
-                    cn_text = self.user_resolutions[kr_text]['cn']
-                    tw_text = self.user_resolutions[kr_text]['tw']
-                else:
-                    cn_text = self.safe_strip(data.get("cn", ""))
-                    tw_text = self.safe_strip(data.get("tw", ""))
+                self.translation_cache = temp_translation_cache
 
-                translation_pair = (cn_text, tw_text)
-                kr_candidates[kr_text][translation_pair].append(data)
-
-            for kr_text, pairs in kr_candidates.items():
-                if len(pairs) == 1:
-                    self.kr_reverse_cache[kr_text] = list(pairs.values())[0][0]
+                # [개선] KR 역캐시/충돌은 미리 계산한 kr_index, kr_conflicts로 구성
+                # (특수 컬럼 필터가 있으면 같은 필터 조건의 행으로 집계)
+                if special_column_filter:
+                    kr_source = f"SELECT t.kr, t.cn, t.tw, 1 AS row_count, t.string_id{source_sql}"
+                    kr_params = params
                 else:
-                     for (cn, tw), data_list in pairs.items():
-                        self.kr_translation_conflicts[kr_text].append({
-                            "cn": cn, "tw": tw, "count": len(data_list), "data": data_list[0]
-                        })
+                    kr_source = f"SELECT kr, cn, tw, row_count, string_id FROM kr_index{sheet_condition}"
+                    kr_params = list(sheet_names or [])
+                self._load_kr_reverse_index(conn, kr_source, kr_params)
+            finally:
+                conn.close()
+            self.load_user_resolutions(list(self.kr_reverse_cache) + list(self.kr_translation_conflicts))
+            stat = os.stat(db_path)
+            self.cache_source = ["excel_db", os.path.abspath(excel_path), stat.st_size, stat.st_mtime_ns,
+                                 sorted(sheet_names or []), special_column_filter or {}]
 
             self.log_message(f"🔧 메모리 캐시 구성 완료:")
             self.log_message(f"  - 최종 로드된 STRING_ID: {len(self.translation_cache)}개")
@@ -385,6 +489,60 @@ class EnhancedTranslationApplyManager:
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
 
+    def _load_kr_reverse_index(self, conn, kr_source, params):
+        """
+        [신규] KR 역캐시와 번역 충돌 목록을 SQL로 구성합니다.
+
+        충돌 후보(kr_conflicts)가 아닌 KR은 (CN, TW) 조합이 하나뿐이므로 대표 STRING_ID만 조회하고,
+        후보 KR만 사용자 해결 내용(user_resolutions.db)을 조인해 조합별로 묶습니다.
+
+        Args:
+            conn: DB 캐시 연결
+            kr_source: (kr, cn, tw, row_count, string_id)를 반환하는 SELECT 문
+            params: kr_source 파라미터
+        """
+        self.flush_resolutions()
+        conn.execute("ATTACH DATABASE ? AS res", (self.resolution_db_path,))
+        try:
+            with_sql = f"WITH {_WINNING_ROWS_SQL}, source AS ({kr_source})"
+            for kr_text, string_id in conn.execute(
+                f"{with_sql} SELECT kr, MIN(string_id) FROM source"
+                " WHERE kr <> '' AND kr NOT IN (SELECT kr FROM kr_conflicts) GROUP BY kr", params
+            ):
+                self.kr_reverse_cache[kr_text] = self.translation_cache.get(string_id)
+
+            # 사용자가 이미 해결한 KR은 해결된 CN/TW로 통일한 뒤 조합 수를 계산
+            for kr_text, cn, tw, count, string_id, pair_count in conn.execute(f'''
+                {with_sql}, pairs AS (
+                    SELECT src.kr AS kr,
+                           CASE WHEN r.kr_text IS NULL THEN src.cn ELSE r.cn_text END AS cn,
+                           CASE WHEN r.kr_text IS NULL THEN src.tw ELSE r.tw_text END AS tw,
+                           SUM(src.row_count) AS row_count, MIN(src.string_id) AS string_id
+                    FROM source src LEFT JOIN res.resolved_translations r ON r.kr_text = src.kr
+                    WHERE src.kr IN (SELECT kr FROM kr_conflicts)
+                    GROUP BY 1, 2, 3
+                )
+                SELECT kr, cn, tw, row_count, string_id, COUNT(*) OVER (PARTITION BY kr) FROM pairs
+            ''', params):
+                data = self.translation_cache.get(string_id)
+                if pair_count == 1:
+                    self.kr_reverse_cache[kr_text] = data
+                else:
+                    self.kr_translation_conflicts[kr_text].append({
+                        "cn": cn, "tw": tw, "count": count, "data": data
+                    })
+        finally:
+            conn.execute("DETACH DATABASE res")
+
+    def cache_signature(self):
+        """
+        [신규] 현재 번역 캐시의 출처 지문 (캐시를 불러오지 않았으면 None)
+        캐시 DB/시트/필터에 더해 충돌 해결 내용도 포함하므로 충돌을 새로 해결하면 다른 작업으로 봅니다.
+        """
+        if self.cache_source is None:
+            return None
+        return self.cache_source + [sorted((kr_text, data['cn'], data['tw']) for kr_text, data in self.user_resolutions.items())]
+
     def get_translation_conflicts(self):
         return self.kr_translation_conflicts
         
@@ -397,8 +555,11 @@ class EnhancedTranslationApplyManager:
                 self.kr_reverse_cache[kr_text] = selected_data
                 resolved_count += 1
             
-            # 2. 영구 DB에 저장 (다음 세션용)
+            # 2. 영구 DB 저장 대기열에 추가 (다음 세션용)
+            self.user_resolutions[kr_text] = {'cn': selected_data['cn'], 'tw': selected_data['tw']}
             self._save_resolution_to_db(kr_text, selected_data)
+        # [개선] 대화상자에서 넘어온 해결 내용을 트랜잭션 하나로 기록
+        self.flush_resolutions()
 
         self.log_message(f"✅ 번역 충돌 해결: {resolved_count}개 항목이 업데이트 및 영구 저장되었습니다.")
         for kr_text in resolutions:
@@ -408,15 +569,14 @@ class EnhancedTranslationApplyManager:
     def apply_translation_with_filter_option(self, file_path, options):
         mode = options.get("mode", "id")
         selected_langs = options.get("selected_langs", [])
-        record_date = options.get("record_date", True)
         use_filtered_data = options.get("use_filtered_data", False)
+        dry_run = options.get("dry_run", False)
 
         kr_match_check = options.get("kr_match_check", True)
         kr_mismatch_delete = options.get("kr_mismatch_delete", False)
         kr_overwrite = options.get("kr_overwrite", False)
         kr_overwrite_on_kr_mode = options.get("kr_overwrite_on_kr_mode", False)
         allowed_statuses = options.get("allowed_statuses", [])
-        allowed_statuses_lower = [status.lower() for status in allowed_statuses] if allowed_statuses else []
 
         active_cache = self.translation_cache
         cache_type = "특수필터링" if use_filtered_data else "전체"
@@ -440,104 +600,33 @@ class EnhancedTranslationApplyManager:
 
         workbook = None
         try:
-            workbook = load_workbook(file_path)
-            string_sheets = [sheet for sheet in workbook.sheetnames if sheet.lower().startswith("string") and not sheet.startswith("#")]
+            # [개선] 1단계: 읽기 전용으로 읽어 변경 목록만 계산 (변경 없는 파일은 편집 모드로 열지 않음)
+            workbook = open_workbook_for_read(file_path)
+            string_sheets = [sheet for sheet in workbook.sheetnames if is_string_sheet(sheet)]
             if not string_sheets:
-                self.log_message(f"   ⚠️ String 시트 없음")
+                self.log_message(f"   ⚠️ String 시트 없음")
                 return {"status": "info", "message": "파일에 String 시트가 없습니다"}
 
-            file_modified = False
             results = defaultdict(int)
             overwritten_items = []
+            sheet_changes = {}
 
-            fill_green = PatternFill(start_color="DAF2D0", end_color="DAF2D0", fill_type="solid")
-            fill_orange = PatternFill(start_color="FFDDC1", end_color="FFDDC1", fill_type="solid")
-            fill_blue = PatternFill(start_color="D0E7FF", end_color="D0E7FF", fill_type="solid")
-
+            supported_langs = [lang for lang in selected_langs if lang in self.supported_languages]
+            rules = ApplyRules.from_options(options, supported_langs, filtered=use_filtered_data)
             for sheet_name in string_sheets:
-                worksheet = workbook[sheet_name]
-                string_id_col, header_row = self.find_string_id_position(worksheet)
-                if not string_id_col or not header_row:
-                    self.log_message(f"   ⚠️ {sheet_name}: STRING_ID 컬럼 없음")
+                sheet = open_string_sheet(workbook[sheet_name], supported_langs + ['KR'], [REQUEST_COLUMN])
+                if sheet is None:
+                    self.log_message(f"   ⚠️ {sheet_name}: STRING_ID 컬럼 없음")
                     continue
 
-                supported_langs = [lang for lang in selected_langs if lang in self.supported_languages]
-                lang_cols = self.find_language_columns(worksheet, header_row, supported_langs + ['KR'])
-                request_col_idx = self.find_target_columns(worksheet, header_row, ["#번역요청"]).get("#번역요청")
-                sheet_stats = defaultdict(int)
-                lang_apply_count = {lang: 0 for lang in supported_langs if lang != 'KR'}
-                
-                for row_idx in range(header_row + 1, worksheet.max_row + 1):
-                    if allowed_statuses_lower and request_col_idx:
-                        request_val = self.safe_lower(str(worksheet.cell(row=row_idx, column=request_col_idx).value or ''))
-                        if request_val not in allowed_statuses_lower:
-                            sheet_stats["conditional_skipped"] += 1
-                            continue
-
-                    trans_data = None
-                    key_value = ''
-                    if mode == 'id':
-                        key_value = self.safe_strip(str(worksheet.cell(row=row_idx, column=string_id_col).value or ''))
-                        if key_value: trans_data = active_cache.get(key_value)
-                    else: 
-                        if 'KR' in lang_cols:
-                            key_value = self.safe_strip(str(worksheet.cell(row=row_idx, column=lang_cols['KR']).value or ''))
-                            if key_value: trans_data = self.kr_reverse_cache.get(key_value)
-
-                    if not key_value or not trans_data: continue
-
-                    row_modified_this_iteration = False
-                    if mode == 'id' and kr_match_check:
-                        current_kr_val = self.safe_strip(str(worksheet.cell(row=row_idx, column=lang_cols['KR']).value or ''))
-                        cache_kr_val = self.safe_strip(str(trans_data.get('kr', '')))
-                        if current_kr_val != cache_kr_val:
-                            if kr_mismatch_delete:
-                                deleted_count = 0
-                                for lang, col_idx in lang_cols.items():
-                                    if lang != 'KR' and worksheet.cell(row=row_idx, column=col_idx).value:
-                                        worksheet.cell(row=row_idx, column=col_idx).value = ""
-                                        deleted_count += 1
-                                        row_modified_this_iteration = True
-                                if deleted_count > 0: sheet_stats["kr_mismatch_deleted"] += 1
-                            else:
-                                sheet_stats["kr_mismatch_skipped"] += 1
-                            continue 
-
-                    for lang in supported_langs:
-                        if lang == 'KR': continue
-                        lang_lower = lang.lower()
-                        col_idx = lang_cols.get(lang)
-                        if not col_idx: continue
-                        cell = worksheet.cell(row=row_idx, column=col_idx)
-                        current_val = self.safe_strip(str(cell.value or ''))
-                        cached_val = self.safe_strip(str(trans_data.get(lang_lower, '')))
-                        if cached_val and current_val != cached_val:
-                            should_overwrite = (mode == 'id' and kr_match_check and kr_overwrite) or \
-                                            (mode == 'kr' and kr_overwrite_on_kr_mode)
-                            if should_overwrite:
-                                original_text = cell.value
-                                cell.value = cached_val
-                                cell.fill = fill_orange
-                                sheet_stats["overwritten"] += 1
-                                lang_apply_count[lang] += 1
-                                row_modified_this_iteration = True
-                                overwritten_items.append({
-                                    "file_name": file_name, "sheet_name": sheet_name,
-                                    "string_id": trans_data.get('string_id', key_value),
-                                    "language": lang, "kr_text": trans_data.get('kr', ''),
-                                    "original_text": self.safe_strip(original_text),
-                                    "overwritten_text": cached_val
-                                })
-                            elif not current_val:
-                                cell.value = cached_val
-                                cell.fill = fill_blue if use_filtered_data else fill_green
-                                sheet_stats["updated"] += 1
-                                lang_apply_count[lang] += 1
-                                row_modified_this_iteration = True
-                    if row_modified_this_iteration:
-                        file_modified = True
-                        if record_date and request_col_idx:
-                            worksheet.cell(row=row_idx, column=request_col_idx).value = "특수필터적용" if use_filtered_data else "적용"
+                plan = plan_sheet_changes(sheet, rules, active_cache, self.kr_reverse_cache)
+                if plan:
+                    sheet_changes[sheet_name] = plan.changes
+                sheet_stats = plan.stats
+                lang_apply_count = plan.lang_counts
+                overwritten_items.extend(
+                    {"file_name": file_name, "sheet_name": sheet_name, **item} for item in plan.overwritten
+                )
 
                 if sheet_stats["updated"] > 0 or sheet_stats["overwritten"] > 0:
                     lang_details = [f"{lang}:{count}" for lang, count in lang_apply_count.items() if count > 0]
@@ -557,9 +646,16 @@ class EnhancedTranslationApplyManager:
                 for key, val in sheet_stats.items():
                     results[f"total_{key}"] += val
 
-            if file_modified:
-                self.log_message(f"   💾 변경사항 저장 중...")
-                workbook.save(file_path)
+            workbook.close()
+            workbook = None
+
+            # 2단계: 변경 목록이 있는 파일만 저장 (미리보기면 저장하지 않음)
+            if sheet_changes:
+                if dry_run:
+                    self.log_message(f"   🔍 미리보기: 셀 {sum(len(changes) for changes in sheet_changes.values()):,}개 변경 예정 (저장 안 함)")
+                else:
+                    self.log_message(f"   💾 변경사항 저장 중...")
+                    write_file_changes(file_path, sheet_changes)
                 summary_parts = []
                 if results["total_updated"] > 0: summary_parts.append(f"신규 {results['total_updated']}개")
                 if results["total_overwritten"] > 0: summary_parts.append(f"덮어씀 {results['total_overwritten']}개")
@@ -574,7 +670,9 @@ class EnhancedTranslationApplyManager:
                 else: self.log_message(f"   ⚠️ {file_name} 완료: 변경없음 (번역 데이터 없음)")
 
             final_results = {key: val for key, val in results.items()}
-            return {"status": "success", **final_results, "overwritten_items": overwritten_items}
+            return {"status": "success", **final_results, "overwritten_items": overwritten_items,
+                    "dry_run": dry_run, "planned_changes": {name: len(changes) for name, changes in sheet_changes.items()},
+                    "plan_hash": plan_hash(sheet_changes)}
         except Exception as e:
             self.log_message(f"   ❌ {file_name} 오류: {str(e)}")
             import traceback
@@ -584,46 +682,12 @@ class EnhancedTranslationApplyManager:
             if workbook:
                 workbook.close()
  
-    def find_string_id_position(self, worksheet):
-        for row in range(2, 6):
-            for col in range(1, min(10, worksheet.max_column + 1)):
-                cell_value = worksheet.cell(row=row, column=col).value
-                if cell_value and isinstance(cell_value, str):
-                    if "string_id" in self.safe_lower(cell_value):
-                        return col, row
-        for row in worksheet.iter_rows(min_row=1, max_row=1, max_col=5):
-            for cell in row:
-                if cell.value and isinstance(cell.value, str):
-                    if "string_id" in self.safe_lower(cell.value):
-                        return cell.column, cell.row
-        return None, None
-
-    def find_language_columns(self, worksheet, header_row, langs):
-        if not header_row: return {}
-        lang_cols = {}
-        langs_upper = [lang.upper() for lang in langs]
-        for row in worksheet.iter_rows(min_row=header_row, max_row=header_row):
-            for cell in row:
-                if not cell.value: continue
-                header_text = self.safe_strip(cell.value).upper()
-                if header_text in langs_upper:
-                    lang_cols[header_text] = cell.column
-        return lang_cols
-
-    def find_target_columns(self, worksheet, header_row, target_columns=None):
-        if not header_row: return {}
-        found_columns = {}
-        all_targets = ["#번역요청"]
-        if target_columns: all_targets.extend(target_columns)
-        all_targets = list(set(all_targets))
-        for cell in worksheet[header_row]:
-            if cell.value and isinstance(cell.value, str):
-                cell_value_clean = self.safe_strip(cell.value).lower()
-                for target in all_targets:
-                    if cell_value_clean == target.lower():
-                        found_columns[target] = cell.column
-                        break
-        return found_columns
+    def apply_translation_parallel(self, file_paths, options, max_workers=None):
+        """
+        [신규] 여러 파일에 apply_translation_with_filter_option을 프로세스 풀로 병렬 적용합니다.
+        현재 캐시(필터링/충돌 해결 반영)는 스냅샷 파일로 한 번만 넘기며, 완료된 순서대로 (파일 경로, 결과)를 돌려줍니다.
+        """
+        return iter_parallel_apply(self, "apply_translation_with_filter_option", file_paths, options, max_workers)
 
     def detect_special_column_in_excel(self, excel_path, target_column_name):
         db_path = self._get_db_path(excel_path)
@@ -635,21 +699,22 @@ class EnhancedTranslationApplyManager:
         try:
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
-            cursor.execute("SELECT special_columns, sheet_name FROM translation_data")
+            # [개선] 특수 컬럼 값은 special_values 테이블에서 바로 집계
+            cursor.execute(
+                f"WITH {_WINNING_ROWS_SQL} SELECT s.value, t.sheet_name, COUNT(*) FROM winners t"
+                " JOIN special_values s ON s.source_sheet = t.source_sheet AND s.string_id = t.string_id"
+                " WHERE s.column_name = ? AND s.value <> '' GROUP BY s.value, t.sheet_name",
+                (normalized_target_column,)
+            )
             rows = cursor.fetchall()
             conn.close()
             values_count = defaultdict(int)
             found_in_sheets = set()
             non_empty_rows = 0
-            for special_json, sheet_name in rows:
-                if not special_json: continue
-                special_data = json.loads(special_json)
-                if normalized_target_column in special_data:
-                    value = self.safe_strip(special_data[normalized_target_column])
-                    if value:
-                        values_count[value] += 1
-                        found_in_sheets.add(sheet_name)
-                        non_empty_rows += 1
+            for value, sheet_name, count in rows:
+                values_count[value] += count
+                found_in_sheets.add(sheet_name)
+                non_empty_rows += count
             if not values_count:
                 self.log_message(f"⚠️ 특수 컬럼 '{target_column_name}'에 대한 데이터를 찾을 수 없습니다.")
                 return {"status": "success", "detected_info": {}}
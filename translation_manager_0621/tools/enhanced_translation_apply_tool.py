@@ -14,6 +14,8 @@ from tkinter import font as tkfont
 try:
     from ui.common_components import ScrollableCheckList, LoadingPopup
     from tools.enhanced_translation_apply_manager import EnhancedTranslationApplyManager
+    from utils.apply_journal import ApplyJournal, make_job_key
+    from utils.translation_apply_engine import dry_run_report
 except ImportError:
     # 대체 경로 설정 (프로젝트 구조에 따라 다름)
     project_root = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +27,8 @@ except ImportError:
         sys.path.append(parent_root)
     from ui.common_components import ScrollableCheckList, LoadingPopup
     from tools.enhanced_translation_apply_manager import EnhancedTranslationApplyManager
+    from utils.apply_journal import ApplyJournal, make_job_key
+    from utils.translation_apply_engine import dry_run_report
 
 import openpyxl
 
@@ -226,6 +230,7 @@ class EnhancedTranslationApplyTool(tk.Frame):
         self.available_languages = ["KR", "CN", "TW"]
         self.apply_lang_vars = {}
         self.record_date_var = tk.BooleanVar(value=True)
+        self.dry_run_var = tk.BooleanVar(value=False)
         self.kr_match_check_var = tk.BooleanVar(value=True)
         self.kr_mismatch_delete_var = tk.BooleanVar(value=False)
         self.use_filtered_data_var = tk.BooleanVar(value=False)
@@ -357,6 +362,7 @@ class EnhancedTranslationApplyTool(tk.Frame):
         other_frame = ttk.Frame(options_frame)
         other_frame.pack(fill="x", padx=5, pady=2)
         ttk.Checkbutton(other_frame, text="번역 적용 표시", variable=self.record_date_var).pack(anchor="w", padx=5)
+        ttk.Checkbutton(other_frame, text="미리보기 (저장 안 함)", variable=self.dry_run_var).pack(anchor="w", padx=5)
 
         original_files_frame = ttk.LabelFrame(right_scrollable_frame, text="📁 번역을 적용할 원본 파일")
         original_files_frame.pack(fill="x", padx=5, pady=5)
@@ -700,21 +706,53 @@ class EnhancedTranslationApplyTool(tk.Frame):
             "record_date": self.record_date_var.get(), "kr_match_check": self.kr_match_check_var.get(),
             "kr_mismatch_delete": self.kr_mismatch_delete_var.get(), "kr_overwrite": self.kr_overwrite_var.get(),
             "kr_overwrite_on_kr_mode": self.kr_overwrite_on_kr_mode_var.get(),
-            "allowed_statuses": allowed_statuses, "use_filtered_data": use_filtered
+            "allowed_statuses": allowed_statuses, "dry_run": self.dry_run_var.get(), "use_filtered_data": use_filtered
         }
             
-        def apply_translations_thread():
+        def run_apply(journal, job_key):
             total_results = defaultdict(int)
             processed_count = 0
             error_count = 0
             modified_files = []
             total_overwritten_items = []
             start_time = time.time()
-            for idx, (file_name, file_path) in enumerate(files_to_process):
-                self.after(0, lambda i=idx, n=file_name: loading_popup.update_progress((i / len(files_to_process)) * 100, f"파일 처리 중 ({i+1}/{len(files_to_process)}): {n}"))
-                result = self.translation_apply_manager.apply_translation_with_filter_option(file_path, apply_options)
+            pending_files = files_to_process
+            if journal is not None:
+                done_paths = set(journal.resume(job_key, [file_path for _, file_path in files_to_process]).done)
+                pending_files = [item for item in files_to_process if item[1] not in done_paths]
+                if done_paths:
+                    self.after(0, lambda d=len(done_paths): self.log_text.insert(tk.END, f"⏭️ 이전 실행에서 완료된 파일 {d}개 건너뜀\n"))
+
+            def record_result(file_path, result):
+                """결과가 나올 때마다 저널에 바로 기록 (중간에 멈춰도 끝난 파일은 남음)"""
+                if journal is None: return
+                try:
+                    if result.get("status") == "error": journal.mark_failed(job_key, file_path, result.get("message", ""))
+                    else: journal.mark_done(job_key, file_path, result.get("plan_hash"))
+                except Exception as e:
+                    self.after(0, lambda msg=str(e): self.log_text.insert(tk.END, f"⚠️ 작업 저널 기록 실패: {msg}\n"))
+
+            results_by_path = {}
+            if len(pending_files) > 1:
+                # [신규] 여러 파일은 프로세스 풀에서 병렬 적용 (파일이 끝날 때마다 진행률 갱신)
+                file_names = {file_path: file_name for file_name, file_path in pending_files}
+                completed = self.translation_apply_manager.apply_translation_parallel(list(file_names), apply_options)
+                for done, (file_path, result) in enumerate(completed, 1):
+                    self.after(0, lambda i=done, n=file_names[file_path]: loading_popup.update_progress((i / len(pending_files)) * 100, f"파일 처리 완료 ({i}/{len(pending_files)}): {n}"))
+                    results_by_path[file_path] = result
+                    record_result(file_path, result)
+            else:
+                for idx, (file_name, file_path) in enumerate(pending_files):
+                    self.after(0, lambda i=idx, n=file_name: loading_popup.update_progress((i / len(pending_files)) * 100, f"파일 처리 중 ({i+1}/{len(pending_files)}): {n}"))
+                    results_by_path[file_path] = self.translation_apply_manager.apply_translation_with_filter_option(file_path, apply_options)
+                    record_result(file_path, results_by_path[file_path])
+            # 결과는 파일 목록 순서대로 합산
+            planned_files = []
+            for file_name, file_path in pending_files:
+                result = results_by_path[file_path]
                 if result["status"] == "success":
                     processed_count += 1
+                    planned_files.append((file_name, result.get("planned_changes", {})))
                     for key, value in result.items():
                         if key.startswith("total_"): total_results[key] += value
                     if result.get("total_updated", 0) > 0 or result.get("total_overwritten", 0) > 0:
@@ -724,17 +762,40 @@ class EnhancedTranslationApplyTool(tk.Frame):
             elapsed_time = time.time() - start_time
             self.after(0, lambda: self.process_translation_apply_result(
                 total_results, processed_count, error_count, loading_popup, 
-                elapsed_time, use_filtered, modified_files, total_overwritten_items)
+                elapsed_time, use_filtered, modified_files, total_overwritten_items,
+                apply_options["dry_run"], planned_files)
             )
+        def apply_translations_thread():
+            # [신규] 적용 작업 저널: 같은 옵션/캐시로 다시 실행하면 완료된 파일은 건너뛰고 남은 파일부터 처리
+            # 파일 처리 중 오류가 나도 저널 연결은 항상 닫음
+            journal, job_key = self._open_apply_journal(apply_options)
+            try: run_apply(journal, job_key)
+            finally:
+                if journal is not None: journal.close()
         threading.Thread(target=apply_translations_thread, daemon=True).start()
 
+    def _open_apply_journal(self, apply_options):
+        """[신규] 적용 작업 저널과 작업 키를 엽니다. (미리보기이거나 캐시 출처를 모르면 (None, None))"""
+        cache_signature = self.translation_apply_manager.cache_signature()
+        if apply_options.get("dry_run") or cache_signature is None:
+            return None, None
+        try:
+            return ApplyJournal(), make_job_key(apply_options, cache_signature)
+        except Exception as e:
+            self.after(0, lambda msg=str(e): self.log_text.insert(tk.END, f"⚠️ 작업 저널을 열 수 없어 이어하기 없이 진행합니다: {msg}\n"))
+            return None, None
+
     def process_translation_apply_result(self, total_results, processed_count, error_count, loading_popup, 
                                         elapsed_time, use_filtered,
-                                        modified_files, total_overwritten_items):
+                                        modified_files, total_overwritten_items, dry_run=False, planned_files=()):
         loading_popup.close()
         minutes, seconds = divmod(int(elapsed_time), 60)
         time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
 
+        if dry_run:
+            self.show_dry_run_report(planned_files, processed_count, error_count, time_str)
+            return
+
         self.log_text.insert(tk.END, "\n" + "="*60 + "\n🎉 번역 적용 작업 완료\n" + "="*60 + "\n")
         self.log_text.insert(tk.END, f"⏱️ 소요 시간: {time_str}, 성공: {processed_count}개, 실패: {error_count}개\n")
         if modified_files:
@@ -756,6 +817,25 @@ class EnhancedTranslationApplyTool(tk.Frame):
             self.view_overwritten_button.config(state="disabled")
         messagebox.showinfo("완료", f"작업 완료!\n\n총 적용: {total_applied:,}개\n소요 시간: {time_str}", parent=self)
 
+    def show_dry_run_report(self, planned_files, processed_count, error_count, time_str):
+        """[신규] 미리보기 결과를 파일/시트별 변경 예정 보고서로 표시합니다. (파일은 저장하지 않음)"""
+        summary, lines = dry_run_report(planned_files)
+        self.log_text.insert(tk.END, "\n" + "="*60 + "\n🔍 번역 적용 미리보기 보고서\n" + "="*60 + "\n")
+        self.log_text.insert(tk.END, f"⏱️ 소요 시간: {time_str}, 분석: {processed_count}개, 실패: {error_count}개\n")
+        self.log_text.insert(tk.END, f"🔍 {summary}\n")
+        for line in lines: self.log_text.insert(tk.END, f"  {line}\n")
+        self.log_text.insert(tk.END, "="*60 + "\n")
+        self.log_text.see(tk.END)
+
+        # 미리보기에서는 실제로 덮어쓴 항목이 없음
+        self.overwritten_data = []
+        self.view_overwritten_button.config(state="disabled")
+        self.status_label_apply.config(text=summary)
+        report_msg = f"{summary}\n\n소요 시간: {time_str}"
+        if lines:
+            report_msg += "\n\n" + "\n".join(lines[:15]) + ("\n... (전체 목록은 로그 참고)" if len(lines) > 15 else "")
+        messagebox.showinfo("미리보기 보고서", report_msg, parent=self)
+
     def select_translation_db_file(self, *args):
         file_path = filedialog.askopenfilename(filetypes=[("DB 파일", "*.db"), ("모든 파일", "*.*")], title="번역 DB 선택", parent=self)
         if file_path:
@@ -10,6 +10,7 @@ from openpyxl import load_workbook
 import gc
 import threading
 import time
+from utils.string_sheet_reader import read_header
 
 class IntegratedTranslationManager:
     def __init__(self, parent_window=None):
@@ -20,39 +21,20 @@ class IntegratedTranslationManager:
         self.comparison_results = []  # 비교 결과
         
     def find_string_id_position(self, worksheet):
-        """STRING_ID 컬럼 위치 찾기"""
-        for row in worksheet.iter_rows(min_row=1, max_row=6, max_col=5):
-            for cell in row:
-                if isinstance(cell.value, str) and "STRING_ID" in cell.value.upper():
-                    return cell.column, cell.row
-        return None, None
+        """STRING_ID 컬럼 위치 찾기 ([개선] 공용 헤더 규칙 read_header 사용)"""
+        header = read_header(worksheet)
+        if header is None:
+            return None, None
+        return header.string_id_col, header.row
 
     def find_language_columns(self, worksheet, header_row, langs, language_mapping=None):
-        """언어 컬럼 매핑 찾기"""
+        """언어 컬럼 매핑 찾기 ([개선] 공용 헤더 규칙 SheetHeader.language_columns 사용)"""
         if not header_row: 
             return {}
-        
-        lang_cols = {}
-        extended_mapping = {}
-        
-        if language_mapping:
-            for alt, main in language_mapping.items():
-                extended_mapping[alt.upper()] = main
-        
-        for row in worksheet.iter_rows(min_row=header_row, max_row=header_row):
-            for cell in row:
-                if not cell.value: 
-                    continue
-                header_text = str(cell.value).strip().upper()
-                
-                if header_text in langs:
-                    lang_cols[header_text] = cell.column
-                elif header_text in extended_mapping:
-                    mapped_lang = extended_mapping[header_text]
-                    if mapped_lang in langs:
-                        lang_cols[mapped_lang] = cell.column
-        
-        return lang_cols
+        header = read_header(worksheet)
+        if header is None or header.row != header_row:
+            return {}
+        return header.language_columns(langs, language_mapping or {})
 
     def load_excel_data_to_memory(self, excel_files, language_list, progress_callback=None):
         """엑셀 파일들을 메모리로 로드하여 데이터와 중복 정보 반환"""
@@ -3,8 +3,10 @@
 import os
 import sqlite3
 import pandas as pd
-from openpyxl import load_workbook, Workbook
+from openpyxl import Workbook
 from ui.common_components import LoadingPopup, show_message
+from utils.xlsx_stream_reader import open_workbook_for_read
+from utils.string_sheet_reader import is_string_sheet, open_string_sheet
 
 class RequestExtractionManager:
     def __init__(self, parent_app):
@@ -41,36 +43,29 @@ class RequestExtractionManager:
 
                 wb = None # finally를 위해 wb 초기화
                 try:
-                    wb = load_workbook(file_path, read_only=True, data_only=True)
+                    wb = open_workbook_for_read(file_path)
+                    conditions_lower = {c.lower() for c in conditions}
                     for sheet_name in wb.sheetnames:
-                        if not sheet_name.lower().startswith("string"): continue
-                        ws = wb[sheet_name]
-                        headers, header_row_idx = self.parent_app._find_headers_in_worksheet(ws)
-
-                        if not headers or "#번역요청" not in headers.values():
+                        if not is_string_sheet(sheet_name): continue
+                        sheet = open_string_sheet(wb[sheet_name], ["KR", "CN", "TW"], ["#번역요청"])
+                        if sheet is None or not sheet.has("#번역요청"):
                             continue
 
-                        req_col_idx = list(headers.keys())[list(headers.values()).index("#번역요청")]
-
-                        for row_idx, row in enumerate(ws.iter_rows(min_row=header_row_idx + 1, values_only=True), start=header_row_idx + 1):
-                            if not row or len(row) < req_col_idx: continue
-                            request_type = row[req_col_idx - 1]
+                        for row in sheet.rows(require_string_id=False):
+                            request_type = sheet.value(row, "#번역요청")
 
-                            if request_type and str(request_type).lower() in [c.lower() for c in conditions]:
-                                string_id_idx = list(headers.keys())[list(headers.values()).index("STRING_ID")] if "STRING_ID" in headers.values() else None
-                                string_id = row[string_id_idx - 1] if string_id_idx and len(row) >= string_id_idx else ""
-                                kr = row[list(headers.keys())[list(headers.values()).index("KR")] - 1] if "KR" in headers.values() and len(row) >= list(headers.keys())[list(headers.values()).index("KR")] else ""
-
-                                cn, tw = "", ""
-                                if "CN" in headers.values() and len(row) >= list(headers.keys())[list(headers.values()).index("CN")]: cn = row[list(headers.keys())[list(headers.values()).index("CN")]-1]
-                                if "TW" in headers.values() and len(row) >= list(headers.keys())[list(headers.values()).index("TW")]: tw = row[list(headers.keys())[list(headers.values()).index("TW")]-1]
+                            if request_type and str(request_type).lower() in conditions_lower:
+                                string_id = row.string_id if row.string_id is not None else ""
+                                kr = sheet.value(row, "KR", "")
+                                cn = sheet.value(row, "CN", "")
+                                tw = sheet.value(row, "TW", "")
 
                                 extracted_data.append((file_name, sheet_name, string_id, kr, cn, tw, request_type, ""))
 
                                 if mark_as_transferred:
                                     if file_path not in files_to_update: files_to_update[file_path] = {}
                                     if sheet_name not in files_to_update[file_path]: files_to_update[file_path][sheet_name] = []
-                                    files_to_update[file_path][sheet_name].append(row_idx)
+                                    files_to_update[file_path][sheet_name].append(row.row)
                 finally:
                     if wb:
                         wb.close()
@@ -134,31 +129,23 @@ class RequestExtractionManager:
 
                 wb = None
                 try:
-                    wb = load_workbook(file_path, read_only=True, data_only=True)
+                    wb = open_workbook_for_read(file_path)
                     for sheet_name in wb.sheetnames:
-                        if not sheet_name.lower().startswith("string"): continue
-
-                        ws = wb[sheet_name]
-                        headers, header_row_idx = self.parent_app._find_headers_in_worksheet(ws)
-                        if not headers or "STRING_ID" not in headers.values(): continue
+                        if not is_string_sheet(sheet_name): continue
 
-                        string_id_col = list(headers.keys())[list(headers.values()).index("STRING_ID")]
-                        kr_col = list(headers.keys())[list(headers.values()).index("KR")] if "KR" in headers.values() else None
-                        req_col_idx = list(headers.keys())[list(headers.values()).index("#번역요청")] if "#번역요청" in headers.values() else None
-
-                        for row in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-                            if not row or len(row) < string_id_col: continue
+                        sheet = open_string_sheet(wb[sheet_name], ["KR", "CN", "TW"], ["#번역요청"])
+                        if sheet is None: continue
+                        if apply_by_request_col and not sheet.has("#번역요청"): continue
 
+                        for row in sheet.rows():
                             if apply_by_request_col:
-                                if not req_col_idx or len(row) < req_col_idx: continue
-                                request_val = str(row[req_col_idx - 1] or '').strip().lower()
+                                request_val = str(sheet.value(row, "#번역요청") or '').strip().lower()
                                 if request_val not in ['신규', 'change']: continue
 
-                            string_id = row[string_id_col - 1]
-                            if not string_id: continue
-
+                            string_id = row.string_id
                             string_id_str = str(string_id)
-                            source_kr = str(row[kr_col - 1]) if kr_col and len(row) >= kr_col and row[kr_col - 1] is not None else ""
+                            kr_val = sheet.value(row, "KR")
+                            source_kr = str(kr_val) if kr_val is not None else ""
 
                             request_type = None
                             if string_id_str not in comparison_cache:
@@ -167,9 +154,8 @@ class RequestExtractionManager:
                                 if source_kr != comparison_cache[string_id_str].get('kr', ""): request_type = "변경"
 
                             if request_type:
-                                cn, tw = "", ""
-                                if "CN" in headers.values() and len(row) >= list(headers.keys())[list(headers.values()).index("CN")]: cn = row[list(headers.keys())[list(headers.values()).index("CN")]-1]
-                                if "TW" in headers.values() and len(row) >= list(headers.keys())[list(headers.values()).index("TW")]: tw = row[list(headers.keys())[list(headers.values()).index("TW")]-1]
+                                cn = sheet.value(row, "CN", "")
+                                tw = sheet.value(row, "TW", "")
                                 extracted_data.append((file_name, sheet_name, string_id, source_kr, cn, tw, request_type, ""))
                 finally:
                     if wb:
@@ -211,20 +197,14 @@ class RequestExtractionManager:
             self.log(f"비교 데이터 로딩(Excel): {os.path.basename(excel_path)} - {sheet_name}")
             wb = None
             try:
-                wb = load_workbook(excel_path, read_only=True, data_only=True)
-                ws = wb[sheet_name]
-                headers, header_row_idx = self.parent_app._find_headers_in_worksheet(ws)
-                if not headers or "STRING_ID" not in headers.values():
+                wb = open_workbook_for_read(excel_path)
+                sheet = open_string_sheet(wb[sheet_name], ["KR"])
+                if sheet is None:
                     raise ValueError("비교 엑셀에서 STRING_ID 컬럼을 찾을 수 없습니다.")
 
-                string_id_col = list(headers.keys())[list(headers.values()).index("STRING_ID")]
-                kr_col = list(headers.keys())[list(headers.values()).index("KR")] if "KR" in headers.values() else None
-
-                for row in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-                    string_id = row[string_id_col - 1]
-                    if string_id:
-                        kr_val = row[kr_col - 1] if kr_col and len(row) >= kr_col else ""
-                        cache[str(string_id)] = {'kr': str(kr_val) if kr_val is not None else ""}
+                for row in sheet.rows():
+                    kr_val = sheet.value(row, "KR", "")
+                    cache[str(row.string_id)] = {'kr': str(kr_val) if kr_val is not None else ""}
             finally:
                 if wb:
                     wb.close()
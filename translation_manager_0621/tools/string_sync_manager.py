@@ -6,17 +6,19 @@ import threading
 import sqlite3
 import time
 from tkinter import filedialog, messagebox, ttk
-from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
 import pandas as pd
 
 from ui.common_components import ScrollableCheckList, LoadingPopup
 from tools.db_compare_manager import DBCompareManager
+from utils.xlsx_patch_writer import open_workbook_for_update
+from ui.event_bus import get_event_bus
 
 class StringSyncManager(tk.Frame):
     def __init__(self, parent, root):
         super().__init__(parent)
         self.root = root
+        self.event_bus = get_event_bus(self)
         self.db_compare_manager = DBCompareManager(root)
         self.compare_results = []
         self.db_pairs = []
@@ -484,10 +486,8 @@ class StringSyncManager(tk.Frame):
 
 
     def log_message(self, message):
-        """로그 메시지 추가"""
-        self.log_text.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """로그 메시지 추가 (작업 스레드에서도 이벤트 버스로 안전하게 전달)"""
+        self.event_bus.log(self.log_text, f"{time.strftime('%H:%M:%S')} - {message}")
 
 
     def apply_filter(self, event=None):
@@ -1038,7 +1038,8 @@ class StringSyncManager(tk.Frame):
     def _process_excel_file(self, excel_path, items, action_type):
         """엑셀 파일 처리"""
         try:
-            workbook = load_workbook(excel_path)
+            # [개선] xlsx/xlsm 은 바뀐 셀만 시트 XML에서 직접 수정 (직접 수정할 수 없으면 openpyxl로 저장)
+            workbook = open_workbook_for_update(excel_path)
             processed_count = 0
             
             # 시트별로 그룹화
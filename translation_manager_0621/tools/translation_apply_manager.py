@@ -1,33 +1,59 @@
 import os
 import time
 from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
 import pandas as pd
 import sqlite3
 import tkinter as tk
 import signal
 import win32com.client as pythoncom
 import xlwings as xw
+from utils.translation_record import TranslationRecord, intern_text
+from utils.translation_cache import db_signature, load_translation_cache as load_cached_translations
+from utils.translation_snapshot import TranslationSnapshot
+from utils.parallel_apply import iter_parallel_apply
+from utils.string_sheet_reader import StringSheet, open_string_sheet, read_header
+from utils.translation_apply_engine import (
+    ApplyRules, REQUEST_COLUMN, plan_hash, plan_sheet_changes, write_file_changes
+)
+from utils.xlsx_stream_reader import open_workbook_for_read
+from utils.xlsx_finalize import finalize_workbooks
+from utils.external_link_scanner import scan_external_links
+from ui.event_bus import get_event_bus
 
 class TranslationApplyManager:
+    # 엑셀 캐시에서 읽을 언어 / 파일명·시트명 컬럼
+    EXCEL_CACHE_LANGUAGES = ("KR", "EN", "CN", "TW", "TH")
+    EXCEL_CACHE_NAME_COLUMNS = ("FILENAME", "FILE_NAME", "SHEETNAME", "SHEET_NAME")
+
     def __init__(self, parent_window=None):
         self.parent_ui = parent_window
+        # [개선] 로그는 이벤트 버스로 모아 메인 루프에서 일정 주기로 반영
+        self.event_bus = get_event_bus(parent_window) if isinstance(parent_window, tk.Misc) else None
         self.translation_cache = {}
         self.translation_file_cache = {}
         self.translation_sheet_cache = {}
         self.duplicate_ids = {}
         self.kr_reverse_cache = {}
+        self.snapshot = None
+        self.cache_source = None  # [신규] 현재 캐시의 출처 지문 (적용 작업 저널의 작업 키에 사용)
         
     def log_message(self, message):
-        """UI의 로그 텍스트 영역에 메시지를 기록합니다."""
-        if self.parent_ui and hasattr(self.parent_ui, 'log_text'):
-            self.parent_ui.log_text.insert(tk.END, f"{message}\n")
-            self.parent_ui.log_text.see(tk.END)
-            self.parent_ui.update_idletasks()
+        """UI의 로그 텍스트 영역에 메시지를 기록합니다. (작업 스레드에서도 이벤트 버스로 안전하게 전달)"""
+        if self.event_bus and hasattr(self.parent_ui, 'log_text'):
+            self.event_bus.log(self.parent_ui.log_text, message)
         else:
             print(message)
 
 
+    @staticmethod
+    def _file_signature(file_path):
+        stat = os.stat(file_path)
+        return [os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns]
+
+    def cache_signature(self):
+        """[신규] 현재 번역 캐시의 출처 지문 (캐시를 불러오지 않았으면 None)"""
+        return self.cache_source
+
     def load_translation_cache_from_excel(self, file_path, sheet_names):
         """[수정] openpyxl로 여러 시트에서 번역 데이터를 읽어 캐시를 생성합니다."""
         try:
@@ -39,6 +65,7 @@ class TranslationApplyManager:
             self.translation_sheet_cache = {}
             self.duplicate_ids = {}
             self.kr_reverse_cache = {}
+            self.cache_source = None
 
             wb = load_workbook(file_path, read_only=True, data_only=True)
             
@@ -51,50 +78,38 @@ class TranslationApplyManager:
                 self.log_message(f"  - 시트 처리 중: {sheet_name}")
                 ws = wb[sheet_name]
 
-                header_map = {}
-                header_row_idx = -1
-                for i, row in enumerate(ws.iter_rows(min_row=1, max_row=10, values_only=True)):
-                    cleaned_row = [str(cell).lower().strip() for cell in row if cell is not None]
-                    if 'string_id' in cleaned_row:
-                        header_row_idx = i + 1
-                        for col_idx, header_val in enumerate(row, 1):
-                            if header_val:
-                                header_map[str(header_val).lower().strip()] = col_idx - 1
-                        break
-                
-                if 'string_id' not in header_map:
+                # [개선] 공용 헤더 규칙(read_header)과 행 스트리밍(StringSheet.rows) 사용
+                sheet = open_string_sheet(ws, self.EXCEL_CACHE_LANGUAGES, self.EXCEL_CACHE_NAME_COLUMNS)
+                if sheet is None:
                     self.log_message(f"⚠️ 경고: '{sheet_name}' 시트에서 헤더를 찾을 수 없어 건너뜁니다.")
                     continue
 
-                string_id_index = header_map.get('string_id')
-                for row in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-                    if not row or len(row) <= string_id_index or not row[string_id_index]:
+                for row in sheet.rows():
+                    string_id = str(row.string_id).strip()
+                    if not string_id:
                         continue
-                    string_id = str(row[string_id_index]).strip()
-
-                    def get_safe_value(key):
-                        index = header_map.get(key)
-                        if index is not None and index < len(row):
-                            return str(row[index] or '')
-                        return ''
-
-                    data = {
-                        "kr": get_safe_value("kr"), "en": get_safe_value("en"),
-                        "cn": get_safe_value("cn"), "tw": get_safe_value("tw"),
-                        "th": get_safe_value("th"),
-                        "file_name": get_safe_value("filename") or get_safe_value("file_name"),
-                        "sheet_name": get_safe_value("sheetname") or get_safe_value("sheet_name")
-                    }
+                    values = {name: str(value or '') for name, value in zip(sheet.fields, row.values)}
+
+                    # [개선] 압축 레코드 하나를 모든 캐시가 공유 (역방향 캐시도 복사하지 않음)
+                    data = TranslationRecord(
+                        string_id=string_id,
+                        kr=values.get("KR", ''), en=values.get("EN", ''),
+                        cn=values.get("CN", ''), tw=values.get("TW", ''),
+                        th=values.get("TH", ''),
+                        file_name=values.get("FILENAME") or values.get("FILE_NAME", ''),
+                        sheet_name=values.get("SHEETNAME") or values.get("SHEET_NAME", '')
+                    )
                     
-                    if data["file_name"]: self.translation_file_cache.setdefault(data["file_name"].lower(), {})[string_id] = data
-                    if data["sheet_name"]: self.translation_sheet_cache.setdefault(data["sheet_name"].lower(), {})[string_id] = data
+                    if data["file_name"]: self.translation_file_cache.setdefault(intern_text(data["file_name"].lower()), {})[string_id] = data
+                    if data["sheet_name"]: self.translation_sheet_cache.setdefault(intern_text(data["sheet_name"].lower()), {})[string_id] = data
                     self.translation_cache[string_id] = data
 
                     kr_text = data["kr"].strip()
                     if kr_text and kr_text not in self.kr_reverse_cache:
-                        self.kr_reverse_cache[kr_text] = {**data, 'string_id': string_id}
+                        self.kr_reverse_cache[kr_text] = data
             
             wb.close()
+            self.cache_source = ["excel", *self._file_signature(file_path), sorted(sheet_names)]
             self.log_message(f"🔧 캐시 구성 완료 (ID: {len(self.translation_cache)}, 파일: {len(self.translation_file_cache)}, 시트: {len(self.translation_sheet_cache)})")
 
             return {
@@ -257,65 +272,29 @@ class TranslationApplyManager:
     #     self.log_message(f"🔧 캐시 구성 완료 (ID: {len(self.translation_cache)}, 파일: {len(self.translation_file_cache)}, 시트: {len(self.translation_sheet_cache)}, KR역방향: {len(self.kr_reverse_cache)})")
                
     def find_string_id_position(self, worksheet):
-        """STRING_ID 위치 찾기"""
-        for row in range(2, 6):  # 2행부터 5행까지 검색
-            for col in range(1, min(10, worksheet.max_column + 1)):  # 최대 10개 컬럼까지만 검색
-                cell_value = worksheet.cell(row=row, column=col).value
-                if isinstance(cell_value, str) and "STRING_ID" in cell_value.upper():
-                    return col, row
-                    
-        # 1행도 검색
-        for row in worksheet.iter_rows(min_row=1, max_row=1, max_col=5):
-            for cell in row:
-                if isinstance(cell.value, str) and "STRING_ID" in cell.value.upper():
-                    return cell.column, cell.row
-                    
-        return None, None
+        """STRING_ID 위치 찾기 ([개선] 공용 헤더 규칙 read_header 사용)"""
+        header = read_header(worksheet)
+        if header is None:
+            return None, None
+        return header.string_id_col, header.row
 
-    def find_language_columns(self, worksheet, header_row, langs):
-        """언어 컬럼 위치 찾기"""
-        if not header_row:
-            return {}
-            
-        lang_cols = {}
-        
-        # 지정한 헤더 행에서만 검색
-        for row in worksheet.iter_rows(min_row=header_row, max_row=header_row):
-            for cell in row:
-                if not cell.value:
-                    continue
-                    
-                header_text = str(cell.value).strip()
-                
-                # 직접 매칭
-                if header_text in langs:
-                    lang_cols[header_text] = cell.column
-                    
-        return lang_cols
+    def _open_apply_sheet(self, worksheet, langs):
+        """
+        [신규] 읽기 전용 워크시트에서 공용 헤더 규칙(read_header)으로 헤더를 찾아 적용 엔진용 StringSheet를 만듭니다.
+        언어 컬럼은 헤더명이 langs와 정확히 같을 때, 요청 컬럼은 대소문자를 무시하고 찾습니다. (STRING_ID가 없으면 None)
+        """
+        header = read_header(worksheet)
+        if header is None:
+            return None
 
-    def find_target_columns(self, worksheet, header_row, target_columns=None):
-        """지정된 대상 컬럼들의 위치를 찾습니다. (예: #번역요청, Change)"""
-        if not header_row:
-            return {}
-            
-        found_columns = {}
-        # 기본적으로 '#번역요청' 컬럼을 탐색 대상에 포함
-        all_targets = ["#번역요청"]
-        if target_columns:
-            all_targets.extend(target_columns)
-        
-        # 중복 제거
-        all_targets = list(set(all_targets))
-
-        for cell in worksheet[header_row]:
-            if cell.value and isinstance(cell.value, str):
-                cell_value_clean = cell.value.strip().lower()
-                for target in all_targets:
-                    if cell_value_clean == target.lower():
-                        found_columns[target] = cell.column
-                        break # 찾았으면 다음 셀로
-                        
-        return found_columns
+        fields = {}
+        for col_idx, header_text in header.labels.items():
+            if header_text in langs:
+                fields[header_text] = col_idx
+        request_col = header.find(REQUEST_COLUMN)
+        if request_col:
+            fields[REQUEST_COLUMN] = request_col
+        return StringSheet(worksheet, header, fields)
 
     def _resave_with_excel_com(self, file_path):
         """Excel COM을 사용하여 파일을 다시 저장하여 최적화합니다."""
@@ -386,19 +365,32 @@ class TranslationApplyManager:
                 except Exception as e:
                     self.log_message(f"  ⚠️ Excel 프로세스 종료 중 예외 발생: {e}")
 
-    def find_translation_request_column(self, worksheet, header_row):
-        """#번역요청 컬럼 찾기 (공백, 대소문자 무시)"""
-        if not header_row:
-            return None
-            
-        for cell in worksheet[header_row]:
-            if cell.value and isinstance(cell.value, str):
-                # 공백 제거 및 소문자 변환 후 비교
-                if cell.value.strip().lower() == "#번역요청":
-                    return cell.column
-                    
-        return None
+    def finalize_saved_files(self, file_paths, use_excel=False, max_workers=None):
+        """
+        [신규] 번역을 저장한 파일들을 후처리합니다.
 
+        기본은 Excel 없이 zip/XML 수준에서 정리하며 (utils.xlsx_finalize - 파일별 병렬 처리),
+        use_excel=True이면 이어서 xlwings로 Excel에서 다시 저장합니다. (Windows + Excel 필요)
+
+        Returns:
+            {"finalized": 정리한 파일 수, "failed": [(파일 경로, 오류 메시지)]}
+        """
+        finalized, failed = 0, []
+        for file_path, result in finalize_workbooks(list(file_paths), max_workers=max_workers):
+            if result.get("status") == "error":
+                failed.append((file_path, result.get("message", "")))
+                self.log_message(f"  ⚠️ 후처리 실패: {os.path.basename(file_path)} - {result.get('message')}")
+                continue
+            finalized += 1
+            if result.get("strings_skipped"):
+                self.log_message(f"  ✨ 후처리 완료: {os.path.basename(file_path)} (공유 문자열 정리 건너뜀: {result['strings_skipped']})")
+                continue
+            self.log_message(f"  ✨ 후처리 완료: {os.path.basename(file_path)} "
+                             f"(공유 문자열 {result.get('shared_strings') or 0}개, 인라인 변환 {result.get('inline_converted', 0)}개)")
+        if use_excel:
+            for file_path in file_paths:
+                self._resave_with_xlwings(file_path)
+        return {"finalized": finalized, "failed": failed}
 
     def apply_translation(self, file_path, options):
         """
@@ -407,7 +399,7 @@ class TranslationApplyManager:
         # --- 옵션 추출 ---
         mode = options.get("mode", "id")
         selected_langs = options.get("selected_langs", [])
-        record_date = options.get("record_date", True)
+        dry_run = options.get("dry_run", False)
         # ID 모드 옵션
         kr_match_check = options.get("kr_match_check", True)
         kr_mismatch_delete = options.get("kr_mismatch_delete", False)
@@ -416,7 +408,6 @@ class TranslationApplyManager:
         kr_overwrite_on_kr_mode = options.get("kr_overwrite_on_kr_mode", False)
         
         allowed_statuses = options.get("allowed_statuses", [])
-        allowed_statuses_lower = [status.lower() for status in allowed_statuses] if allowed_statuses else []
 
         # --- 캐시 확인 ---
         if not self.translation_cache:
@@ -445,8 +436,8 @@ class TranslationApplyManager:
         
         workbook = None
         try:
-            current_file_name_lower = os.path.basename(file_path).lower()
-            workbook = load_workbook(file_path)
+            # [개선] 1단계: 읽기 전용으로 읽어 변경 목록만 계산 (변경 없는 파일은 편집 모드로 열지 않음)
+            workbook = open_workbook_for_read(file_path)
 
             string_sheets = [sheet for sheet in workbook.sheetnames if sheet.lower().startswith("string") and not sheet.startswith("#")]
             
@@ -454,124 +445,37 @@ class TranslationApplyManager:
                 self.log_message(f"   ⚠️ String 시트 없음")
                 return {"status": "info", "message": "파일에 String 시트가 없습니다"}
 
-            file_modified = False
             results = {
                 "total_updated": 0, "total_overwritten": 0, "total_kr_mismatch_skipped": 0,
                 "total_kr_mismatch_deleted": 0, "total_conditional_skipped": 0
             }
             
-            # 시트별 상세 결과 저장
+            # 시트별 상세 결과 / 변경 목록 저장
             sheet_details = {}
+            sheet_changes = {}
             
-            fill_green = PatternFill(start_color="DAF2D0", end_color="DAF2D0", fill_type="solid")
-            fill_orange = PatternFill(start_color="FFDDC1", end_color="FFDDC1", fill_type="solid") # '덮어씀' 표시용
+            rules = ApplyRules.from_options(options, selected_langs)
 
             for sheet_name in string_sheets:
-                worksheet = workbook[sheet_name]
-                string_id_col, header_row = self.find_string_id_position(worksheet)
-                if not string_id_col or not header_row:
+                sheet = self._open_apply_sheet(workbook[sheet_name], selected_langs + ['KR'])
+                if sheet is None:
                     self.log_message(f"   ⚠️ {sheet_name}: STRING_ID 컬럼 없음")
                     continue
                 
-                lang_cols = self.find_language_columns(worksheet, header_row, selected_langs + ['KR'])
-                request_col_idx = self.find_target_columns(worksheet, header_row, ["#번역요청"]).get("#번역요청")
+                plan = plan_sheet_changes(sheet, rules, self.translation_cache, self.kr_reverse_cache)
+                if plan:
+                    sheet_changes[sheet_name] = plan.changes
                 
                 # 시트별 카운터
                 sheet_stats = {
                     "updated": 0, "overwritten": 0, "conditional_skipped": 0,
-                    "kr_mismatch_skipped": 0, "kr_mismatch_deleted": 0,
-                    "total_rows": 0, "processed_rows": 0
+                    "kr_mismatch_skipped": 0, "kr_mismatch_deleted": 0
                 }
+                sheet_stats.update(plan.stats)
                 
                 # 언어별 적용 카운터
-                lang_apply_count = {lang: 0 for lang in selected_langs if lang != 'KR'}
-                
-                # 전체 행 수 계산
-                sheet_stats["total_rows"] = worksheet.max_row - header_row
+                lang_apply_count = plan.lang_counts
                 
-                for row_idx in range(header_row + 1, worksheet.max_row + 1):
-                    sheet_stats["processed_rows"] += 1
-                    
-                    # 조건부 적용 로직
-                    if allowed_statuses_lower and request_col_idx:
-                        request_val = str(worksheet.cell(row=row_idx, column=request_col_idx).value or '').strip().lower()
-                        if request_val not in allowed_statuses_lower:
-                            sheet_stats["conditional_skipped"] += 1
-                            continue
-                    
-                    # --- 데이터 조회 로직 (ID vs KR) ---
-                    trans_data = None
-                    key_value = ''
-                    if mode == 'id':
-                        key_value = str(worksheet.cell(row=row_idx, column=string_id_col).value or '').strip()
-                        if key_value:
-                            trans_data = self.translation_cache.get(key_value)
-                    else: # mode == 'kr'
-                        if 'KR' in lang_cols:
-                            key_value = str(worksheet.cell(row=row_idx, column=lang_cols['KR']).value or '').strip()
-                            if key_value:
-                                trans_data = self.kr_reverse_cache.get(key_value)
-
-                    if not key_value or not trans_data:
-                        continue
-                    
-                    row_modified_this_iteration = False
-                    
-                    # --- 적용 로직 ---
-                    if mode == 'id' and kr_match_check:
-                        current_kr_val = str(worksheet.cell(row=row_idx, column=lang_cols['KR']).value or '').strip()
-                        cache_kr_val = str(trans_data.get('kr', '')).strip()
-                        if current_kr_val != cache_kr_val:
-                            if kr_mismatch_delete:
-                                deleted_count = 0
-                                for lang, col_idx in lang_cols.items():
-                                    if lang != 'KR' and worksheet.cell(row=row_idx, column=col_idx).value:
-                                        worksheet.cell(row=row_idx, column=col_idx).value = ""
-                                        deleted_count += 1
-                                        row_modified_this_iteration = True
-                                if deleted_count > 0:
-                                    sheet_stats["kr_mismatch_deleted"] += 1
-                            else:
-                                sheet_stats["kr_mismatch_skipped"] += 1
-                            continue # KR 불일치 시 건너뛰기
-                    
-                    # 번역 적용 또는 덮어쓰기 로직
-                    for lang in selected_langs:
-                        if lang == 'KR': continue
-                        
-                        lang_lower = lang.lower()
-                        col_idx = lang_cols.get(lang)
-                        if not col_idx: continue
-                        
-                        cell = worksheet.cell(row=row_idx, column=col_idx)
-                        current_val = str(cell.value or '').strip()
-                        cached_val = str(trans_data.get(lang_lower, '')).strip()
-
-                        if cached_val and current_val != cached_val:
-                            should_overwrite = False
-                            if mode == 'id' and kr_match_check and kr_overwrite:
-                                should_overwrite = True # ID 모드, KR 일치, 덮어쓰기 옵션 켬
-                            elif mode == 'kr' and kr_overwrite_on_kr_mode:
-                                should_overwrite = True # KR 모드, 덮어쓰기 옵션 켬
-                            
-                            if should_overwrite:
-                                cell.value = cached_val
-                                cell.fill = fill_orange # 주황색으로 "덮어씀" 표시
-                                sheet_stats["overwritten"] += 1
-                                lang_apply_count[lang] += 1
-                                row_modified_this_iteration = True
-                            elif not should_overwrite and not current_val: # 빈 칸에만 적용
-                                cell.value = cached_val
-                                cell.fill = fill_green
-                                sheet_stats["updated"] += 1
-                                lang_apply_count[lang] += 1
-                                row_modified_this_iteration = True
-                    
-                    if row_modified_this_iteration:
-                        file_modified = True
-                        if record_date and request_col_idx:
-                            worksheet.cell(row=row_idx, column=request_col_idx).value = "적용"
-
                 # 시트 처리 결과 로그
                 if sheet_stats["updated"] > 0 or sheet_stats["overwritten"] > 0:
                     lang_details = []
@@ -610,9 +514,16 @@ class TranslationApplyManager:
                 
                 sheet_details[sheet_name] = sheet_stats
             
-            if file_modified:
-                self.log_message(f"   💾 변경사항 저장 중...")
-                workbook.save(file_path)
+            workbook.close()
+            workbook = None
+            
+            # 2단계: 변경 목록이 있는 파일만 저장 (미리보기면 저장하지 않음)
+            if sheet_changes:
+                if dry_run:
+                    self.log_message(f"   🔍 미리보기: 셀 {sum(len(changes) for changes in sheet_changes.values()):,}개 변경 예정 (저장 안 함)")
+                else:
+                    self.log_message(f"   💾 변경사항 저장 중...")
+                    write_file_changes(file_path, sheet_changes)
                 
                 # 최종 파일 요약
                 summary_parts = []
@@ -635,7 +546,9 @@ class TranslationApplyManager:
                 else:
                     self.log_message(f"   ⚠️ {file_name} 완료: 변경없음 (번역 데이터 없음)")
             
-            return {"status": "success", **results}
+            return {"status": "success", **results, "dry_run": dry_run,
+                    "planned_changes": {name: len(changes) for name, changes in sheet_changes.items()},
+                    "plan_hash": plan_hash(sheet_changes)}
             
         except Exception as e:
             self.log_message(f"   ❌ {file_name} 오류: {str(e)}")
@@ -647,103 +560,28 @@ class TranslationApplyManager:
                 workbook.close()
 
                
-    def check_external_links(self, workbook):
-        """워크북에서 외부 링크 검사 (번역 도구용) - 검증된 최종 버전"""
-        import re
-        
-        external_links = []
-        
-        # 외부 참조 패턴들 (검증된 버전)
-        external_patterns = [
-            r"'[^']*\.xl[sx]?[xm]?'!",  # '파일명.xlsx'! 또는 '경로\파일명.xlsx'!
-            r'\[.*\.xl[sx]?[xm]?\]',    # [파일명.xlsx] 패턴
-            r"'[A-Z]:[^']*\.xl[sx]?[xm]?'!", # 'C:\경로\파일명.xlsx'! 패턴  
-            r'\\[^\\]*\.xl[sx]?[xm]?!', # \파일명.xlsx! 패턴
-            r"=[^=]*'[A-Z]:[^']*'",     # =으로 시작하는 드라이브 경로
-            r'\[\d+\]!',                # [숫자]! 패턴 (시트 참조)
-        ]
-        
-        # #REF! 오류 패턴들 (검증된 버전)
-        ref_error_patterns = [
-            r'#REF!',                   # #REF! 오류
-            r'OFFSET\(#REF!',          # OFFSET 함수에서 #REF! 오류
-        ]
-        
+    def apply_translation_parallel(self, file_paths, options, max_workers=None):
+        """
+        [신규] 여러 파일에 apply_translation을 프로세스 풀로 병렬 적용합니다.
+        번역 캐시는 스냅샷 파일로 한 번만 넘기며, 완료된 순서대로 (파일 경로, 결과)를 돌려줍니다.
+        """
+        return iter_parallel_apply(self, "apply_translation", file_paths, options, max_workers)
+
+    def check_external_links(self, file_path):
+        """
+        [개선] 워크북의 외부 링크 검사 (번역 도구용)
+        워크북을 열지 않고 zip 안의 관계 파일/externalLinks/명명된 범위만 읽어 전체를 검사합니다.
+
+        Args:
+            file_path: 엑셀 파일 경로 (file_path 속성이 있는 워크북 객체도 허용)
+        """
+        file_path = getattr(file_path, "file_path", file_path)
         try:
-            # 방법 1: 워크북의 external_links 속성 확인
-            if hasattr(workbook, 'external_links') and workbook.external_links:
-                for link in workbook.external_links:
-                    external_links.append(f"워크북_외부링크: {str(link)}")
-            
-            # 방법 2: 명명된 범위 검사 (가장 중요!) - 검증된 로직
-            if hasattr(workbook, 'defined_names') and workbook.defined_names:
-                # 딕셔너리 키로 접근 (검증된 방법)
-                for name_key in workbook.defined_names.keys():
-                    try:
-                        defined_name = workbook.defined_names[name_key]
-                        if hasattr(defined_name, 'value') and defined_name.value:
-                            name_formula = str(defined_name.value)
-                            
-                            # #REF! 오류 우선 검사
-                            ref_error_found = False
-                            for ref_pattern in ref_error_patterns:
-                                if re.search(ref_pattern, name_formula):
-                                    external_links.append(f"명명된_범위_REF오류:{name_key} - {name_formula[:50]}")
-                                    ref_error_found = True
-                                    break
-                            
-                            # #REF! 오류가 없는 경우에만 외부 참조 패턴 검사
-                            if not ref_error_found:
-                                for pattern in external_patterns:
-                                    if re.search(pattern, name_formula):
-                                        external_links.append(f"명명된_범위_외부링크:{name_key} - {name_formula[:50]}")
-                                        break
-                    except Exception as e:
-                        # 개별 명명된 범위 처리 중 오류가 발생해도 계속 진행
-                        pass
-            
-            # 방법 3: 셀별 외부 참조 검사 (제한적으로)
-            cell_count = 0
-            for sheet_name in workbook.sheetnames:
-                if cell_count >= 100:  # 번역 도구에서는 성능을 위해 더 제한적으로
-                    break
-                    
-                worksheet = workbook[sheet_name]
-                
-                for row in worksheet.iter_rows():
-                    for cell in row:
-                        cell_count += 1
-                        if cell_count > 100:
-                            break
-                            
-                        # 공식이 있는 셀 검사
-                        if cell.data_type == 'f' and cell.value:
-                            formula = str(cell.value)
-                            
-                            # #REF! 오류 검사
-                            for ref_pattern in ref_error_patterns:
-                                if re.search(ref_pattern, formula):
-                                    external_links.append(f"셀_REF오류:{sheet_name}!{cell.coordinate} - {formula[:50]}")
-                                    break
-                            else:
-                                # 외부 참조 패턴 검사
-                                for pattern in external_patterns:
-                                    if re.search(pattern, formula):
-                                        external_links.append(f"셀_외부링크:{sheet_name}!{cell.coordinate} - {formula[:50]}")
-                                        break
-                        
-                        # #REF! 값 검사
-                        elif cell.value and str(cell.value).startswith('#REF!'):
-                            external_links.append(f"셀_REF값:{sheet_name}!{cell.coordinate} - {cell.value}")
-                    
-                    if cell_count > 100:
-                        break
-                        
-        except Exception as e:
+            findings = scan_external_links(file_path)
+        except Exception:
             # 외부 링크 검사 중 오류가 발생하면 무시하고 계속 진행
-            pass
-            
-        return external_links[:10]  # 최대 10개만 반환
+            return []
+        return [finding.describe() for finding in findings][:10]  # 최대 10개만 반환
 
 # tools/translation_apply_manager.py의 load_translation_cache_from_db 함수를 아래 코드로 교체합니다.
 
@@ -758,10 +596,9 @@ class TranslationApplyManager:
             self.translation_sheet_cache = {}
             self.duplicate_ids = {}
             self.kr_reverse_cache = {}
+            self.cache_source = None
 
             conn = sqlite3.connect(db_path)
-            # 컬럼 이름으로 데이터에 접근하기 위해 row_factory 설정
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='translation_data'")
@@ -771,38 +608,18 @@ class TranslationApplyManager:
                 self.log_message(f"❌ {message}")
                 return {"status": "error", "message": message}
 
-            # 'active' 상태인 데이터만 가져옵니다.
-            cursor.execute("SELECT * FROM translation_data WHERE status = 'active'")
-            rows = cursor.fetchall()
             conn.close()
 
-            # [수정] DataFrame을 거치지 않고 직접 캐시를 생성합니다.
-            for row in rows:
-                string_id = row["string_id"]
-                if not string_id:
-                    continue
-                
-                # sqlite3.Row 객체를 딕셔너리로 변환
-                data = dict(row)
-                
-                file_name_val = data.get("file_name", "")
-                sheet_name_val = data.get("sheet_name", "")
-
-                # 다중 캐시 구성
-                if file_name_val:
-                    self.translation_file_cache.setdefault(file_name_val.lower(), {})[string_id] = data
-                if sheet_name_val:
-                    self.translation_sheet_cache.setdefault(sheet_name_val.lower(), {})[string_id] = data
-                self.translation_cache[string_id] = data
-
-                # KR 역방향 조회 캐시 생성
-                kr_text = data.get("kr", "")
-                if kr_text:
-                    kr_text = kr_text.strip()
-                    if kr_text and kr_text not in self.kr_reverse_cache:
-                        self.kr_reverse_cache[kr_text] = {**data}
+            # [개선] 행 저장소 + 인덱스 맵 캐시 사용 ('active' 상태만, DB가 그대로면 스냅샷에서 바로 로드)
+            cache, from_snapshot = load_cached_translations(db_path)
+            self.translation_cache = cache.translation_cache
+            self.translation_file_cache = cache.translation_file_cache
+            self.translation_sheet_cache = cache.translation_sheet_cache
+            self.kr_reverse_cache = cache.kr_reverse_cache
             
-            self.log_message(f"🔧 DB 캐시 구성 완료 (ID: {len(self.translation_cache)}, 파일: {len(self.translation_file_cache)}, 시트: {len(self.translation_sheet_cache)})")
+            self.cache_source = ["db", os.path.abspath(db_path), db_signature(db_path)]
+            source = "스냅샷" if from_snapshot else "DB"
+            self.log_message(f"🔧 DB 캐시 구성 완료 ({source}, ID: {len(self.translation_cache)}, 파일: {len(self.translation_file_cache)}, 시트: {len(self.translation_sheet_cache)})")
 
             return {
                 "status": "success",
@@ -820,4 +637,40 @@ class TranslationApplyManager:
             self.log_message(f"❌ 번역 DB 캐시 로딩 오류: {str(e)}")
             import traceback
             traceback.print_exc()
-            return {"status": "error", "message": str(e)}
\ No newline at end of file
+            return {"status": "error", "message": str(e)}
+
+    def load_translation_cache_from_snapshot(self, snapshot_path):
+        """
+        [신규] 컬럼형 스냅샷(TranslationDBManager.export_translation_snapshot)을 mmap으로 열어 번역 캐시로 사용합니다.
+        전체를 객체로 읽지 않고 STRING_ID/KR 조회 시 이진 탐색으로 필요한 행만 읽습니다.
+        """
+        try:
+            self.log_message(f"⚙️ 스냅샷 열기: {snapshot_path}")
+            if self.snapshot is not None:
+                self.snapshot.close()
+            self.cache_source = None
+            self.snapshot = TranslationSnapshot(snapshot_path)
+
+            self.translation_cache = self.snapshot.id_view()
+            self.kr_reverse_cache = self.snapshot.kr_view()
+            self.translation_file_cache = {}
+            self.translation_sheet_cache = {}
+            self.duplicate_ids = {}
+            self.cache_source = ["snapshot", *self._file_signature(snapshot_path)]
+            self.log_message(f"🔧 스냅샷 캐시 준비 완료 (ID: {len(self.snapshot)})")
+
+            return {
+                "status": "success",
+                "source_type": "Snapshot",
+                "id_count": len(self.snapshot),
+                "file_count": 0,
+                "sheet_count": 0,
+                "translation_cache": self.translation_cache,
+                "translation_file_cache": self.translation_file_cache,
+                "translation_sheet_cache": self.translation_sheet_cache,
+                "duplicate_ids": {},
+                "kr_reverse_cache": self.kr_reverse_cache
+            }
+        except Exception as e:
+            self.log_message(f"❌ 번역 스냅샷 로딩 오류: {str(e)}")
+            return {"status": "error", "message": str(e)}
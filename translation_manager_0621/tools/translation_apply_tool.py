@@ -15,6 +15,8 @@ if project_root not in sys.path:
 
 from ui.common_components import ScrollableCheckList, LoadingPopup
 from tools.translation_apply_manager import TranslationApplyManager
+from utils.apply_journal import ApplyJournal, make_job_key
+from utils.translation_apply_engine import dry_run_report
 import openpyxl
 
 class TranslationApplyTool(tk.Frame):
@@ -37,6 +39,7 @@ class TranslationApplyTool(tk.Frame):
         self.available_languages = ["KR", "EN", "CN", "TW", "TH"]
         self.apply_lang_vars = {}
         self.record_date_var = tk.BooleanVar(value=True)
+        self.dry_run_var = tk.BooleanVar(value=False)
         self.kr_match_check_var = tk.BooleanVar(value=True)
         self.kr_mismatch_delete_var = tk.BooleanVar(value=False)
         self.apply_smart_lookup_var = tk.BooleanVar(value=True) # [추가] 이 줄이 누락되었습니다.
@@ -166,6 +169,7 @@ class TranslationApplyTool(tk.Frame):
         other_frame = ttk.Frame(common_options_frame)
         other_frame.pack(fill="x", padx=5, pady=2, anchor="w")
         ttk.Checkbutton(other_frame, text="번역 적용 표시", variable=self.record_date_var).pack(side="left", padx=5)
+        ttk.Checkbutton(other_frame, text="미리보기 (저장 안 함)", variable=self.dry_run_var).pack(side="left", padx=5)
         
         action_frame = ttk.Frame(self)
         action_frame.pack(fill="x", padx=5, pady=5)
@@ -522,9 +526,10 @@ class TranslationApplyTool(tk.Frame):
             "kr_overwrite": self.kr_overwrite_var.get(),
             "kr_overwrite_on_kr_mode": self.kr_overwrite_on_kr_mode_var.get(),
             "allowed_statuses": allowed_statuses,
+            "dry_run": self.dry_run_var.get(),
         }
             
-        def apply_translations_thread():
+        def run_apply(journal, job_key):
             total_results = {
                 "total_updated": 0, "total_overwritten": 0, "total_kr_mismatch_skipped": 0, 
                 "total_kr_mismatch_deleted": 0, "total_smart_applied": 0, 
@@ -536,38 +541,119 @@ class TranslationApplyTool(tk.Frame):
             failed_files = []
             
             start_time = time.time()
-            
-            for idx, (file_name, file_path) in enumerate(files_to_process):
-                self.after(0, lambda i=idx, n=file_name: [
-                    loading_popup.update_progress((i / len(files_to_process)) * 100, f"파일 처리 중 ({i+1}/{len(files_to_process)}): {n}"),
-                ])
-                
-                result = self.translation_apply_manager.apply_translation(
-                    file_path,
-                    apply_options
+
+            pending_files = files_to_process
+            resumed_written = []
+            if journal is not None:
+                resume_plan = journal.resume(job_key, [file_path for _, file_path in files_to_process])
+                pending_paths = set(resume_plan.pending)
+                pending_files = [item for item in files_to_process if item[1] in pending_paths]
+                resumed_written = resume_plan.written
+                if resume_plan.done or resume_plan.written:
+                    self.after(0, lambda d=len(resume_plan.done), w=len(resume_plan.written): self.log_text.insert(
+                        tk.END, f"⏭️ 이전 실행 기록: 완료된 파일 {d}개 건너뜀, 후처리만 남은 파일 {w}개\n"))
+            input_stats = {file_path: os.stat(file_path) for _, file_path in pending_files if journal is not None}
+
+            def record_result(file_path, result):
+                """결과가 나올 때마다 저널에 바로 기록 (중간에 멈춰도 끝난 파일은 남음)"""
+                if journal is None:
+                    return
+                try:
+                    if result.get("status") == "error":
+                        journal.mark_failed(job_key, file_path, result.get("message", ""))
+                    elif result.get("planned_changes"):
+                        journal.mark_written(job_key, file_path, result.get("plan_hash"), input_stats.get(file_path))
+                    else:
+                        journal.mark_done(job_key, file_path, result.get("plan_hash"))
+                except Exception as e:
+                    self.after(0, lambda msg=str(e): self.log_text.insert(tk.END, f"⚠️ 작업 저널 기록 실패: {msg}\n"))
+
+            results_by_path = {}
+            if len(pending_files) > 1:
+                # [신규] 여러 파일은 프로세스 풀에서 병렬 적용 (파일이 끝날 때마다 진행률 갱신)
+                file_names = {file_path: file_name for file_name, file_path in pending_files}
+                completed = self.translation_apply_manager.apply_translation_parallel(
+                    list(file_names), apply_options
                 )
-                
+                for done, (file_path, result) in enumerate(completed, 1):
+                    self.after(0, lambda i=done, n=file_names[file_path]: [
+                        loading_popup.update_progress((i / len(pending_files)) * 100, f"파일 처리 완료 ({i}/{len(pending_files)}): {n}"),
+                    ])
+                    results_by_path[file_path] = result
+                    record_result(file_path, result)
+            else:
+                for idx, (file_name, file_path) in enumerate(pending_files):
+                    self.after(0, lambda i=idx, n=file_name: [
+                        loading_popup.update_progress((i / len(pending_files)) * 100, f"파일 처리 중 ({i+1}/{len(pending_files)}): {n}"),
+                    ])
+
+                    results_by_path[file_path] = self.translation_apply_manager.apply_translation(
+                        file_path,
+                        apply_options
+                    )
+                    record_result(file_path, results_by_path[file_path])
+
+            # 결과는 파일 목록 순서대로 합산
+            planned_files = []
+            for file_name, file_path in pending_files:
+                result = results_by_path[file_path]
                 if result["status"] == "success":
                     processed_count += 1
                     successful_files.append(file_name)
+                    planned_files.append((file_name, result.get("planned_changes", {})))
                     for key in total_results:
                         total_results[key] += result.get(key, 0)
                 else:
                     error_count += 1
                     failed_files.append((file_name, result.get("message", "알 수 없는 오류")))
-            
+
+            # [신규] 저장된 파일은 Excel 다시 저장 대신 Python 후처리 (calcChain/콘텐츠 형식/공유 문자열 정리)
+            # 이전 실행에서 저장만 하고 후처리 전에 멈춘 파일도 함께 처리
+            changed_files = [file_path for file_path, result in results_by_path.items()
+                             if result.get("status") == "success" and result.get("planned_changes")]
+            changed_files += resumed_written
+            if changed_files and not apply_options["dry_run"]:
+                finalize_result = self.translation_apply_manager.finalize_saved_files(changed_files)
+                if journal is not None:
+                    failed_paths = {file_path for file_path, _ in finalize_result["failed"]}
+                    for file_path in changed_files:
+                        if file_path not in failed_paths:
+                            record_result(file_path, {"status": "success"})
+
             elapsed_time = time.time() - start_time
-            
             self.after(0, lambda: self.process_translation_apply_result(
                 total_results, processed_count, error_count, loading_popup, 
-                successful_files, failed_files, elapsed_time)
+                successful_files, failed_files, elapsed_time,
+                apply_options["dry_run"], planned_files)
             )
 
+        def apply_translations_thread():
+            # [신규] 적용 작업 저널: 같은 옵션/캐시로 다시 실행하면 완료된 파일은 건너뛰고 남은 파일부터 처리
+            # 파일 처리/후처리 중 오류가 나도 저널 연결은 항상 닫음
+            journal, job_key = self._open_apply_journal(apply_options)
+            try:
+                run_apply(journal, job_key)
+            finally:
+                if journal is not None:
+                    journal.close()
+
         thread = threading.Thread(target=apply_translations_thread, daemon=True)
         thread.start()
 
-    def process_translation_apply_result(self, total_results, processed_count, error_count, loading_popup, successful_files, failed_files, elapsed_time):
-        """번역 적용 스레드 완료 후 결과를 처리하고 UI에 표시합니다."""
+    def _open_apply_journal(self, apply_options):
+        """[신규] 적용 작업 저널과 작업 키를 엽니다. (미리보기이거나 캐시 출처를 모르면 (None, None))"""
+        cache_signature = self.translation_apply_manager.cache_signature()
+        if apply_options.get("dry_run") or cache_signature is None:
+            return None, None
+        try:
+            return ApplyJournal(), make_job_key(apply_options, cache_signature)
+        except Exception as e:
+            self.after(0, lambda msg=str(e): self.log_text.insert(tk.END, f"⚠️ 작업 저널을 열 수 없어 이어하기 없이 진행합니다: {msg}\n"))
+            return None, None
+
+    def process_translation_apply_result(self, total_results, processed_count, error_count, loading_popup, successful_files, failed_files, elapsed_time,
+                                         dry_run=False, planned_files=()):
+        """번역 적용 스레드 완료 후 결과를 처리하고 UI에 표시합니다. (미리보기면 변경 예정 보고서)"""
         loading_popup.close()
 
         # 시간 포맷팅
@@ -575,6 +661,10 @@ class TranslationApplyTool(tk.Frame):
         seconds = int(elapsed_time % 60)
         time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
 
+        if dry_run:
+            self.show_dry_run_report(planned_files, failed_files, time_str)
+            return
+
         # 최종 요약 로그
         self.log_text.insert(tk.END, "\n" + "="*60 + "\n")
         self.log_text.insert(tk.END, "🎉 번역 적용 작업 완료\n")
@@ -629,6 +719,39 @@ class TranslationApplyTool(tk.Frame):
         
         messagebox.showinfo("완료", completion_msg, parent=self)
 
+    def show_dry_run_report(self, planned_files, failed_files, time_str):
+        """[신규] 미리보기 결과를 파일/시트별 변경 예정 보고서로 표시합니다. (파일은 저장하지 않음)"""
+        summary, lines = dry_run_report(planned_files)
+
+        self.log_text.insert(tk.END, "\n" + "="*60 + "\n")
+        self.log_text.insert(tk.END, "🔍 번역 적용 미리보기 보고서\n")
+        self.log_text.insert(tk.END, "="*60 + "\n")
+        self.log_text.insert(tk.END, f"⏱️  소요 시간: {time_str}\n")
+        self.log_text.insert(tk.END, f"🔍 {summary}\n")
+        if lines:
+            self.log_text.insert(tk.END, "\n📋 변경 예정 파일:\n")
+            for line in lines:
+                self.log_text.insert(tk.END, f"   {line}\n")
+        if failed_files:
+            self.log_text.insert(tk.END, f"\n❌ 분석 실패한 파일:\n")
+            for file_name, error_msg in failed_files[:5]:
+                self.log_text.insert(tk.END, f"   • {file_name}: {error_msg}\n")
+            if len(failed_files) > 5:
+                self.log_text.insert(tk.END, f"   ... 외 {len(failed_files) - 5}개\n")
+        self.log_text.insert(tk.END, "="*60 + "\n")
+        self.log_text.see(tk.END)
+
+        self.status_label_apply.config(text=summary)
+
+        report_msg = f"{summary}\n\n⏱️ 소요 시간: {time_str}\n"
+        if failed_files:
+            report_msg += f"❌ 분석 실패: {len(failed_files)}개 파일\n"
+        if lines:
+            report_msg += "\n" + "\n".join(lines[:15])
+            if len(lines) > 15:
+                report_msg += f"\n... (전체 목록은 로그 참고)"
+        messagebox.showinfo("미리보기 보고서", report_msg, parent=self)
+
 
 
 
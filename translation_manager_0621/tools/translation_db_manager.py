@@ -8,46 +8,52 @@ import pandas as pd
 import re
 from openpyxl import load_workbook
 import gc
+from concurrent.futures import ProcessPoolExecutor
 from openpyxl.styles import PatternFill
 from datetime import datetime
+from utils.string_sheet_reader import is_string_sheet, iter_string_sheets, LANGUAGE_ALIASES
+from utils.xlsx_stream_reader import open_workbook_for_read, sheet_fingerprints
+from utils.translation_record import TranslationRecord, intern_text
+from utils.translation_cache import load_translation_cache as load_cached_translations
+from utils.translation_snapshot import export_db_snapshot
+from utils.translation_revisions import begin_revision, finish_revision, SOURCE_BUILD, SOURCE_UPDATE
+
+def read_string_rows(file_path, language_list, language_mapping=LANGUAGE_ALIASES, require_languages=False, use_read_only=True, sheet_names=None):
+    """
+    엑셀 파일 하나의 String 시트 행을 읽어 압축된 배치로 반환합니다.
+    병렬 처리 시 작업 프로세스에서 실행되므로 모듈 수준 함수로 둡니다.
+    sheet_names를 지정하면 해당 시트만 읽습니다.
+
+    Returns:
+        [(시트명, 언어 키 튜플, [(STRING_ID, 상태, 언어 값 튜플), ...]), ...]
+    """
+    if use_read_only:
+        workbook = open_workbook_for_read(file_path)
+    else:
+        workbook = load_workbook(file_path, read_only=False, data_only=True)
+    try:
+        batches = []
+        for sheet_name, sheet in iter_string_sheets(workbook, language_list, require_languages=require_languages,
+                                                    aliases=language_mapping, only_sheets=sheet_names):
+            lang_keys = tuple(lang.lower() for lang in sheet.fields)
+            rows = [(row.string_id, row.status, row.values) for row in sheet.rows()]
+            batches.append((sheet_name, lang_keys, rows))
+        return batches
+    finally:
+        workbook.close()
+
 
 class TranslationDBManager:
     def __init__(self, parent_window=None):
         self.parent = parent_window
         self.excluded_count = 0
     
-    def find_string_id_position(self, worksheet):
-        for row in worksheet.iter_rows(min_row=1, max_row=6, max_col=5):
-            for cell in row:
-                if isinstance(cell.value, str) and "STRING_ID" in cell.value.upper():
-                    return cell.column, cell.row
-        return None, None
-
-    def find_language_columns(self, worksheet, header_row, langs, language_mapping=None):
-        if not header_row: return {}
-        lang_cols = {}
-        extended_mapping = {}
-        if language_mapping:
-            for alt, main in language_mapping.items():
-                extended_mapping[alt.upper()] = main
-        for row in worksheet.iter_rows(min_row=header_row, max_row=header_row):
-            for cell in row:
-                if not cell.value: continue
-                header_text = str(cell.value).strip().upper()
-                if header_text in langs:
-                    lang_cols[header_text] = cell.column
-                elif header_text in extended_mapping:
-                    mapped_lang = extended_mapping[header_text]
-                    if mapped_lang in langs:
-                        lang_cols[mapped_lang] = cell.column
-        return lang_cols
-
-    def build_translation_db(self, excel_files, output_db_path, language_list, batch_size=2000, use_read_only=True, progress_callback=None):
+    def build_translation_db(self, excel_files, output_db_path, language_list, batch_size=2000, use_read_only=True, progress_callback=None, max_workers=1):
         if not excel_files: return {"status": "error", "message": "번역 파일이 선택되지 않았습니다."}
         if not output_db_path: return {"status": "error", "message": "DB 파일 경로가 지정되지 않았습니다."}
         if not language_list: return {"status": "error", "message": "하나 이상의 언어를 선택하세요."}
         
-        language_mapping = {"ZH": "CN"}
+        language_mapping = LANGUAGE_ALIASES
         if os.path.exists(output_db_path): os.remove(output_db_path)
         
         conn = None
@@ -61,83 +67,202 @@ class TranslationDBManager:
             )''')
             conn.commit()
 
-            unique_data = {}
-            duplicate_data_preview = defaultdict(list)
+            # [개선] 행을 메모리에 모으지 않고 batch_size 단위로 임시 스테이징 테이블에 기록
+            self._create_staging_table(cursor)
+            pending_rows = []
+            batch_size = max(int(batch_size or 0), 1)
             processed_count = 0
             error_count = 0
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            current_fingerprints = self._compute_fingerprints(excel_files)
 
-            for idx, (file_name, file_path) in enumerate(excel_files):
-                if progress_callback:
-                    progress_callback(f"파일 ({idx+1}/{len(excel_files)}) {file_name} 처리 중...", idx, len(excel_files))
-                
-                try:
-                    gc.collect()
-                    workbook = load_workbook(file_path, read_only=use_read_only, data_only=True)
-                    
-                    for sheet_name in workbook.sheetnames:
-                        if not sheet_name.lower().startswith("string") or sheet_name.startswith("#"): continue
-                        worksheet = workbook[sheet_name]
-                        string_id_col, header_row = self.find_string_id_position(worksheet)
-                        if not string_id_col or not header_row: continue
-                        lang_cols = self.find_language_columns(worksheet, header_row, language_list, language_mapping)
-                        if not lang_cols: continue
-                        
-                        for row_cells in worksheet.iter_rows(min_row=header_row + 1, values_only=True):
-                            if not row_cells or string_id_col - 1 >= len(row_cells): continue
-                            string_id = row_cells[string_id_col - 1]
-                            if not string_id: continue
-                            
-                            status = '비활성' if str(row_cells[0] or '').strip().startswith('#') else 'active'
-                            
-                            values = {"string_id": string_id}
-                            for lang, col in lang_cols.items():
-                                if col - 1 < len(row_cells):
-                                    values[lang.lower()] = row_cells[col - 1]
-                            
-                            current_data_tuple = (
-                                file_name, sheet_name, values.get("string_id"),
-                                values.get("kr"), values.get("en"), values.get("cn"), 
-                                values.get("tw"), values.get("th"), status, current_time
-                            )
-                            current_data_dict = {
-                                'file_name': file_name, 'sheet_name': sheet_name, 'string_id': string_id,
-                                'kr': values.get("kr"), 'en': values.get("en"), 'cn': values.get("cn"),
-                                'tw': values.get("tw"), 'th': values.get("th"), 'status': status
-                            }
-
-                            if string_id not in unique_data and string_id not in duplicate_data_preview:
-                                unique_data[string_id] = current_data_tuple
-                            elif string_id in unique_data:
-                                original_tuple = unique_data.pop(string_id)
-                                original_dict = {
-                                    'file_name': original_tuple[0], 'sheet_name': original_tuple[1], 'string_id': original_tuple[2],
-                                    'kr': original_tuple[3], 'en': original_tuple[4], 'cn': original_tuple[5],
-                                    'tw': original_tuple[6], 'th': original_tuple[7], 'status': original_tuple[8]
-                                }
-                                duplicate_data_preview[string_id].extend([original_dict, current_data_dict])
-                            else:
-                                duplicate_data_preview[string_id].append(current_data_dict)
-
-                    workbook.close()
-                    processed_count += 1
-                except Exception as e:
-                    if progress_callback: progress_callback(f"파일 처리 오류: {e}", idx + 1, len(excel_files))
+            file_results = self._iter_file_rows(
+                excel_files, language_list, language_mapping, True, use_read_only, max_workers,
+                progress_callback, "파일 ({current}/{total}) {file_name} 처리 중..."
+            )
+            for idx, file_name, batches, error in file_results:
+                if error is not None:
+                    if progress_callback: progress_callback(f"파일 처리 오류: {error}", idx + 1, len(excel_files))
                     error_count += 1
-            
-            batch_data_to_insert = list(unique_data.values())
-            if batch_data_to_insert:
-                cursor.executemany('''
-                INSERT OR IGNORE INTO translation_data (file_name, sheet_name, string_id, kr, en, cn, tw, th, status, update_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', batch_data_to_insert)
-            
+                    continue
+
+                file_name = intern_text(file_name)
+                sheet_string_ids = self._stage_file_rows(cursor, file_name, batches, language_list, current_time, pending_rows, batch_size)
+
+                # 새로 구축한 DB는 모든 컬럼이 엑셀과 같으므로 어떤 업데이트 옵션에서도 재사용 가능한 지문으로 기록
+                # (언어 컬럼이 없어 구축에서 제외된 String 시트는 업데이트 때 다시 읽도록 기록하지 않음)
+                build_fingerprints = {file_name: {
+                    sheet_name: fp for sheet_name, fp in current_fingerprints.get(file_name, {}).items()
+                    if not is_string_sheet(sheet_name) or (file_name, sheet_name) in sheet_string_ids
+                }}
+                self._save_fingerprints(cursor, [excel_files[idx]], build_fingerprints, sheet_string_ids,
+                                        language_list, self.FINGERPRINT_ANY_OPTION, current_time)
+                processed_count += 1
+            self._flush_staging_rows(cursor, pending_rows)
+
+            # 중복 STRING_ID는 SQL로 분리하고, 한 번만 나온 행만 순서대로 본 테이블에 기록
+            duplicate_data_preview = self._resolve_staging_duplicates(cursor)
+            cursor.execute(f'''
+            INSERT OR IGNORE INTO translation_data (file_name, sheet_name, string_id, kr, en, cn, tw, th, status, update_date)
+            SELECT file_name, sheet_name, string_id, kr, en, cn, tw, th, status, update_date
+            FROM {self.STAGING_TABLE} ORDER BY seq''')
+            total_rows = cursor.rowcount
+            cursor.execute(f"DROP TABLE {self.STAGING_TABLE}")
+            # KR 인덱스는 일괄 삽입이 끝난 뒤에 한 번에 생성
+            self._create_kr_index(cursor)
+            # [신규] 새 DB의 기준 리비전 (모든 행이 신규이므로 행별 이력은 남기지 않음)
+            revision_id = begin_revision(cursor, SOURCE_BUILD, f"DB 구축 ({processed_count}개 파일)",
+                                         track_changes=False, timestamp=current_time)
+            finish_revision(cursor, revision_id, total_rows)
             conn.commit()
-            return {"status": "success", "processed_count": processed_count, "error_count": error_count, "total_rows": len(batch_data_to_insert), "duplicates": dict(duplicate_data_preview)}
+            return {"status": "success", "processed_count": processed_count, "error_count": error_count, "total_rows": total_rows,
+                    "duplicates": duplicate_data_preview, "revision_id": revision_id}
         except Exception as e:
             return {"status": "error", "message": str(e)}
         finally:
             if conn: conn.close()
                 
+    # --- [신규] 스트리밍 구축용 스테이징 테이블 ---
+    STAGING_TABLE = "temp.translation_staging"
+
+    STAGING_LANGUAGES = ("kr", "en", "cn", "tw", "th")
+
+    def _create_staging_table(self, cursor):
+        """
+        엑셀에서 읽은 행을 도착 순서(seq)대로 쌓아 두는 임시 테이블을 만듭니다.
+        string_id는 형 변환 없이 저장해 엑셀 값 그대로(숫자/문자) 중복을 판단합니다.
+        missing은 시트에 없는 언어 컬럼의 비트 표시입니다. (STAGING_LANGUAGES 순서, kr=1)
+        """
+        cursor.execute(f"DROP TABLE IF EXISTS {self.STAGING_TABLE}")
+        cursor.execute(f'''
+        CREATE TABLE {self.STAGING_TABLE} (
+            seq INTEGER PRIMARY KEY, file_name TEXT, sheet_name TEXT, string_id,
+            kr TEXT, en TEXT, cn TEXT, tw TEXT, th TEXT, status TEXT, update_date TEXT,
+            missing INTEGER DEFAULT 0
+        )''')
+
+    def _stage_file_rows(self, cursor, file_name, batches, language_list, current_time, pending_rows, batch_size):
+        """
+        파일 하나의 배치를 pending_rows에 담고 batch_size마다 스테이징 테이블에 기록합니다.
+
+        Returns:
+            {(파일명, 시트명): STRING_ID 목록} - 시트 지문 저장용
+        """
+        requested = [lang.lower() for lang in language_list]
+        sheet_string_ids = {}
+        for sheet_name, lang_keys, rows in batches:
+            sheet_name = intern_text(sheet_name)
+            sheet_string_ids[(file_name, sheet_name)] = [row[0] for row in rows]
+            missing = sum(1 << self.STAGING_LANGUAGES.index(lang)
+                          for lang in requested if lang in self.STAGING_LANGUAGES and lang not in lang_keys)
+            for string_id, status, lang_values in rows:
+                values = dict(zip(lang_keys, lang_values))
+                pending_rows.append((
+                    file_name, sheet_name, string_id,
+                    values.get("kr"), values.get("en"), values.get("cn"),
+                    values.get("tw"), values.get("th"), status, current_time, missing
+                ))
+                if len(pending_rows) >= batch_size:
+                    self._flush_staging_rows(cursor, pending_rows)
+        return sheet_string_ids
+
+    def _flush_staging_rows(self, cursor, pending_rows):
+        """모아 둔 행을 스테이징 테이블에 기록하고 목록을 비웁니다."""
+        if not pending_rows:
+            return
+        cursor.executemany(f'''
+        INSERT INTO {self.STAGING_TABLE} (file_name, sheet_name, string_id, kr, en, cn, tw, th, status, update_date, missing)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', pending_rows)
+        pending_rows.clear()
+
+    def _resolve_staging_duplicates(self, cursor, row_order=None):
+        """
+        스테이징 테이블에서 두 번 이상 나온 STRING_ID를 찾아 중복 미리보기를 만들고,
+        해당 행들은 스테이징 테이블에서 삭제합니다. (남은 행은 모두 고유 STRING_ID)
+        키 순서/항목 순서는 메모리에서 분류하던 기존 방식과 같습니다.
+
+        Args:
+            row_order: (파일명, 시트명) -> 정렬 키. 시트를 읽은 순서가 파일 순서와 다를 때
+                       (건너뛴 시트를 나중에 다시 읽은 경우) 전체 업데이트와 같은 순서로 맞춥니다.
+
+        Returns:
+            {STRING_ID: [중복 항목 레코드, ...]}
+        """
+        cursor.execute("CREATE INDEX IF NOT EXISTS temp.idx_translation_staging_sid ON translation_staging (string_id)")
+        duplicate_ids = f"SELECT string_id FROM {self.STAGING_TABLE} GROUP BY string_id HAVING COUNT(*) > 1"
+        cursor.execute(f'''
+        SELECT file_name, sheet_name, string_id, kr, en, cn, tw, th, status
+        FROM {self.STAGING_TABLE}
+        WHERE string_id IN ({duplicate_ids})
+        ORDER BY seq''')
+        rows = cursor.fetchall()
+        if row_order is not None:
+            rows.sort(key=lambda row: row_order(row[0], row[1]))    # 안정 정렬이므로 시트 안에서는 seq 순서 유지
+
+        first_entries = {}
+        duplicate_data_preview = {}
+        for row in rows:
+            string_id = row[2]
+            entry = self._duplicate_entry(row)
+            if string_id in duplicate_data_preview:
+                duplicate_data_preview[string_id].append(entry)
+            elif string_id in first_entries:
+                # 두 번째로 나온 시점에 중복으로 분류 (기존 방식과 같은 키 순서)
+                duplicate_data_preview[string_id] = [first_entries.pop(string_id), entry]
+            else:
+                first_entries[string_id] = entry
+        if duplicate_data_preview:
+            cursor.execute(f"DELETE FROM {self.STAGING_TABLE} WHERE string_id IN ({duplicate_ids})")
+        return duplicate_data_preview
+
+    @staticmethod
+    def _duplicate_entry(data_tuple):
+        """unique_data 튜플을 중복 미리보기용 레코드로 변환합니다."""
+        return TranslationRecord(
+            file_name=data_tuple[0], sheet_name=data_tuple[1], string_id=data_tuple[2],
+            kr=data_tuple[3], en=data_tuple[4], cn=data_tuple[5],
+            tw=data_tuple[6], th=data_tuple[7], status=data_tuple[8]
+        )
+
+    def _iter_file_rows(self, excel_files, language_list, language_mapping, require_languages, use_read_only, max_workers, progress_callback, message, sheet_filters=None):
+        """
+        파일별 String 시트 행을 excel_files 순서대로 반환합니다.
+        max_workers가 2 이상이면 작업 프로세스들이 파일을 나눠 읽고, 결과는 항상 입력 순서로 병합됩니다.
+        sheet_filters({파일명: 시트명 집합})가 있으면 파일마다 해당 시트만 읽습니다.
+
+        Yields:
+            (파일 인덱스, 파일명, 배치 목록 또는 None, 오류 메시지 또는 None)
+        """
+        total = len(excel_files)
+        worker_count = min(max_workers or 1, total)
+        sheet_filters = sheet_filters or {}
+
+        if worker_count <= 1:
+            for idx, (file_name, file_path) in enumerate(excel_files):
+                if progress_callback:
+                    progress_callback(message.format(current=idx + 1, total=total, file_name=file_name), idx, total)
+                try:
+                    gc.collect()
+                    yield idx, file_name, read_string_rows(file_path, language_list, language_mapping, require_languages, use_read_only, sheet_filters.get(file_name)), None
+                except Exception as e:
+                    yield idx, file_name, None, str(e)
+            return
+
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(read_string_rows, file_path, language_list, language_mapping, require_languages, use_read_only, sheet_filters.get(file_name))
+                for file_name, file_path in excel_files
+            ]
+            for idx, (file_name, _) in enumerate(excel_files):
+                if progress_callback:
+                    progress_callback(message.format(current=idx + 1, total=total, file_name=file_name), idx, total)
+                # 넘겨준 결과는 Future에서 참조를 끊어 파일 단위로 메모리를 해제
+                future, futures[idx] = futures[idx], None
+                try:
+                    yield idx, file_name, future.result(), None
+                except Exception as e:
+                    yield idx, file_name, None, str(e)
+
     def create_translation_table(self, cursor, table_name="translation_data"):
         """번역 테이블 생성 (상태 및 업데이트 날짜 포함)"""
         cursor.execute(f'''
@@ -160,158 +285,325 @@ class TranslationDBManager:
         cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table_name}_string_id ON {table_name}(string_id)')
         cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table_name}_file_sheet ON {table_name}(file_name, sheet_name)')
         cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table_name}_status ON {table_name}(status)')
+        self._create_kr_index(cursor, table_name)
 
-    def update_translation_db(self, excel_files, db_path, language_list, batch_size=2000, use_read_only=True, progress_callback=None, update_option="default", debug_string_id=None):
+    def _create_kr_index(self, cursor, table_name="translation_data"):
+        """
+        [신규] KR 기준 업데이트(kr_compare, kr_additional_compare)용 KR 인덱스를 만듭니다.
+        KR 일치 조회가 전체 테이블 스캔 대신 STRING_ID 조회처럼 인덱스 탐색으로 처리됩니다.
+        """
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table_name}_kr ON {table_name}(kr)')
+
+    def update_translation_db(self, excel_files, db_path, language_list, batch_size=2000, use_read_only=True, progress_callback=None, update_option="default", debug_string_id=None, max_workers=1, skip_unchanged=True):
         if not excel_files: return {"status": "error", "message": "번역 파일이 선택되지 않았습니다."}
         if not db_path or not os.path.exists(db_path): return {"status": "error", "message": "유효한 DB 파일 경로를 지정하세요."}
         if not language_list: return {"status": "error", "message": "하나 이상의 언어를 선택하세요."}
 
-        language_mapping = {"ZH": "CN"}
+        language_mapping = LANGUAGE_ALIASES
         conn = None
         try:
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
             self._update_table_schema(cursor)
+            self._create_fingerprint_table(cursor)
+
+            # [신규] 시트 지문 비교: 지난 업데이트 이후 바뀌지 않은 시트는 읽지 않음
+            current_fingerprints = self._compute_fingerprints(excel_files)
+            sheet_filters, unchanged_sheets = {}, {}
+            if skip_unchanged:
+                sheet_filters, unchanged_sheets = self._plan_changed_sheets(
+                    cursor, excel_files, current_fingerprints, language_list, update_option
+                )
+            files_to_read = [(name, path) for name, path in excel_files
+                             if name not in sheet_filters or sheet_filters[name]]
+            if progress_callback and unchanged_sheets:
+                progress_callback(f"변경 없는 시트 {len(unchanged_sheets)}개 건너뜀", 0, len(excel_files))
             
-            # 중복 데이터와 고유 데이터 분리
-            unique_excel_data, duplicate_data_preview = self._collect_and_filter_excel_data(
-                excel_files, language_list, language_mapping, progress_callback, debug_string_id
-            )
-            
-            db_data_map = self._load_existing_data(cursor, update_option)
-            updates, inserts = [], []
+            # [개선] 엑셀 행을 batch_size 단위로 스테이징 테이블에 기록 (DB 전체를 메모리에 읽지 않음)
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            # 고유 데이터만으로 업데이트/삽입 목록 생성
-            for key, excel_data in unique_excel_data.items():
-                status = excel_data.get('status', 'active')
-                
-                # DB에 키가 있는지 확인
-                if key in db_data_map:
-                    db_row = db_data_map[key]
-                    if self._is_update_needed(excel_data, db_row, language_list, update_option, status):
-                        excel_data.update({'key': key, 'status': status, 'update_date': current_time})
-                        updates.append(excel_data)
-                else:
-                    excel_data.update({'status': status, 'update_date': current_time})
-                    inserts.append(excel_data)
-
-            # 배치 처리
-            updated_row_count = self._execute_batch_update(cursor, updates, language_list, update_option)
-            new_row_count = self._execute_batch_insert(cursor, inserts, language_list)
-
+            self._create_staging_table(cursor)
+            pending_rows = []
+            batch_size = max(int(batch_size or 0), 1)
+            sheet_string_ids = {}
+            file_results = self._iter_file_rows(
+                files_to_read, language_list, language_mapping, False, use_read_only, max_workers,
+                progress_callback, "파일 데이터 수집 중 ({current}/{total}) {file_name}...", sheet_filters
+            )
+            for idx, file_name, batches, error in file_results:
+                if error is not None:
+                    raise Exception(f"{file_name}: {error}")
+                sheet_string_ids.update(self._stage_file_rows(
+                    cursor, intern_text(file_name), batches, language_list, current_time, pending_rows, batch_size
+                ))
+            self._flush_staging_rows(cursor, pending_rows)
+
+            # 건너뛴 시트 중 STRING_ID가 다른 시트와 겹치는 시트는 다시 읽어 전체 업데이트와 같은 중복 목록을 만듦
+            row_order = None
+            reread_filters = self._unchanged_sheets_to_reread(cursor, unchanged_sheets)
+            if reread_filters:
+                reread_results = self._iter_file_rows(
+                    [(name, path) for name, path in excel_files if name in reread_filters],
+                    language_list, language_mapping, False, use_read_only, max_workers,
+                    progress_callback, "중복 확인용 시트 다시 읽는 중 ({current}/{total}) {file_name}...", reread_filters
+                )
+                for idx, file_name, batches, error in reread_results:
+                    if error is not None:
+                        raise Exception(f"{file_name}: {error}")
+                    sheet_string_ids.update(self._stage_file_rows(
+                        cursor, intern_text(file_name), batches, language_list, current_time, pending_rows, batch_size
+                    ))
+                self._flush_staging_rows(cursor, pending_rows)
+                for file_name, sheet_names in reread_filters.items():
+                    for sheet_name in sheet_names:
+                        unchanged_sheets.pop((file_name, sheet_name), None)
+                row_order = self._full_read_order(excel_files, current_fingerprints)
+
+            # 중복 데이터는 스테이징 테이블에서 분리
+            duplicate_data_preview = self._resolve_staging_duplicates(cursor, row_order)
+            if debug_string_id:
+                self._debug_staged_row(cursor, debug_string_id, update_option)
+
+            # 업데이트 옵션별 SQL 한 번으로 변경된 행만 갱신/삽입 (변경 내용은 리비전 로그에 기록)
+            revision_id = begin_revision(cursor, SOURCE_UPDATE, f"DB 업데이트 ({len(files_to_read)}개 파일, {update_option})",
+                                         timestamp=current_time)
+            updated_row_count, new_row_count = self._upsert_from_staging(cursor, language_list, update_option)
+            finish_revision(cursor, revision_id)
+            cursor.execute(f"DROP TABLE {self.STAGING_TABLE}")
+
+            self._save_fingerprints(cursor, files_to_read, current_fingerprints, sheet_string_ids, language_list, update_option, current_time,
+                                    unchanged_sheets)
             conn.commit()
             return {
                 "status": "success", "processed_count": len(excel_files), "error_count": 0,
                 "total_rows": updated_row_count + new_row_count, "updated_rows": updated_row_count, "new_rows": new_row_count,
-                "deleted_rows": 0, "duplicates": dict(duplicate_data_preview)
+                "deleted_rows": 0, "skipped_sheets": len(unchanged_sheets), "duplicates": dict(duplicate_data_preview),
+                "revision_id": revision_id
             }
         except Exception as e:
             return {"status": "error", "message": str(e)}
         finally:
             if conn: conn.close()
 
-    def _collect_and_filter_excel_data(self, excel_files, language_list, language_mapping, progress_callback, debug_string_id):
-        unique_data = {}
-        duplicate_data_preview = defaultdict(list)
+    # --- [신규] 시트 지문 (변경 없는 시트 건너뛰기) ---
+    FINGERPRINT_ANY_OPTION = "*"
+
+    def _create_fingerprint_table(self, cursor):
+        """시트별 지문 테이블 생성 (string_ids: 해당 시트의 STRING_ID 목록 JSON, 중복 판단용)"""
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS sheet_fingerprints (
+            file_name TEXT, sheet_name TEXT, fingerprint TEXT,
+            languages TEXT, update_option TEXT, string_ids TEXT, update_date TEXT,
+            PRIMARY KEY (file_name, sheet_name)
+        )''')
+
+    def _compute_fingerprints(self, excel_files):
+        """{파일명: {시트명: 지문}} - 지문을 계산할 수 없는 파일은 빈 딕셔너리"""
+        fingerprints = {}
+        for file_name, file_path in excel_files:
+            try:
+                fingerprints[file_name] = sheet_fingerprints(file_path)
+            except Exception:
+                fingerprints[file_name] = {}
+        return fingerprints
+
+    def _plan_changed_sheets(self, cursor, excel_files, current_fingerprints, language_list, update_option):
+        """
+        저장된 지문과 비교해 파일별로 다시 읽을 시트를 정합니다.
+
+        Returns:
+            (sheet_filters {파일명: 읽을 시트명 집합}, 변경 없는 시트 {(파일명, 시트명): STRING_ID 목록})
+            저장된 지문이 없는 파일은 sheet_filters에 넣지 않아 전체 시트를 읽습니다.
+        """
+        languages = ",".join(sorted(lang.upper() for lang in language_list))
+        stored = defaultdict(dict)
+        cursor.execute(
+            "SELECT file_name, sheet_name, fingerprint, string_ids FROM sheet_fingerprints WHERE languages = ? AND update_option IN (?, ?)",
+            (languages, update_option, self.FINGERPRINT_ANY_OPTION)
+        )
+        for file_name, sheet_name, fingerprint, string_ids in cursor.fetchall():
+            stored[file_name][sheet_name] = (fingerprint, string_ids)
 
-        for idx, (file_name, file_path) in enumerate(excel_files):
-            if progress_callback:
-                progress_callback(f"파일 데이터 수집 중 ({idx+1}/{len(excel_files)}) {file_name}...", idx, len(excel_files))
+        sheet_filters, unchanged_sheets = {}, {}
+        for file_name, _ in excel_files:
+            fingerprints = current_fingerprints.get(file_name)
+            if not fingerprints or file_name not in stored:
+                continue
+            changed = set()
+            for sheet_name, fingerprint in fingerprints.items():
+                stored_fingerprint, string_ids = stored[file_name].get(sheet_name, (None, None))
+                if stored_fingerprint == fingerprint:
+                    unchanged_sheets[(file_name, sheet_name)] = json.loads(string_ids or "[]")
+                else:
+                    changed.add(sheet_name)
+            sheet_filters[file_name] = changed
+        return sheet_filters, unchanged_sheets
+
+    def _save_fingerprints(self, cursor, read_files, current_fingerprints, sheet_string_ids, language_list, update_option, current_time,
+                           unchanged_sheets=None):
+        """
+        이번에 읽은 파일의 시트 지문과 STRING_ID 목록을 저장합니다.
+        같은 파일에서 건너뛴 시트는 저장돼 있던 STRING_ID 목록을 그대로 유지합니다.
+        """
+        self._create_fingerprint_table(cursor)
+        sheet_string_ids = {**(unchanged_sheets or {}), **sheet_string_ids}
+        languages = ",".join(sorted(lang.upper() for lang in language_list))
+        cursor.executemany(
+            "INSERT OR REPLACE INTO sheet_fingerprints (file_name, sheet_name, fingerprint, languages, update_option, string_ids, update_date) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(file_name, sheet_name, fingerprint, languages, update_option,
+              json.dumps(sheet_string_ids.get((file_name, sheet_name), []), ensure_ascii=False), current_time)
+             for file_name, _ in read_files
+             for sheet_name, fingerprint in current_fingerprints.get(file_name, {}).items()]
+        )
 
-            workbook = load_workbook(file_path, read_only=True, data_only=True)
-            for sheet_name in workbook.sheetnames:
-                if not sheet_name.lower().startswith('string') or sheet_name.startswith("#"):
-                    continue
-                worksheet = workbook[sheet_name]
-                string_id_col, header_row = self.find_string_id_position(worksheet)
-                if not string_id_col or not header_row: continue
-                lang_cols = self.find_language_columns(worksheet, header_row, language_list, language_mapping)
-
-                for row_cells in worksheet.iter_rows(min_row=header_row + 1, values_only=True):
-                    if not row_cells or string_id_col - 1 >= len(row_cells): continue
-                    string_id = row_cells[string_id_col - 1]
-                    if not string_id: continue
-                    
-                    status = '비활성' if str(row_cells[0] or '').strip().startswith('#') else 'active'
-                    
-                    excel_data = {'string_id': string_id, 'file_name': file_name, 'sheet_name': sheet_name, 'status': status}
-                    for lang, col in lang_cols.items():
-                        if col - 1 < len(row_cells):
-                            excel_data[lang.lower()] = row_cells[col - 1]
-                    
-                    if string_id not in unique_data and string_id not in duplicate_data_preview:
-                        unique_data[string_id] = excel_data
-                    elif string_id in unique_data:
-                        duplicate_data_preview[string_id].extend([unique_data.pop(string_id), excel_data])
-                    else:
-                        duplicate_data_preview[string_id].append(excel_data)
-            workbook.close()
-        return unique_data, duplicate_data_preview
-
-    def _is_update_needed(self, excel_data, db_row, language_list, update_option, new_status):
-        if db_row.get('status') != new_status: return True
-        
-        update_langs = language_list.copy()
-        if update_option in ['default', 'kr_additional_compare'] and 'KR' in update_langs:
-            update_langs.remove('KR')
-
-        for lang in update_langs:
-            lang_key = lang.lower()
-            excel_val = str(excel_data.get(lang_key) or '').strip()
-            db_val = str(db_row.get(lang_key) or '').strip()
-            if excel_val != db_val: return True
+    def _unchanged_sheets_to_reread(self, cursor, unchanged_sheets):
+        """
+        건너뛴 시트 중 STRING_ID가 다른 시트(이번에 읽은 시트 또는 다른 건너뛴 시트)와 겹치는 시트를 찾습니다.
+        중복 항목에는 시트의 실제 값이 필요하므로 이런 시트는 다시 읽어야 합니다.
+
+        Returns:
+            {파일명: 다시 읽을 시트명 집합}
+        """
+        if not unchanged_sheets:
+            return {}
+        counts = defaultdict(int)
+        for string_ids in unchanged_sheets.values():
+            for sid in string_ids:
+                counts[sid] += 1
+        cursor.execute(f"SELECT string_id FROM {self.STAGING_TABLE}")
+        for (sid,) in cursor:
+            if sid in counts:
+                counts[sid] += 1
+        reread = defaultdict(set)
+        for (file_name, sheet_name), string_ids in unchanged_sheets.items():
+            if any(counts[sid] > 1 for sid in string_ids):
+                reread[file_name].add(sheet_name)
+        return dict(reread)
+
+    @staticmethod
+    def _full_read_order(excel_files, current_fingerprints):
+        """전체 업데이트에서 행이 읽히는 순서 키 (파일 순서, 시트 순서)를 반환하는 함수"""
+        file_positions = {file_name: idx for idx, (file_name, _) in enumerate(excel_files)}
+        sheet_positions = {
+            (file_name, sheet_name): idx
+            for file_name, fingerprints in current_fingerprints.items()
+            for idx, sheet_name in enumerate(fingerprints)
+        }
+        return lambda file_name, sheet_name: (file_positions.get(file_name, len(file_positions)),
+                                              sheet_positions.get((file_name, sheet_name), 0))
+
+    # --- [신규] 스테이징 테이블 기반 UPSERT ---
+    # Python str.strip()과 같이 앞뒤 공백/제어 공백/전각 공백을 제거
+    _TRIM_CHARS = "char(32, 9, 10, 11, 12, 13, 160, 12288)"
+
+    def _trimmed(self, expr):
+        """None/빈 값은 ''로, 나머지는 문자열로 바꿔 앞뒤 공백을 제거하는 SQL 식"""
+        return f"trim(COALESCE(CAST({expr} AS TEXT), ''), {self._TRIM_CHARS})"
+
+    def _has_unique_string_id(self, cursor):
+        """translation_data에 string_id 단일 컬럼 UNIQUE 제약이 있는지 확인합니다. (ON CONFLICT 대상)"""
+        cursor.execute("PRAGMA index_list(translation_data)")
+        for index in cursor.fetchall():
+            if not index[2]:
+                continue
+            cursor.execute(f'PRAGMA index_info("{index[1]}")')
+            if [info[2] for info in cursor.fetchall()] == ['string_id']:
+                return True
         return False
-        
-    def _load_existing_data(self, cursor, update_option):
-        cursor.execute("SELECT * FROM translation_data")
-        db_data_map = {}
-        for row in cursor.fetchall():
-            row_dict = {desc[0]: value for desc, value in zip(cursor.description, row)}
-            key = None
-            if update_option == "kr_compare":
-                if row_dict.get('kr'): key = row_dict['kr']
-            elif update_option == "kr_additional_compare":
-                if row_dict.get('string_id') and row_dict.get('kr'): key = (row_dict['string_id'], row_dict['kr'])
-            else: key = row_dict.get('string_id')
-            if key and key not in db_data_map:
-                db_data_map[key] = row_dict
-        return db_data_map
-
-    def _execute_batch_update(self, cursor, updates, language_list, update_option):
-        if not updates: return 0
-        update_cols = [lang.lower() for lang in language_list]
-        if update_option in ["default", "kr_additional_compare"] and 'kr' in update_cols:
-            update_cols.remove('kr')
-        if update_option == "kr_compare" and 'string_id' not in update_cols:
-            update_cols.append('string_id')
-        set_clause = ", ".join([f"{col} = :{col}" for col in update_cols])
-        set_clause += ", status = :status, update_date = :update_date, file_name = :file_name, sheet_name = :sheet_name"
-        
-        where_clause = ""
-        if update_option == "kr_compare": where_clause = "WHERE kr = :key"
-        elif update_option == "kr_additional_compare": where_clause = "WHERE string_id = :key0 AND kr = :key1"
-        else: where_clause = "WHERE string_id = :key"
-
-        query = f"UPDATE translation_data SET {set_clause} {where_clause}"
-        update_params = []
-        for item in updates:
-            params = item.copy()
+
+    def _upsert_from_staging(self, cursor, language_list, update_option):
+        """
+        스테이징 테이블의 고유 행을 translation_data에 반영합니다.
+
+        업데이트 옵션별 일치 기준과 갱신 컬럼:
+        - default: STRING_ID 일치, KR 제외 언어 갱신
+        - kr_additional_compare: STRING_ID + KR 일치, KR 제외 언어 갱신
+        - kr_compare: KR 일치, STRING_ID와 모든 언어 갱신
+        상태 또는 (앞뒤 공백 제외) 언어 값이 다른 행만 갱신하고, 일치하는 행이 없으면 삽입합니다.
+        시트에 없는 언어 컬럼은 기존 값을 유지합니다.
+
+        Returns:
+            (갱신된 행 수, 삽입된 행 수)
+        """
+        langs = [lang.lower() for lang in language_list if lang.lower() in self.STAGING_LANGUAGES]
+        compare_langs = [lang for lang in langs if not (update_option != "kr_compare" and lang == 'kr')]
+        insert_cols = ['file_name', 'sheet_name', 'string_id', 'status', 'update_date'] + langs
+        staging = self.STAGING_TABLE
+
+        def staged_value(lang, existing):
+            bit = 1 << self.STAGING_LANGUAGES.index(lang)
+            return f"CASE WHEN s.missing & {bit} THEN {existing} ELSE s.{lang} END"
+
+        def changed(source_status, source_value):
+            conditions = [f"translation_data.status IS NOT {source_status}"]
+            conditions += [f"{self._trimmed(f'translation_data.{lang}')} <> {self._trimmed(source_value(lang))}" for lang in compare_langs]
+            return " OR ".join(conditions)
+
+        if update_option != "kr_compare" and self._has_unique_string_id(cursor):
+            # STRING_ID 충돌을 이용한 단일 UPSERT
+            select_cols = ['s.file_name', 's.sheet_name', 's.string_id', 's.status', 's.update_date'] + [
+                staged_value(lang, f"(SELECT t.{lang} FROM translation_data t WHERE t.string_id = s.string_id)")
+                for lang in langs
+            ]
+            set_cols = compare_langs + ['status', 'update_date', 'file_name', 'sheet_name']
+            where = f"({changed('excluded.status', lambda lang: f'excluded.{lang}')})"
             if update_option == "kr_additional_compare":
-                params['key0'], params['key1'] = item['key']
-            update_params.append(params)
+                where = f"translation_data.kr = excluded.kr AND {where}"
+
+            cursor.execute("SELECT COALESCE(MAX(rowid), 0) FROM translation_data")
+            last_rowid = cursor.fetchone()[0]
+            cursor.execute(f'''
+            INSERT INTO translation_data ({', '.join(insert_cols)})
+            SELECT {', '.join(select_cols)} FROM {staging} s WHERE true ORDER BY s.seq
+            ON CONFLICT(string_id) DO UPDATE SET {', '.join(f"{col} = excluded.{col}" for col in set_cols)}
+            WHERE {where}''')
+            changed_rows = cursor.rowcount
+            cursor.execute("SELECT COUNT(*) FROM translation_data WHERE rowid > ?", (last_rowid,))
+            new_rows = cursor.fetchone()[0]
+            return changed_rows - new_rows, new_rows
+
+        # KR 기준(또는 STRING_ID UNIQUE 제약이 없는 DB): 일치 행 갱신 후 없는 행만 삽입
+        if update_option == "kr_compare":
+            match = "translation_data.kr = s.kr"
+            # 같은 KR이 여러 행이면 마지막 행 기준 (기존 순차 갱신과 동일)
+            source = f"(SELECT * FROM {staging} WHERE seq IN (SELECT MAX(seq) FROM {staging} GROUP BY kr))"
+            set_cols = compare_langs + ['string_id']
+        else:
+            match = "translation_data.string_id = s.string_id"
+            if update_option == "kr_additional_compare":
+                match += " AND translation_data.kr = s.kr"
+            source = staging
+            set_cols = compare_langs
+        def source_value(lang):
+            return staged_value(lang, f"translation_data.{lang}")
+
+        set_clause = [f"{col} = {source_value(col)}" if col in langs else f"{col} = s.{col}" for col in set_cols]
+        set_clause += ["status = s.status", "update_date = s.update_date", "file_name = s.file_name", "sheet_name = s.sheet_name"]
+        cursor.execute(f'''
+        UPDATE OR IGNORE translation_data SET {', '.join(set_clause)}
+        FROM {source} s
+        WHERE {match} AND ({changed('s.status', source_value)})''')
+        updated_rows = cursor.rowcount
 
-        cursor.executemany(query, update_params)
-        return cursor.rowcount
+        insert_values = ['s.file_name', 's.sheet_name', 's.string_id', 's.status', 's.update_date'] + [f"s.{lang}" for lang in langs]
+        cursor.execute(f'''
+        INSERT OR IGNORE INTO translation_data ({', '.join(insert_cols)})
+        SELECT {', '.join(insert_values)} FROM {staging} s
+        WHERE NOT EXISTS (SELECT 1 FROM translation_data WHERE {match})
+        ORDER BY s.seq''')
+        return updated_rows, cursor.rowcount
+
+    def _debug_staged_row(self, cursor, debug_string_id, update_option):
+        """디버깅 대상 STRING_ID의 스테이징 값과 DB 값을 출력합니다."""
+        print("\n" + "="*60)
+        print(f"DEBUG: STRING_ID '{debug_string_id}' 추적 (업데이트 옵션: {update_option})")
+        cursor.execute(f"SELECT * FROM {self.STAGING_TABLE} WHERE string_id = ?", (debug_string_id,))
+        names = [desc[0] for desc in cursor.description]
+        print(f"엑셀에서 추출한 데이터: {[dict(zip(names, row)) for row in cursor.fetchall()]}")
+        cursor.execute("SELECT * FROM translation_data WHERE string_id = ?", (debug_string_id,))
+        names = [desc[0] for desc in cursor.description]
+        print(f"DB에서 찾은 기존 데이터: {[dict(zip(names, row)) for row in cursor.fetchall()]}")
+        print("="*60 + "\n")
 
-    def _execute_batch_insert(self, cursor, inserts, language_list):
-        if not inserts: return 0
-        cols = ['file_name', 'sheet_name', 'string_id', 'status', 'update_date'] + [lang.lower() for lang in language_list]
-        placeholders = ", ".join([f":{col}" for col in cols])
-        query = f"INSERT OR IGNORE INTO translation_data ({', '.join(cols)}) VALUES ({placeholders})"
-        cursor.executemany(query, inserts)
-        return cursor.rowcount
-                     
     def _update_table_schema(self, cursor):
         """테이블 스키마 업데이트 (status, update_date 컬럼 추가)"""
         try:
@@ -368,6 +660,7 @@ class TranslationDBManager:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_file_sheet ON translation_data(file_name, sheet_name)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_status ON translation_data(status)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_update_date ON translation_data(update_date)')
+            self._create_kr_index(cursor)
             
         except Exception as e:
             print(f"스키마 업데이트 오류: {e}")
@@ -436,77 +729,26 @@ class TranslationDBManager:
                 print(f"배치 처리 오류: {e}")
                 continue
    
-    def load_translation_cache(self, db_path):
-        """번역 DB를 메모리에 캐싱 (활성 상태만)"""
+    def load_translation_cache(self, db_path, use_snapshot=True):
+        """
+        번역 DB를 메모리에 캐싱 (활성 상태만)
+
+        [개선] 행 저장소 하나와 파일/시트/STRING_ID 인덱스 맵으로 구성된 TranslationCache를 사용하고,
+        DB가 바뀌지 않았다면 작업 폴더의 temp_db/translation_cache/ 아래 스냅샷(.cache)에서 바로 불러옵니다.
+        """
         try:
-            # DB 연결
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 활성 상태의 데이터만 로드
-            cursor.execute("SELECT * FROM translation_data WHERE status = 'active'")
-            rows = cursor.fetchall()
-            
-            # 3단계 캐싱 구조 구성
-            translation_cache = {}              # STRING_ID만 (3순위)
-            translation_file_cache = {}         # 파일명 + STRING_ID (1순위)
-            translation_sheet_cache = {}        # 시트명 + STRING_ID (2순위)
-            
-            # 중복 STRING_ID 추적용
-            duplicate_ids = {}
-            
-            for row in rows:
-                file_name = row["file_name"]
-                sheet_name = row["sheet_name"]
-                string_id = row["string_id"]
-                
-                # 중복 STRING_ID 추적
-                if string_id not in duplicate_ids:
-                    duplicate_ids[string_id] = []
-                duplicate_ids[string_id].append(file_name)
-                
-                # 데이터 딕셔너리 생성
-                data = {
-                    "kr": row["kr"],
-                    "en": row["en"],
-                    "cn": row["cn"],
-                    "tw": row["tw"],
-                    "th": row["th"],
-                    "file_name": file_name,
-                    "sheet_name": sheet_name
-                }
-                
-                # 1. 파일명 + STRING_ID 캐싱 (1순위)
-                norm_file_name = file_name.lower()
-                if norm_file_name not in translation_file_cache:
-                    translation_file_cache[norm_file_name] = {}
-                
-                if string_id not in translation_file_cache[norm_file_name]:
-                    translation_file_cache[norm_file_name][string_id] = data
-                
-                # 2. 시트명 + STRING_ID 캐싱 (2순위)
-                norm_sheet_name = sheet_name.lower()
-                if norm_sheet_name not in translation_sheet_cache:
-                    translation_sheet_cache[norm_sheet_name] = {}
-                
-                if string_id not in translation_sheet_cache[norm_sheet_name]:
-                    translation_sheet_cache[norm_sheet_name][string_id] = data
-                
-                # 3. STRING_ID만 캐싱 (3순위)
-                translation_cache[string_id] = data
-            
-            conn.close()
-            
-            # 결과 반환
+            cache, from_snapshot = load_cached_translations(db_path, use_snapshot)
             return {
-                "translation_cache": translation_cache,
-                "translation_file_cache": translation_file_cache,
-                "translation_sheet_cache": translation_sheet_cache,
-                "duplicate_ids": duplicate_ids,
-                "file_count": len(translation_file_cache),
-                "sheet_count": len(translation_sheet_cache),
-                "id_count": len(translation_cache)
+                "status": "success",
+                "cache": cache,
+                "from_snapshot": from_snapshot,
+                "translation_cache": cache.translation_cache,                # STRING_ID만 (3순위)
+                "translation_file_cache": cache.translation_file_cache,      # 파일명 + STRING_ID (1순위)
+                "translation_sheet_cache": cache.translation_sheet_cache,    # 시트명 + STRING_ID (2순위)
+                "duplicate_ids": cache.duplicate_ids,                        # 여러 행에 나온 STRING_ID -> 파일명 목록
+                "file_count": len(cache.translation_file_cache),
+                "sheet_count": len(cache.translation_sheet_cache),
+                "id_count": len(cache.translation_cache)
             }
             
         except Exception as e:
@@ -515,29 +757,29 @@ class TranslationDBManager:
                 "message": str(e)
             }
 
+    def export_translation_snapshot(self, db_path, output_path=None):
+        """
+        [신규] 활성 번역 데이터를 mmap 공유용 컬럼형 스냅샷 파일로 내보냅니다.
+        (utils.translation_snapshot 형식, 기본 경로는 DB 파일명.snapshot)
+        """
+        if not db_path or not os.path.exists(db_path): return {"status": "error", "message": "유효한 DB 파일 경로를 지정하세요."}
+        try:
+            result = export_db_snapshot(db_path, output_path)
+            return {"status": "success", "snapshot_path": result["path"], "total_rows": result["rows"]}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
     def _process_single_excel_for_update(self, file_path, file_name, language_list, language_mapping, db_data_map, update_option, updates, inserts, debug_string_id=None):
         """단일 엑셀 파일을 순회하며 업데이트/삽입할 데이터를 수집합니다. (수정된 버전)"""
         workbook = load_workbook(file_path, read_only=True, data_only=True)
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        for sheet_name in workbook.sheetnames:
-            if not sheet_name.lower().startswith('string') or sheet_name.startswith("#"):
-                continue
-
-            worksheet = workbook[sheet_name]
-            string_id_col, header_row = self.find_string_id_position(worksheet)
-            if not string_id_col or not header_row: continue
-
-            lang_cols = self.find_language_columns(worksheet, header_row, language_list, language_mapping)
-            if not lang_cols: continue
-
-            print(f"파일 {file_name}에서 발견된 언어 컬럼: {lang_cols}")
-
-            for row_cells in worksheet.iter_rows(min_row=header_row + 1, values_only=True):
-                if not row_cells or string_id_col - 1 >= len(row_cells): continue
+        for sheet_name, sheet in iter_string_sheets(workbook, language_list, require_languages=True, aliases=language_mapping):
+            print(f"파일 {file_name}에서 발견된 언어 컬럼: {sheet.columns}")
+            lang_keys = [lang.lower() for lang in sheet.fields]
 
-                string_id = row_cells[string_id_col - 1]
-                if not string_id: continue
+            for row in sheet.rows():
+                string_id = row.string_id
 
                 # 디버깅 ID와 일치하는 경우, 상세 로그
                 is_debug_target = (string_id == debug_string_id)
@@ -547,18 +789,14 @@ class TranslationDBManager:
                     print(f"파일: {file_name}, 시트: {sheet_name}")
                     print("="*60)
 
-                # 엑셀 데이터 추출 (표준화된 키 사용)
+                # 엑셀 데이터 추출 (모든 언어 키를 소문자로 통일)
                 excel_data = {'string_id': string_id}
-                for lang, col_idx in lang_cols.items():
-                    if col_idx - 1 < len(row_cells):
-                        # 모든 언어 키를 소문자로 통일
-                        lang_key = lang.lower()
-                        excel_data[lang_key] = row_cells[col_idx - 1]
+                excel_data.update(zip(lang_keys, row.values))
 
                 if is_debug_target:
                     print(f"엑셀에서 추출한 데이터: {excel_data}")
 
-                status = '비활성' if str(row_cells[0] or '').strip().startswith('#') else 'active'
+                status = row.status
 
                 # 키 생성
                 key = None
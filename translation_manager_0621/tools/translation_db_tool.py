@@ -32,6 +32,8 @@ class TranslationDBTool(tk.Frame):
         self.update_db_var = tk.StringVar()
         self.batch_size_var = tk.IntVar(value=500)
         self.read_only_var = tk.BooleanVar(value=True)
+        self.max_workers_var = tk.IntVar(value=1)
+        self.skip_unchanged_var = tk.BooleanVar(value=True)
         self.available_languages = ["KR", "EN", "CN", "TW", "TH"]
         self.lang_vars = {}
         
@@ -86,6 +88,12 @@ class TranslationDBTool(tk.Frame):
         ttk.Button(db_update_frame, text="찾아보기", command=self.select_update_db_file).grid(row=0, column=2, padx=5, pady=5)
         db_update_frame.columnconfigure(1, weight=1)
         
+        worker_frame = ttk.Frame(output_frame)
+        worker_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Label(worker_frame, text="병렬 처리 수:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        ttk.Spinbox(worker_frame, from_=1, to=os.cpu_count() or 1, textvariable=self.max_workers_var, width=5).grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        ttk.Label(worker_frame, text="(1 = 순차 처리, 2 이상 = 파일을 여러 프로세스로 나눠 읽기)").grid(row=0, column=2, padx=5, pady=5, sticky="w")
+        
         # --- 3. 추출 및 업데이트 옵션 ---
         languages_frame = ttk.LabelFrame(self, text="추출할 언어")
         languages_frame.pack(fill="x", padx=5, pady=5)
@@ -100,6 +108,7 @@ class TranslationDBTool(tk.Frame):
         ttk.Radiobutton(update_options_frame, text="KR 추가 비교 (STRING_ID + KR 기준)", variable=self.update_option, value="kr_additional_compare").pack(anchor="w", padx=5)
         ttk.Radiobutton(update_options_frame, text="KR 비교 (KR 기준)", variable=self.update_option, value="kr_compare").pack(anchor="w", padx=5)
         ttk.Radiobutton(update_options_frame, text="KR 덮어쓰기 (STRING_ID 기준, KR 포함)", variable=self.update_option, value="kr_overwrite").pack(anchor="w", padx=5)
+        ttk.Checkbutton(update_options_frame, text="변경된 시트만 업데이트 (해제 시 전체 시트 다시 비교)", variable=self.skip_unchanged_var).pack(anchor="w", padx=5, pady=(5, 0))
         
         # --- 4. 실행 버튼 ---
         action_frame = ttk.Frame(self)
@@ -221,7 +230,8 @@ class TranslationDBTool(tk.Frame):
         def build_db_thread():
             try:
                 result = self.db_manager.build_translation_db(
-                    excel_files, db_path, selected_langs, self.batch_size_var.get(), self.read_only_var.get(), progress_callback
+                    excel_files, db_path, selected_langs, self.batch_size_var.get(), self.read_only_var.get(), progress_callback,
+                    max_workers=self.max_workers_var.get()
                 )
                 self.after(0, lambda: self.process_db_build_result(result, loading_popup, start_time))
             except Exception as e:
@@ -307,7 +317,8 @@ class TranslationDBTool(tk.Frame):
                     excel_files=excel_files, db_path=db_path, language_list=selected_langs, 
                     batch_size=self.batch_size_var.get(), use_read_only=self.read_only_var.get(), 
                     progress_callback=progress_callback, update_option=selected_option,
-                    debug_string_id=debug_id if debug_id else None
+                    debug_string_id=debug_id if debug_id else None, max_workers=self.max_workers_var.get(),
+                    skip_unchanged=self.skip_unchanged_var.get()
                 )
                 self.after(0, lambda: self.process_db_update_result(result, loading_popup, start_time))
             except Exception as e:
@@ -337,6 +348,8 @@ class TranslationDBTool(tk.Frame):
         self.db_log_text.insert(tk.END, f"신규 추가: {result.get('new_rows', 0)}개\n")
         self.db_log_text.insert(tk.END, f"기존 업데이트: {result.get('updated_rows', 0)}개\n")
         self.db_log_text.insert(tk.END, f"삭제 표시: {result.get('deleted_rows', 0)}개\n")
+        if result.get('skipped_sheets'):
+            self.db_log_text.insert(tk.END, f"변경 없는 시트 건너뜀: {result['skipped_sheets']}개\n")
         
         self.status_label_db.config(text=f"번역 DB 업데이트 완료")
         
@@ -1,18 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
-from openpyxl import load_workbook
 
 # 유틸리티 및 분리된 모듈 임포트
 from ui.common_components import ScrollableCheckList, show_message
+from utils.string_sheet_reader import header_map_by_column, read_header
+from utils.xlsx_patch_writer import open_workbook_for_update
 from tools.basic_request_extractor import BasicRequestExtractor
 from tools.compare_request_extractor import CompareRequestExtractor
 from tools.request_extraction_manager import RequestExtractionManager
+from ui.event_bus import get_event_bus
 
 class TranslationRequestExtractor(tk.Frame):
     def __init__(self, root):
         super().__init__(root)
         self.root = root.winfo_toplevel()
+        self.event_bus = get_event_bus(self)
         
         # 핵심 로직 매니저 생성
         self.extraction_manager = RequestExtractionManager(self)
@@ -105,9 +108,8 @@ class TranslationRequestExtractor(tk.Frame):
         self.log_message(f"{len(self.excel_files)}개의 엑셀 파일을 찾았습니다.")
 
     def log_message(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        # [개선] 작업 스레드에서도 이벤트 버스로 안전하게 전달 (메인 루프가 주기적으로 반영)
+        self.event_bus.log(self.log_text, message)
         
     def _is_task_running(self):
         if self.extraction_thread and self.extraction_thread.is_alive():
@@ -123,14 +125,7 @@ class TranslationRequestExtractor(tk.Frame):
         return [item for item in self.excel_files if item[0] in selected_file_names]
 
     def _find_headers_in_worksheet(self, ws):
-        for i in range(1, 11):
-            row_values = [cell.value for cell in ws[i]]
-            cleaned_values = [str(v).upper().strip() for v in row_values if v is not None]
-            
-            if "STRING_ID" in cleaned_values:
-                header_map = {idx: str(val).strip() for idx, val in enumerate(row_values, 1) if val is not None}
-                return {k: v.upper() for k, v in header_map.items()}, i
-        return None, -1
+        return header_map_by_column(read_header(ws))
         
     # tools/translation_request_extractor.py
     def _update_files_as_transferred(self, files_to_update, col_name_to_find, new_value):
@@ -147,7 +142,8 @@ class TranslationRequestExtractor(tk.Frame):
         for file_path, sheets in files_to_update.items():
             wb = None # finally를 위해 wb 초기화
             try:
-                wb = load_workbook(file_path)
+                # [개선] xlsx/xlsm 은 '전달' 셀만 시트 XML에서 직접 수정 (전체 로드/저장 없음)
+                wb = open_workbook_for_update(file_path)
                 for sheet_name, row_indices in sheets.items():
                     if sheet_name in wb.sheetnames:
                         ws = wb[sheet_name]
@@ -168,9 +164,9 @@ class TranslationRequestExtractor(tk.Frame):
             except Exception as e:
                 self.log(f"파일 업데이트 실패 '{os.path.basename(file_path)}': {e}")
             finally:
-                # wb.save() 이후에는 close()가 의미 없지만, 로드 후 저장 실패 시를 대비
+                # 로드 후 저장 실패 시를 대비 (직접 수정 워크북은 읽기용 zip을 닫음)
                 if wb:
-                    pass
+                    wb.close()
 
     def _check_files_are_open(self, file_paths_to_check):
         """주어진 파일 경로 목록을 확인하여 열려 있는 파일이 있는지 검사합니다."""
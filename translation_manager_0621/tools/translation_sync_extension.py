@@ -3,15 +3,20 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from ttkwidgets import CheckboxTreeview
 import os
+import threading
 import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
 from utils.config_utils import load_config, save_config
+from utils.string_sheet_reader import open_string_sheet, read_header
+from utils.external_link_scanner import UnreadableWorkbookError, has_external_links, scan_many
+from ui.event_bus import get_event_bus
 
 class TranslationSyncExtension:
     def __init__(self, root):
         self.root = root
         self.root.title("번역 동기화 도구")
+        self.event_bus = get_event_bus(root)
         self.root.geometry("800x700")
         
         # 메인 프레임
@@ -56,18 +61,22 @@ class TranslationSyncExtension:
         action_frame.pack(fill="x", padx=5, pady=5)
         # action_frame에 전체 체크/해제 버튼 추가 (action_frame 정의 부분 바로 아래에 추가)
         self.check_all_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(action_frame, text="전체 선택", 
+        self.check_all_button = ttk.Checkbutton(action_frame, text="전체 선택", 
                         variable=self.check_all_var,
-                        command=self.toggle_all_files).pack(side="left", padx=5, pady=5)
+                        command=self.toggle_all_files)
+        self.check_all_button.pack(side="left", padx=5, pady=5)
         
-        ttk.Button(action_frame, text="매칭 파일 검색", 
-                   command=self.find_matching_files).pack(side="left", padx=5, pady=5)
-        ttk.Button(action_frame, text="번역 동기화", 
-                   command=self.sync_translations).pack(side="right", padx=5, pady=5)
+        self.find_files_button = ttk.Button(action_frame, text="매칭 파일 검색", 
+                   command=self.find_matching_files)
+        self.find_files_button.pack(side="left", padx=5, pady=5)
+        self.sync_button = ttk.Button(action_frame, text="번역 동기화", 
+                   command=self.sync_translations)
+        self.sync_button.pack(side="right", padx=5, pady=5)
         
         # action_frame에 미리보기 버튼 추가
-        ttk.Button(action_frame, text="변경사항 미리보기", 
-                command=self.preview_changes).pack(side="left", padx=5, pady=5)
+        self.preview_button = ttk.Button(action_frame, text="변경사항 미리보기", 
+                command=self.preview_changes)
+        self.preview_button.pack(side="left", padx=5, pady=5)
 
         
         # 파일 목록 표시 영역
@@ -232,17 +241,19 @@ class TranslationSyncExtension:
         valid_selected_files = []
         excluded_due_to_error = []
 
+        # [개선] 워크북을 열지 않고 zip 부품만 읽어 외부 링크를 병렬로 검사
+        # 읽을 수 없는 파일(xlsx가 아님/손상)은 링크 없음으로 보지 않고 따로 모아 경고
+        unreadable_files = []
+        scan_results = scan_many(src for src, _ in selected_files)
         for src, tgt in selected_files:
-            try:
-                test_wb = load_workbook(src, read_only=True)
-                if getattr(test_wb, '_external_links', []):  # 외부 링크 존재 시 제외
-                    excluded_due_to_error.append((src, "외부 링크 있음"))
-                    test_wb.close()
-                    continue
-                test_wb.close()
+            findings = scan_results[src]
+            if isinstance(findings, UnreadableWorkbookError):
+                unreadable_files.append((src, str(findings)))
+                excluded_due_to_error.append((src, f"읽을 수 없음: {findings}"))
+            elif has_external_links(findings):  # 외부 링크 존재 시 제외
+                excluded_due_to_error.append((src, "외부 링크 있음"))
+            else:
                 valid_selected_files.append((src, tgt))
-            except Exception as e:
-                excluded_due_to_error.append((src, f"오류: {str(e)}"))
 
         # 로그 초기화
         self.log_text.delete(1.0, tk.END)
@@ -256,9 +267,48 @@ class TranslationSyncExtension:
                 self.log_text.insert(tk.END, f"  {os.path.basename(path)} - {reason}\n")
             self.log_text.insert(tk.END, "\n")
 
+        if unreadable_files:
+            shown = "\n".join(f"• {os.path.basename(path)} - {reason}" for path, reason in unreadable_files[:10])
+            if len(unreadable_files) > 10:
+                shown += f"\n... 외 {len(unreadable_files) - 10}개"
+            messagebox.showwarning("경고", f"외부 링크를 검사할 수 없어 동기화에서 제외한 파일 {len(unreadable_files)}개:\n{shown}", parent=self.root)
+
         # 진행 바 설정
         self.progress_bar["maximum"] = len(valid_selected_files)
         self.progress_bar["value"] = 0
+        self.status_label.config(text="동기화 중...")
+
+        # [개선] 파일 처리는 작업 스레드에서 하고, 로그/진행률은 이벤트 버스로 메인 루프에 전달
+        # (파일마다 root.update()로 화면을 강제 갱신하지 않음)
+        options = (self.highlight_kr_var.get(), self.add_mark_var.get(), self.copy_all_var.get())
+        # [신규] 동기화가 끝날 때까지 동기화/매칭 파일 버튼을 잠가 같은 파일을 두 번 처리하지 않도록 함
+        self._set_sync_controls_state("disabled")
+        try:
+            threading.Thread(target=self._sync_files_worker, args=(valid_selected_files, options), daemon=True).start()
+        except Exception:
+            self._set_sync_controls_state("normal")
+            raise
+
+    def _set_sync_controls_state(self, state):
+        """[신규] 동기화 버튼과 매칭 파일 관련 버튼의 상태("normal"/"disabled")를 바꿉니다."""
+        for widget in (self.sync_button, self.find_files_button, self.preview_button, self.check_all_button):
+            widget.config(state=state)
+
+    def _sync_files_worker(self, valid_selected_files, options):
+        """선택된 파일 쌍을 동기화합니다. (작업 스레드) 오류가 나도 항상 완료 처리를 호출합니다."""
+        summary = error = None
+        try:
+            summary = self._sync_files(valid_selected_files, options)
+        except Exception as e:
+            error = str(e)
+            self.event_bus.log(self.log_text, f"동기화 중 오류 발생: {e}")
+        finally:
+            self.event_bus.call(self._on_sync_finished, summary, error)
+
+    def _sync_files(self, valid_selected_files, options):
+        """파일 쌍을 차례로 동기화하고 완료 요약 문자열을 반환합니다."""
+        do_highlight, add_mark, copy_all = options
+        log = lambda message: self.event_bus.log(self.log_text, message)
 
         # 통계 변수
         total_items = 0
@@ -274,8 +324,7 @@ class TranslationSyncExtension:
         # 각 파일 쌍에 대해 처리
         for idx, (source_path, target_path) in enumerate(valid_selected_files):
             file_name = os.path.basename(source_path)
-            self.log_text.insert(tk.END, f"{file_name} 처리 중...\n")
-            self.root.update()
+            log(f"{file_name} 처리 중...")
 
             source_wb = None
             target_wb = None
@@ -292,25 +341,25 @@ class TranslationSyncExtension:
                             source_wb[sheet_name],
                             target_wb[sheet_name],
                             yellow_fill,
-                            self.highlight_kr_var.get(),
-                            self.add_mark_var.get(),
-                            self.copy_all_var.get()
+                            do_highlight,
+                            add_mark,
+                            copy_all
                         )
 
                         total_items += file_stats["total"]
                         changed_kr_items += file_stats["changed_kr"]
                         synced_items += file_stats["synced"]
 
-                        self.log_text.insert(tk.END, f"  시트 {sheet_name}: 총 {file_stats['total']}항목, "
-                                                    f"KR 변경 {file_stats['changed_kr']}항목, "
-                                                    f"동기화 {file_stats['synced']}항목\n")
+                        log(f"  시트 {sheet_name}: 총 {file_stats['total']}항목, "
+                            f"KR 변경 {file_stats['changed_kr']}항목, "
+                            f"동기화 {file_stats['synced']}항목")
 
                 # 저장
                 source_wb.save(source_path)
                 processed_files.append(source_path)
 
             except Exception as e:
-                self.log_text.insert(tk.END, f"  오류: {file_name} 처리 중 오류 발생: {e}\n")
+                log(f"  오류: {file_name} 처리 중 오류 발생: {e}")
             finally:
                 # 워크북 확실히 닫기
                 if source_wb:
@@ -329,8 +378,7 @@ class TranslationSyncExtension:
                 time.sleep(0.1)
 
             # 진행 업데이트
-            self.progress_bar["value"] = idx + 1
-            self.root.update()
+            self.event_bus.progress("sync_translations", self.progress_bar.configure, {"value": idx + 1})
 
         # 완료 메시지
         summary = (f"동기화 완료!\n"
@@ -338,14 +386,23 @@ class TranslationSyncExtension:
                 f"KR 변경 항목: {changed_kr_items}\n"
                 f"동기화된 항목: {synced_items}\n")
 
-        self.log_text.insert(tk.END, summary)
-        self.status_label.config(text="완료")
+        log(summary.rstrip("\n"))
 
         # 파일이 완전히 저장되도록 안내
         if processed_files:
-            self.log_text.insert(tk.END, "\n엑셀 파일 저장 확인 중...\n")
-            self.log_text.insert(tk.END, "저장 완료됨.\n")
+            log("\n엑셀 파일 저장 확인 중...")
+            log("저장 완료됨.")
+
+        return summary
 
+    def _on_sync_finished(self, summary, error=None):
+        """동기화 완료 처리 (메인 루프) - 오류로 끝났어도 버튼을 다시 사용할 수 있게 함"""
+        self._set_sync_controls_state("normal")
+        if error is not None:
+            self.status_label.config(text="오류")
+            messagebox.showerror("오류", f"번역 동기화 중 오류가 발생했습니다.\n{error}", parent = self.root)
+            return
+        self.status_label.config(text="완료")
         messagebox.showinfo("완료", f"번역 동기화가 완료되었습니다.\n{summary}", parent = self.root)
 
 
@@ -365,51 +422,13 @@ class TranslationSyncExtension:
 
     def sync_sheet(self, source_sheet, target_sheet, highlight_fill, 
                   do_highlight=True, add_mark=True, copy_all=True):
-        # 헤더 위치 찾기
-        string_id_col_src = None
-        kr_col_src = None
-        cn_col_src = None
-        tw_col_src = None
-        header_row_src = None
-        
-        string_id_col_tgt = None
-        kr_col_tgt = None
-        cn_col_tgt = None
-        tw_col_tgt = None
-        header_row_tgt = None
-        
-        # A 파일(source) 헤더 찾기
-        for row in range(3, 6):
-            for col in range(1, source_sheet.max_column + 1):
-                cell_value = source_sheet.cell(row=row, column=col).value
-                if cell_value == "STRING_ID":
-                    string_id_col_src = col
-                    header_row_src = row
-                elif cell_value == "KR":
-                    kr_col_src = col
-                elif cell_value == "CN":
-                    cn_col_src = col
-                elif cell_value == "TW":
-                    tw_col_src = col
-        
-        # B 파일(target) 헤더 찾기
-        for row in range(3, 6):
-            for col in range(1, target_sheet.max_column + 1):
-                cell_value = target_sheet.cell(row=row, column=col).value
-                if cell_value == "STRING_ID":
-                    string_id_col_tgt = col
-                    header_row_tgt = row
-                elif cell_value == "KR":
-                    kr_col_tgt = col
-                elif cell_value == "CN":
-                    cn_col_tgt = col
-                elif cell_value == "TW":
-                    tw_col_tgt = col
+        # 헤더 위치 찾기 (A 파일: source, B 파일: target)
+        sync_langs = ["KR", "CN", "TW"]
+        src = open_string_sheet(source_sheet, sync_langs, ["#원문"])
+        tgt = open_string_sheet(target_sheet, sync_langs)
         
         # 필요한 컬럼이 모두 있는지 확인
-        if not all([string_id_col_src, kr_col_src, cn_col_src, tw_col_src, 
-                    string_id_col_tgt, kr_col_tgt, cn_col_tgt, tw_col_tgt,
-                    header_row_src, header_row_tgt]):
+        if src is None or tgt is None or not all(src.has(lang) and tgt.has(lang) for lang in sync_langs):
             return {"total": 0, "changed_kr": 0, "synced": 0}
         
         # 통계용 변수
@@ -417,37 +436,26 @@ class TranslationSyncExtension:
         
         # B 파일의 데이터를 해시맵으로 변환 (빠른 검색을 위해)
         target_data = {}
-        for row in range(header_row_tgt + 1, target_sheet.max_row + 1):
-            string_id = target_sheet.cell(row=row, column=string_id_col_tgt).value
-            if string_id:
-                kr = target_sheet.cell(row=row, column=kr_col_tgt).value
-                cn = target_sheet.cell(row=row, column=cn_col_tgt).value
-                tw = target_sheet.cell(row=row, column=tw_col_tgt).value
-                target_data[string_id] = {"kr": kr, "cn": cn, "tw": tw}
-        
-        # 변경 표시 컬럼 준비
-        change_mark_col = None
-        if add_mark:
-            # 기존 #원문 컬럼 찾기
-            for col in range(1, source_sheet.max_column + 1):
-                cell_value = source_sheet.cell(row=header_row_src, column=col).value
-                if cell_value and isinstance(cell_value, str) and cell_value.strip() == "#원문":
-                    change_mark_col = col
-                    break
-            # #원문 컬럼이 없으면 pass (새로 추가하지 않음)
-            if not change_mark_col:
-                pass  # 컬럼이 없으면 변경 표시 기능 비활성화
+        for row in tgt.rows():
+            kr, cn, tw = (tgt.value(row, lang) for lang in sync_langs)
+            target_data[row.string_id] = {"kr": kr, "cn": cn, "tw": tw}
+        
+        # 변경 표시 컬럼 준비 (#원문 컬럼이 없으면 변경 표시 기능 비활성화, 새로 추가하지 않음)
+        change_mark_col = src.columns.get("#원문") if add_mark else None
+        kr_col_src = src.columns["KR"]
+        cn_col_src = src.columns["CN"]
+        tw_col_src = src.columns["TW"]
                 
         # A 파일을 순회하면서 B 파일의 데이터 동기화
-        for row in range(header_row_src + 1, source_sheet.max_row + 1):
-            string_id = source_sheet.cell(row=row, column=string_id_col_src).value
-            if not string_id or string_id not in target_data:
+        for row in src.rows():
+            string_id = row.string_id
+            if string_id not in target_data:
                 continue
             
             stats["total"] += 1
             
             # KR 값 비교
-            source_kr = source_sheet.cell(row=row, column=kr_col_src).value or ""
+            source_kr = src.value(row, "KR") or ""
             target_kr = target_data[string_id]["kr"] or ""
             
             kr_changed = source_kr != target_kr
@@ -455,22 +463,22 @@ class TranslationSyncExtension:
             # CN, TW 값 옮기기
             if copy_all or not kr_changed:
                 if target_data[string_id]["cn"]:
-                    source_sheet.cell(row=row, column=cn_col_src).value = target_data[string_id]["cn"]
+                    source_sheet.cell(row=row.row, column=cn_col_src).value = target_data[string_id]["cn"]
                     stats["synced"] += 1
                 
                 if target_data[string_id]["tw"]:
-                    source_sheet.cell(row=row, column=tw_col_src).value = target_data[string_id]["tw"]
+                    source_sheet.cell(row=row.row, column=tw_col_src).value = target_data[string_id]["tw"]
                     stats["synced"] += 1
             
             # KR 값이 변경된 경우 표시
             if kr_changed:
                 stats["changed_kr"] += 1
                 if do_highlight:
-                    source_sheet.cell(row=row, column=kr_col_src).fill = highlight_fill
+                    source_sheet.cell(row=row.row, column=kr_col_src).fill = highlight_fill
                 
                 # 변경 정보 표시를 위한 셀 추가
                 if add_mark and change_mark_col:
-                    source_sheet.cell(row=row, column=change_mark_col).value = "#변경됨"
+                    source_sheet.cell(row=row.row, column=change_mark_col).value = "#변경됨"
         
         return stats
     
@@ -871,38 +879,32 @@ class TranslationSyncExtension:
     # 보조 메서드 추가
     def find_headers(self, sheet):
         """시트에서 헤더 행과 컬럼 인덱스 찾기"""
-        for row in range(3, 6):  # 3행부터 5행까지 검색
-            headers = {}
-            for col in range(1, min(20, sheet.max_column + 1)):  # 최대 20열까지만 검색 (속도 개선)
-                cell_value = sheet.cell(row=row, column=col).value
-                if cell_value in ["STRING_ID", "KR", "CN", "TW"]:
-                    headers[cell_value] = col
-            
-            # 필수 헤더를 찾았으면 반환
-            if "STRING_ID" in headers and "KR" in headers:
-                return {"row": row, "columns": headers}
+        header = read_header(sheet)
+        if header is None or header.find("KR") is None:
+            return None
         
-        return None
+        columns = {name: header.find(name) for name in ["STRING_ID", "KR", "CN", "TW"] if header.find(name)}
+        return {"row": header.row, "columns": columns}
 
     def sheet_to_dict(self, sheet, headers):
         """시트 데이터를 딕셔너리로 변환"""
         data = {}
         header_row = headers["row"]
         columns = headers["columns"]
+        string_id_pos = columns["STRING_ID"] - 1
+        value_cols = [(col_name, col_idx - 1) for col_name, col_idx in columns.items() if col_name != "STRING_ID"]
         
         # 데이터 행 순회 (최대 1000행까지만 - 속도 개선)
         max_rows = min(sheet.max_row, header_row + 1000)
         
-        for row in range(header_row + 1, max_rows):
-            string_id = sheet.cell(row=row, column=columns["STRING_ID"]).value
+        for values in sheet.iter_rows(min_row=header_row + 1, max_row=max_rows - 1,
+                                      max_col=max(columns.values()), values_only=True):
+            string_id = values[string_id_pos]
             if not string_id:
                 continue
             
-            data[string_id] = {}
-            for col_name, col_idx in columns.items():
-                if col_name != "STRING_ID":
-                    value = sheet.cell(row=row, column=col_idx).value
-                    data[string_id][col_name] = value if value is not None else ""
+            data[string_id] = {col_name: values[pos] if values[pos] is not None else ""
+                               for col_name, pos in value_cols}
         
         return data
 
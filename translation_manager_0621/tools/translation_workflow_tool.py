@@ -6,12 +6,15 @@ import os
 import threading
 import sqlite3
 from ui.common_components import ScrollableCheckList, show_message, LoadingPopup
+from utils.string_sheet_reader import header_map_by_column, read_header
 from tools.workflow_manager import WorkflowManager
+from ui.event_bus import get_event_bus
 
 class TranslationWorkflowTool(tk.Frame):
     def __init__(self, parent, root):
         super().__init__(parent)
         self.root = root
+        self.event_bus = get_event_bus(self)
         self.workflow_manager = WorkflowManager(self)
 
         # UI 변수 선언
@@ -38,10 +41,8 @@ class TranslationWorkflowTool(tk.Frame):
         self.base_db_path_var.trace_add("write", self._on_db_path_change)
 
     def log(self, message):
-        """공통 로그 기록 함수"""
-        self.log_text.insert(tk.END, f"[{self.get_timestamp()}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """공통 로그 기록 함수 (작업 스레드에서도 이벤트 버스로 안전하게 전달)"""
+        self.event_bus.log(self.log_text, f"[{self.get_timestamp()}] {message}")
         
     def get_timestamp(self):
         import time
@@ -446,15 +447,7 @@ class TranslationWorkflowTool(tk.Frame):
 
     def _find_headers_in_worksheet(self, ws):
         """Worksheet에서 헤더 행과 컬럼 위치 찾기 (Container -> Workflow Tool로 이동)"""
-        for i in range(1, 11):
-            row_values = [cell.value for cell in ws[i]]
-            cleaned_values = [str(v).upper().strip() for v in row_values if v is not None]
-            
-            if "STRING_ID" in cleaned_values:
-                header_map = {idx: str(val).strip() for idx, val in enumerate(row_values, 1) if val is not None}
-                # 모든 헤더 이름을 대문자로 통일하여 반환
-                return {k: v.upper() for k, v in header_map.items()}, i
-        return None, -1
+        return header_map_by_column(read_header(ws))
     
     def _on_db_path_change(self, *args):
         """기준 DB 경로가 변경되었을 때 호출되어 2단계를 활성화하는 함수"""
@@ -13,11 +13,14 @@ from tkinter import filedialog, messagebox, ttk
 from openpyxl import load_workbook
 from datetime import datetime
 from ui.common_components import ScrollableCheckList, LoadingPopup
+from utils.xlsx_patch_writer import open_workbook_for_update
+from ui.event_bus import get_event_bus
 
 class WordReplacementManager(tk.Frame):
     def __init__(self, parent, root):
         super().__init__(parent)
         self.root = root
+        self.event_bus = get_event_bus(self)
         
         # 한글 포함 패턴 정규표현식 ([@...] 형식에서 한글이 포함된 것만)
         self.pattern = re.compile(r'\[@([^\]]*[가-힣][^\]]*)\]')
@@ -265,10 +268,8 @@ class WordReplacementManager(tk.Frame):
         print("UI 설정 완료")
 
     def log_message(self, message):
-        """로그 메시지 추가"""
-        self.log_text.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """로그 메시지 추가 (작업 스레드에서도 이벤트 버스로 안전하게 전달)"""
+        self.event_bus.log(self.log_text, f"{time.strftime('%H:%M:%S')} - {message}")
 
     def select_excel_folder(self):
         """엑셀 폴더 선택"""
@@ -656,8 +657,8 @@ class WordReplacementManager(tk.Frame):
     def add_new_string_to_excel(self, excel_path, string_id, kr_text):
         """신규 STRING 추가 - 안전한 openpyxl 전용 (Excel 자동 저장 제외)"""
         try:
-            # 번역 적용과 동일한 방식으로 안정적 로드
-            workbook = load_workbook(excel_path, data_only=False, keep_vba=True)
+            # [개선] xlsx/xlsm 은 추가한 셀만 시트 XML에서 직접 수정 (그 외 형식은 openpyxl)
+            workbook = open_workbook_for_update(excel_path, data_only=False, keep_vba=True)
             
             # String 시트 찾기
             target_sheet = None
@@ -690,9 +691,10 @@ class WordReplacementManager(tk.Frame):
             
             # 마지막 행 찾기 (더 효율적인 방법)
             last_row = 1  # 헤더 행부터 시작
-            for row_cells in target_sheet.iter_rows(min_row=2, min_col=string_id_col, max_col=string_id_col):
-                if row_cells[0].value and str(row_cells[0].value).strip():
-                    last_row = row_cells[0].row
+            for row_idx, row_values in enumerate(target_sheet.iter_rows(min_row=2, max_col=string_id_col, values_only=True), 2):
+                value = row_values[string_id_col - 1] if len(row_values) >= string_id_col else None
+                if value and str(value).strip():
+                    last_row = row_idx
             
             new_row = last_row + 1
             
@@ -1041,8 +1043,8 @@ class WordReplacementManager(tk.Frame):
         new_text_file = self.new_text_file_var.get()
         
         try:
-            # openpyxl 처리
-            workbook = load_workbook(file_path)
+            # [개선] xlsx/xlsm 은 치환한 셀만 시트 XML에서 직접 수정 (그 외 형식은 openpyxl)
+            workbook = open_workbook_for_update(file_path)
             modified = False
             
             file_name = os.path.basename(file_path)
@@ -1104,7 +1106,6 @@ class WordReplacementManager(tk.Frame):
                                             worksheet.cell(row=row, column=headers[lang]).value = new_text
             
             if modified:
-                # openpyxl 저장
                 workbook.save(file_path)
                 workbook.close()
                 
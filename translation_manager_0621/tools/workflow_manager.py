@@ -3,13 +3,15 @@
 import os
 import threading
 from tkinter import messagebox
-from openpyxl import load_workbook
 import sqlite3
 
 # 기존 매니저들을 임포트하여 로직을 재사용합니다.
 from tools.translation_db_manager import TranslationDBManager
 from tools.translation_apply_manager import TranslationApplyManager
 from ui.common_components import LoadingPopup, show_message
+from utils.xlsx_stream_reader import open_workbook_for_read
+from utils.string_sheet_reader import open_string_sheet, read_header
+from utils.translation_revisions import begin_revision, finish_revision, SOURCE_EXCEL_UPDATE, SOURCE_RESOLVED
 
 class WorkflowManager:
     def __init__(self, parent_app):
@@ -64,7 +66,7 @@ class WorkflowManager:
                 loading_popup.update_message("번역 파일 읽는 중...")
                 self.log(f"번역 파일 로드 시작: {os.path.basename(excel_path)}")
                 
-                wb = load_workbook(excel_path, read_only=True, data_only=True)
+                wb = open_workbook_for_read(excel_path)
                 
                 # [수정] 모든 처리 대상 시트의 데이터를 미리 로드
                 all_excel_cache = {}
@@ -72,16 +74,13 @@ class WorkflowManager:
                     if sheet_name not in wb.sheetnames: continue
                     
                     ws = wb[sheet_name]
-                    headers, header_row_idx = self.parent_app._find_headers_in_worksheet(ws)
-                    if not headers or "STRING_ID" not in headers.values(): continue
+                    header = read_header(ws)
+                    if header is None: continue
+                    sheet = open_string_sheet(ws, extra_columns=header.labels.values(), header=header)
                     
                     excel_cache = defaultdict(list)
-                    for row in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-                        string_id_idx = list(headers.keys())[list(headers.values()).index("STRING_ID")]
-                        string_id = row[string_id_idx - 1]
-                        if string_id:
-                            row_data = {headers[col_idx].lower(): row[col_idx - 1] for col_idx in headers}
-                            excel_cache[str(string_id)].append(row_data)
+                    for row in sheet.rows():
+                        excel_cache[str(row.string_id)].append(sheet.to_dict(row))
                     
                     all_excel_cache[sheet_name] = excel_cache
                 wb.close()
@@ -130,8 +129,10 @@ class WorkflowManager:
                 
                 if update_queries:
                     cursor.execute("BEGIN TRANSACTION")
+                    revision_id = begin_revision(cursor, SOURCE_EXCEL_UPDATE, f"번역 파일 반영: {os.path.basename(excel_path)}")
                     for query, params in update_queries:
                         cursor.execute(query, params)
+                    finish_revision(cursor, revision_id)
                     total_updated_rows += len(update_queries)
                     conn.commit()
 
@@ -173,8 +174,10 @@ class WorkflowManager:
 
             if update_queries:
                 cursor.execute("BEGIN TRANSACTION")
+                revision_id = begin_revision(cursor, SOURCE_RESOLVED, f"중복 항목 해결 반영 ({len(update_queries)}개)")
                 for query, params in update_queries:
                     cursor.execute(query, params)
+                finish_revision(cursor, revision_id)
                 conn.commit()
 
             conn.close()
@@ -1,6 +1,7 @@
 # translation_main.py (수정 후)
 
 import tkinter as tk
+import multiprocessing
 import sys
 import os
 
@@ -14,6 +15,8 @@ if project_root not in sys.path:
 from tools.translate_tool_main import TranslationAutomationTool
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 병렬 DB 구축(작업 프로세스)을 사용하기 위해 필요
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = TranslationAutomationTool(root)
     root.mainloop()
\ No newline at end of file
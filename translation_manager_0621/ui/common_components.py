@@ -7,6 +7,7 @@ import gc
 
 # 설정 유틸리티 함수는 config_utils.py에서 가져와서 사용
 from utils.config_utils import load_config, save_config
+from ui.event_bus import get_event_bus, is_main_thread
 
 class ScrollableCheckList(tk.Frame):
     def __init__(self, parent, width=300, height=150, *args, **kwargs):
@@ -186,7 +187,7 @@ def save_file(parent, title_text, filetypes, defaultextension, initialdir=None):
     return None
 
 class LoadingPopup:
-    """진행 상황 표시 팝업"""
+    """진행 상황 표시 팝업 (update_* 는 작업 스레드에서 호출해도 안전)"""
     def __init__(self, parent, title="로딩 중...", message="작업 준비 중..."):
         self.popup = tk.Toplevel(parent)
         self.popup.title(title)
@@ -205,11 +206,17 @@ class LoadingPopup:
         self.status_label = ttk.Label(self.popup, textvariable=self.status_var)
         self.status_label.pack(pady=10)
         
+        # [개선] 작업 스레드의 갱신은 이벤트 버스로 모아 마지막 값만 반영
+        self.event_bus = get_event_bus(self.popup)
+        
         # 즉시 표시하도록 업데이트
         self.popup.update()
     
     def update_progress(self, percentage, status_text=None):
         """진행률 및 상태 텍스트 업데이트"""
+        if not is_main_thread():
+            self.event_bus.progress((id(self), "progress"), self.update_progress, percentage, status_text)
+            return
         self.progress_var.set(percentage)
         if status_text:
             self.status_var.set(status_text)
@@ -217,9 +224,16 @@ class LoadingPopup:
     
     def update_message(self, message):
         """메시지 라벨 업데이트"""
+        if not is_main_thread():
+            self.event_bus.progress((id(self), "message"), self.update_message, message)
+            return
         self.message_label.config(text=message)
         self.popup.update_idletasks()
     
     def close(self):
         """팝업 닫기"""
+        if not is_main_thread():
+            # 작업 스레드가 이어서 root.after(0, 완료 콜백)을 예약하므로 같은 after 큐로 순서를 맞춤
+            self.popup.after(0, self.close)
+            return
         self.popup.destroy()
\ No newline at end of file
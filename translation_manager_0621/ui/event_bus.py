@@ -0,0 +1,151 @@
+# ui/event_bus.py
+"""
+작업 스레드 -> Tk 메인 루프 이벤트 버스
+
+작업 스레드에서 log_text.insert / update_idletasks / root.update 를 직접 호출하면
+Tk가 스레드 안전하지 않아 멈추거나, 메시지마다 화면을 다시 그려 작업이 느려집니다.
+작업 스레드는 로그/진행률/호출 이벤트를 큐에 넣기만 하고 (블로킹 없음),
+메인 루프가 일정 주기(기본 100ms, 약 10Hz)로 큐를 비우며 한 번에 화면에 반영합니다.
+
+- 로그: 같은 위젯으로 가는 메시지를 모아 insert 한 번으로 쓰고,
+        max_log_lines 를 넘는 오래된 줄은 잘라냅니다. (링 버퍼)
+- 진행률: 같은 키의 진행률은 마지막 값만 반영합니다.
+- 호출: 완료 메시지 표시 등 메인 루프에서 실행할 함수 (순서 유지)
+"""
+
+import logging
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger('app')
+
+DEFAULT_INTERVAL_MS = 100
+DEFAULT_MAX_LOG_LINES = 5000
+MAX_EVENTS_PER_TICK = 20000     # 한 번에 처리할 최대 이벤트 수 (나머지는 다음 주기)
+
+_LOG = 0
+_CALL = 1
+
+_buses: Dict[int, "UiEventBus"] = {}
+_buses_lock = threading.Lock()
+
+
+def is_main_thread() -> bool:
+    return threading.current_thread() is threading.main_thread()
+
+
+def trim_text_widget(widget, max_lines: int) -> None:
+    """Text 위젯이 max_lines 줄을 넘으면 앞부분을 지웁니다."""
+    line_count = int(widget.index("end-1c").split(".")[0]) - 1    # 마지막 줄바꿈 뒤 빈 줄 제외
+    if line_count > max_lines:
+        widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+
+
+class UiEventBus:
+    """작업 스레드의 로그/진행률 이벤트를 Tk 메인 루프에서 일정 주기로 반영"""
+
+    def __init__(self, root, interval_ms: int = DEFAULT_INTERVAL_MS, max_log_lines: int = DEFAULT_MAX_LOG_LINES):
+        """메인 스레드에서 생성해야 합니다."""
+        self.root = root
+        self.interval_ms = interval_ms
+        self.max_log_lines = max_log_lines
+        self._queue: "queue.SimpleQueue[Tuple]" = queue.SimpleQueue()
+        self._progress: Dict[Hashable, Tuple[Callable, tuple]] = {}
+        self._progress_lock = threading.Lock()
+        self._closed = False
+        self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    # --- 작업 스레드에서 호출 (블로킹 없음) ---
+    def log(self, widget, message: str) -> None:
+        """Text 위젯에 로그 한 줄을 추가합니다."""
+        self._queue.put((_LOG, widget, message))
+
+    def call(self, callback: Callable, *args: Any) -> None:
+        """메인 루프에서 callback(*args)를 실행합니다. (로그와 순서 유지)"""
+        self._queue.put((_CALL, callback, args))
+
+    def progress(self, key: Hashable, callback: Callable, *args: Any) -> None:
+        """진행률 갱신. 같은 key는 다음 주기에 마지막 값으로 한 번만 반영합니다."""
+        with self._progress_lock:
+            self._progress[key] = (callback, args)
+
+    # --- 메인 루프 ---
+    def flush(self) -> None:
+        """쌓인 이벤트를 지금 반영합니다. (메인 스레드 전용)"""
+        pending_logs: Dict[Any, list] = {}
+        for _ in range(MAX_EVENTS_PER_TICK):
+            try:
+                kind, target, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == _LOG:
+                pending_logs.setdefault(target, []).append(payload)
+            else:
+                self._write_logs(pending_logs)
+                pending_logs = {}
+                self._run(target, payload)
+        self._write_logs(pending_logs)
+
+        with self._progress_lock:
+            progress, self._progress = self._progress, {}
+        for callback, args in progress.values():
+            self._run(callback, args)
+
+    def _drain(self) -> None:
+        self._after_id = None
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            if not self._closed:
+                try:
+                    self._after_id = self.root.after(self.interval_ms, self._drain)
+                except tk.TclError:       # 루트 창 종료
+                    self._closed = True
+
+    def _write_logs(self, pending_logs: Dict[Any, list]) -> None:
+        for widget, messages in pending_logs.items():
+            try:
+                widget.insert(tk.END, "\n".join(messages) + "\n")
+                trim_text_widget(widget, self.max_log_lines)
+                widget.see(tk.END)
+            except tk.TclError:
+                pass            # 이미 닫힌 창의 위젯
+
+    @staticmethod
+    def _run(callback: Callable, args: tuple) -> None:
+        try:
+            callback(*args)
+        except tk.TclError:
+            pass                # 이미 닫힌 창의 위젯
+        except Exception as e:
+            logger.exception(f"UI 이벤트 처리 오류: {e}")
+
+    def close(self) -> None:
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+
+def get_event_bus(widget) -> UiEventBus:
+    """
+    위젯이 속한 Tk 루트의 이벤트 버스를 반환합니다.
+    처음 호출은 메인 스레드에서 해야 합니다. (매니저/도구 생성 시점)
+    """
+    root = widget._root()
+    key = id(root)
+    with _buses_lock:
+        bus = _buses.get(key)
+        if bus is None or bus._closed:
+            if not is_main_thread():
+                raise RuntimeError("이벤트 버스는 메인 스레드에서 먼저 만들어야 합니다.")
+            bus = UiEventBus(root)
+            _buses[key] = bus
+        return bus
@@ -0,0 +1,197 @@
+# utils/apply_journal.py
+"""
+번역 적용 작업 저널 (user_data/apply_journal.db)
+
+파일 수백 개에 번역을 적용하다 중간에 프로그램이 죽거나 창을 닫으면
+지금까지는 처음부터 다시 실행해 이미 끝난 파일도 전부 다시 읽고 계산했습니다.
+저널은 작업(적용 옵션 + 번역 캐시 출처)마다 파일별로
+- 상태: written(저장됨, 후처리 전) / done(완료) / failed(오류)
+- 변경 목록 지문(plan_hash), 입력 파일 크기/수정 시각
+- 완료 시점의 출력 파일 sha1/크기/수정 시각
+을 SQLite(WAL)에 상태가 바뀔 때마다 바로 커밋합니다.
+
+같은 작업을 다시 실행하면 resume()이
+- done 이면서 지금 파일이 기록한 출력과 같은 파일은 건너뛰고
+  (다른 프로그램에서 파일을 수정했으면 다시 처리)
+- written 이면서 파일이 저장 직후 그대로인 파일은 적용 없이 후처리만 하며
+- 나머지는 원래 순서대로 다시 처리하게 나눕니다.
+적용 옵션이나 번역 캐시가 바뀌면 작업 키가 달라지므로 모든 파일을 다시 처리합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger('app')
+
+STATE_WRITTEN = "written"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+
+# 작업 키에서 제외할 옵션 (결과 파일에 영향이 없음)
+_IGNORED_OPTIONS = frozenset(("dry_run",))
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _normalize_path(file_path: str) -> str:
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def default_journal_path() -> str:
+    return os.path.join(os.getcwd(), "user_data", "apply_journal.db")
+
+
+def file_checksum(file_path: str) -> str:
+    """파일 내용의 sha1 (1MB 단위로 읽음)"""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_job_key(options: Dict[str, Any], cache_signature: Hashable) -> str:
+    """적용 옵션과 번역 캐시 출처로 작업 키를 만듭니다. (미리보기 여부는 제외)"""
+    payload = {
+        "options": {key: value for key, value in options.items() if key not in _IGNORED_OPTIONS},
+        "cache": cache_signature,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class ResumePlan(NamedTuple):
+    """다시 실행할 때 파일 분류 (모두 원래 순서 유지)"""
+    pending: List[str]      # 처음부터 적용할 파일
+    written: List[str]      # 저장은 끝났고 후처리만 남은 파일
+    done: List[str]         # 이미 완료되어 건너뛸 파일
+
+
+class ApplyJournal:
+    """작업 키 + 파일 경로별 적용 상태를 기록하는 저널"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or default_journal_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS apply_journal (
+                    job_key TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    plan_hash TEXT,
+                    input_size INTEGER,
+                    input_mtime_ns INTEGER,
+                    output_checksum TEXT,
+                    output_size INTEGER,
+                    output_mtime_ns INTEGER,
+                    message TEXT,
+                    updated_at TEXT,
+                    PRIMARY KEY (job_key, file_path)
+                ) WITHOUT ROWID
+            ''')
+            self._conn.commit()
+        except Exception:
+            self._conn.close()
+            raise
+
+    def _entries(self, job_key: str) -> Dict[str, tuple]:
+        rows = self._conn.execute('''
+            SELECT file_path, state, output_checksum, output_size, output_mtime_ns
+            FROM apply_journal WHERE job_key = ?
+        ''', (job_key,)).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    @staticmethod
+    def _matches_output(file_path: str, checksum: Optional[str], size: Optional[int],
+                        mtime_ns: Optional[int]) -> bool:
+        """지금 파일이 기록한 출력과 같은지 (크기/수정 시각이 같으면 sha1 계산 생략)"""
+        if not checksum:
+            return False
+        try:
+            stat = os.stat(file_path)
+            if stat.st_size != size:
+                return False
+            if stat.st_mtime_ns == mtime_ns:
+                return True
+            return file_checksum(file_path) == checksum
+        except OSError:
+            return False
+
+    def resume(self, job_key: str, file_paths: Iterable[str]) -> ResumePlan:
+        """이전 실행 기록을 보고 파일을 처리할 것 / 후처리만 할 것 / 건너뛸 것으로 나눕니다."""
+        with self._lock:
+            entries = self._entries(job_key)
+        plan = ResumePlan([], [], [])
+        for file_path in file_paths:
+            entry = entries.get(_normalize_path(file_path))
+            if entry is not None and entry[0] in (STATE_DONE, STATE_WRITTEN) \
+                    and self._matches_output(file_path, *entry[1:]):
+                (plan.done if entry[0] == STATE_DONE else plan.written).append(file_path)
+            else:
+                plan.pending.append(file_path)
+        return plan
+
+    def _record(self, job_key: str, file_path: str, state: str, **fields) -> None:
+        path = _normalize_path(file_path)
+        columns = ["state", "updated_at"] + list(fields)
+        values = [state, _now()] + list(fields.values())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO apply_journal (job_key, file_path, state) VALUES (?, ?, ?)",
+                (job_key, path, state)
+            )
+            self._conn.execute(
+                f"UPDATE apply_journal SET {', '.join(col + ' = ?' for col in columns)} "
+                "WHERE job_key = ? AND file_path = ?",
+                values + [job_key, path]
+            )
+
+    def _output_fields(self, file_path: str) -> Dict[str, Any]:
+        stat = os.stat(file_path)
+        return {"output_checksum": file_checksum(file_path), "output_size": stat.st_size,
+                "output_mtime_ns": stat.st_mtime_ns}
+
+    def mark_written(self, job_key: str, file_path: str, plan_hash: Optional[str] = None,
+                     input_stat: Optional[os.stat_result] = None) -> None:
+        """적용 결과를 저장했고 후처리가 남은 상태로 기록합니다."""
+        fields = self._output_fields(file_path)
+        if input_stat is not None:
+            fields.update(input_size=input_stat.st_size, input_mtime_ns=input_stat.st_mtime_ns)
+        self._record(job_key, file_path, STATE_WRITTEN, plan_hash=plan_hash, message=None, **fields)
+
+    def mark_done(self, job_key: str, file_path: str, plan_hash: Optional[str] = None) -> None:
+        """파일 처리를 완료로 기록합니다. (지금 파일 내용을 출력 체크섬으로 기록)"""
+        fields = self._output_fields(file_path)
+        if plan_hash is not None:
+            fields["plan_hash"] = plan_hash
+        self._record(job_key, file_path, STATE_DONE, message=None, **fields)
+
+    def mark_failed(self, job_key: str, file_path: str, message: str = "") -> None:
+        """오류로 끝난 파일을 기록합니다. (다음 실행에서 다시 처리)"""
+        self._record(job_key, file_path, STATE_FAILED, message=message, output_checksum=None)
+
+    def forget(self, job_key: Optional[str] = None) -> None:
+        """작업 하나(또는 전체)의 기록을 지웁니다."""
+        with self._lock, self._conn:
+            if job_key is None:
+                self._conn.execute("DELETE FROM apply_journal")
+            else:
+                self._conn.execute("DELETE FROM apply_journal WHERE job_key = ?", (job_key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
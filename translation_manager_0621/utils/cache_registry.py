@@ -0,0 +1,92 @@
+# utils/cache_registry.py
+"""
+프로세스 공용 번역 캐시 레지스트리
+
+번역 적용 / 통합 관리 / 워크플로 탭이 같은 DB를 각자 불러오면 같은 내용의 캐시가 탭 수만큼 메모리에 남습니다.
+레지스트리는 (DB 경로, 필터) 키마다 가장 최근에 만든 읽기 전용 캐시(스냅샷) 하나와
+만들 당시의 DB 지문을 보관하고, 지문이 같으면 새로 만들지 않고 같은 객체를 돌려줍니다.
+
+- 스냅샷은 만든 뒤 바꾸지 않습니다. (수정이 필요하면 복사본을 만들어 씀 - copy-on-write)
+- DB가 바뀌어 다시 불러오면 새 스냅샷을 만든 뒤 참조만 교체해 게시합니다.
+  이전 스냅샷을 쓰던 탭은 잠금 없이 계속 읽을 수 있고, 참조가 모두 사라지면 해제됩니다.
+- 같은 키를 동시에 요청하면 한 스레드만 만들고 나머지는 그 결과를 함께 씁니다.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger('app')
+
+
+def _normalize_path(db_path: str) -> str:
+    return os.path.normcase(os.path.abspath(db_path))
+
+
+class CacheRegistry:
+    """(DB 경로, 필터) -> (DB 지문, 읽기 전용 스냅샷) 레지스트리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, Hashable], Tuple[Hashable, Any]] = {}
+        self._build_locks: Dict[Tuple[str, Hashable], threading.Lock] = {}
+
+    def get(self, db_path: str, fingerprint: Hashable, loader: Callable[[], Any],
+            filter_key: Hashable = None) -> Tuple[Any, bool]:
+        """
+        지문이 같은 스냅샷이 있으면 그대로, 없으면 loader()로 만들어 게시한 뒤 반환합니다.
+
+        Args:
+            db_path: DB 파일 경로
+            fingerprint: DB 내용 지문 (바뀌면 새로 만듦)
+            loader: 스냅샷을 만드는 함수 (반환 값은 이후 수정하지 않아야 함)
+            filter_key: 같은 DB에서 다른 조건으로 만든 캐시를 구분하는 키
+
+        Returns:
+            (스냅샷, 기존 스냅샷을 공유했는지 여부)
+        """
+        key = (_normalize_path(db_path), filter_key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1], True
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            entry = self._entries.get(key)      # 기다리는 동안 다른 스레드가 만들었을 수 있음
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1], True
+            snapshot = loader()
+            with self._lock:
+                self._entries[key] = (fingerprint, snapshot)
+        logger.debug(f"번역 캐시 스냅샷 게시: {db_path} ({filter_key})")
+        return snapshot, False
+
+    def peek(self, db_path: str, filter_key: Hashable = None) -> Optional[Any]:
+        """게시된 스냅샷을 지문 확인 없이 반환합니다. (없으면 None)"""
+        entry = self._entries.get((_normalize_path(db_path), filter_key))
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, db_path: Optional[str] = None) -> None:
+        """DB 하나(또는 전체)의 스냅샷을 레지스트리에서 내립니다. 이미 받아 간 스냅샷은 그대로 쓸 수 있습니다."""
+        with self._lock:
+            if db_path is None:
+                self._entries.clear()
+                return
+            path = _normalize_path(db_path)
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+
+_default_registry: Optional[CacheRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_cache_registry() -> CacheRegistry:
+    """프로세스 공용 레지스트리를 반환합니다."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = CacheRegistry()
+        return _default_registry
@@ -0,0 +1,203 @@
+# utils/excel_sheet_analyzer.py
+"""
+엑셀 캐시(excel_cache.json)용 시트 분석기
+
+시트마다 한 번의 스트리밍 패스로 헤더 행, 컬럼 위치, ':pk' 표시, 데이터 행 수를 함께 수집합니다.
+ExcelFileManager.update_excel_cache가 작업 프로세스에서 실행하므로
+pandas/openpyxl 및 로깅 설정(common_utils)을 임포트하지 않는 가벼운 모듈로 둡니다.
+"""
+
+import logging
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence
+
+from utils.xlsx_stream_reader import XlsxStreamWorkbook
+
+logger = logging.getLogger('app')
+
+# 헤더 행 탐색 규칙 (0-based 행 인덱스)
+DEFAULT_HEADER_ROW = 2
+PRIORITY_HEADER_ROWS = (2, 3)
+EXTENDED_HEADER_ROWS = range(4, 10)
+SCAN_ROWS = 10
+
+# VARCHAR/NTEXT/:PK 타입 표시 헤더의 컬럼 번호 -> 표준 컬럼명
+TYPED_LANGUAGE_COLUMNS = {
+    3: "KR", 4: "EN", 5: "CN", 6: "TW",
+    7: "TH", 8: "PT", 9: "ES", 10: "DE",
+    11: "FR", 12: "JP"
+}
+
+
+def load_db_columns(db_folder: str, table_name: str) -> List[str]:
+    """db_folder/<table_name>.db 의 테이블 컬럼 목록을 반환합니다."""
+    db_path = os.path.join(db_folder, f"{table_name}.db")
+    if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+        logger.debug(f"유효한 DB 파일 없음: {db_path}")
+        return []
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            cur = conn.cursor()
+            try:
+                cur.execute(f'PRAGMA table_info("{table_name}")')
+            except sqlite3.Error:
+                cur.execute(f'PRAGMA table_info([{table_name}])')
+            return [row[1] for row in cur.fetchall()]
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.error(f"DB 컬럼 조회 오류: {db_path}/{table_name} - {e}")
+        # 오류 발생 후 0KB 파일이 생성되었다면 삭제
+        if os.path.exists(db_path) and os.path.getsize(db_path) == 0:
+            try:
+                os.remove(db_path)
+                logger.info(f"빈 DB 파일 삭제: {db_path}")
+            except Exception as del_e:
+                logger.error(f"빈 DB 파일 삭제 실패: {db_path} - {del_e}")
+        return []
+
+
+def detect_header_row(top_rows: Sequence[Sequence[Any]], db_columns: List[str]) -> int:
+    """
+    상단 행들에서 헤더 행(0-based)을 찾습니다. (ExcelFileManager.find_header_row와 같은 규칙)
+    3~4행을 우선 확인하고, 없으면 5~10행에서 첫 번째 DB 컬럼명을 찾습니다.
+    """
+    if not db_columns:
+        return DEFAULT_HEADER_ROW
+
+    for row_idx in PRIORITY_HEADER_ROWS:
+        if row_idx >= len(top_rows):
+            continue
+        row = top_rows[row_idx]
+        if db_columns[0] in row:
+            return row_idx
+        if len(db_columns) >= 3 and sum(1 for col in db_columns[:3] if col in row) >= 2:
+            return row_idx
+
+    for row_idx in EXTENDED_HEADER_ROWS:
+        if row_idx < len(top_rows) and db_columns[0] in top_rows[row_idx]:
+            return row_idx
+    return DEFAULT_HEADER_ROW
+
+
+def find_explicit_pk(top_rows: Sequence[Sequence[Any]], header_row: int) -> Optional[str]:
+    """헤더 위쪽 행에서 ':pk' 표시가 있는 열을 찾아 헤더 행의 컬럼명을 반환합니다."""
+    if header_row >= len(top_rows):
+        return None
+    header = top_rows[header_row]
+    for row in top_rows[:header_row]:
+        for col_idx, value in enumerate(row):
+            if isinstance(value, str) and ":pk" in value:
+                candidate = header[col_idx] if col_idx < len(header) else None
+                if isinstance(candidate, str):
+                    return candidate.strip()
+    return None
+
+
+def build_column_positions(header: Sequence[Any]) -> Dict[str, int]:
+    """헤더 행 값으로 {컬럼명: 컬럼 번호(1부터)}를 만듭니다."""
+    column_positions = {}
+    for idx, col_name in enumerate(header, 1):
+        if col_name is None:
+            continue
+        col_str = str(col_name).strip().upper()
+        if 'VARCHAR' in col_str or 'NTEXT' in col_str or ':PK' in col_str:
+            if idx == 2:
+                column_positions["STRING_ID"] = idx
+            elif idx in TYPED_LANGUAGE_COLUMNS:
+                column_positions[TYPED_LANGUAGE_COLUMNS[idx]] = idx
+        elif col_str:
+            column_positions[col_str] = idx
+    return column_positions
+
+
+def analyze_sheet(worksheet, db_columns: List[str], header_row_override: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    시트를 한 번만 읽어 헤더 행, ':pk' 컬럼, 컬럼 위치, 데이터 행 수를 구합니다.
+
+    데이터 행 수는 기존 pd.read_excel(header=header_row)의 len(df)와 같습니다.
+    헤더 아래 마지막 비어 있지 않은 행까지 세며(중간의 빈 행 포함), 빈 시트와 헤더만 있는 시트는 0입니다.
+
+    Returns:
+        {"header_row", "explicit_pk", "column_positions", "rows"}
+        또는 None (시트가 헤더 행보다 짧아 pandas에서도 읽기 오류가 나던 시트)
+    """
+    top_rows = []
+    last_non_empty_row = -1   # 마지막 비어 있지 않은 행 번호(0-based)
+    for row_idx, values in enumerate(worksheet.iter_rows(values_only=True)):
+        if row_idx < SCAN_ROWS:
+            top_rows.append(values)
+        if any(value is not None and value != "" for value in values):
+            last_non_empty_row = row_idx
+
+    header_row = header_row_override if header_row_override is not None else detect_header_row(top_rows, db_columns)
+    if 0 <= last_non_empty_row < header_row:
+        return None
+
+    if header_row < len(top_rows):
+        header = top_rows[header_row]
+    else:
+        header = next(worksheet.iter_rows(min_row=header_row + 1, max_row=header_row + 1, values_only=True), ())
+
+    return {
+        "header_row": header_row,
+        "explicit_pk": find_explicit_pk(top_rows, header_row),
+        "column_positions": build_column_positions(header),
+        "rows": max(last_non_empty_row - header_row, 0),
+    }
+
+
+def analyze_workbook(file_path: str, db_folder: Optional[str] = None, header_row_override: Optional[int] = None,
+                     pk_override_dict: Optional[Dict[str, List[str]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    엑셀 파일의 시트와 내용을 분석합니다. (예외 PK 처리 포함)
+
+    Returns:
+        {시트명: 시트 메타 정보} - 실패 시 빈 딕셔너리
+    """
+    result = {}
+    db_columns_cache = {}
+    try:
+        with XlsxStreamWorkbook(file_path) as workbook:
+            for sheet_name in workbook.sheetnames:
+                if sheet_name.startswith("#"):
+                    continue
+                try:
+                    table_name = sheet_name.split("@")[0].replace(".xlsx", "")
+                    table_base_lower = table_name.lower()
+
+                    if db_folder:
+                        if table_name not in db_columns_cache:
+                            db_columns_cache[table_name] = load_db_columns(db_folder, table_name)
+                        db_columns = db_columns_cache[table_name]
+                    else:
+                        db_columns = []
+
+                    analysis = analyze_sheet(workbook[sheet_name], db_columns, header_row_override)
+                    if analysis is None:
+                        logger.warning(f"시트 분석 건너뜀: {sheet_name} - 시트가 헤더 행보다 짧습니다")
+                        continue
+
+                    # 예외 규칙 적용
+                    if pk_override_dict and table_base_lower in pk_override_dict:
+                        explicit_pk_cols = pk_override_dict[table_base_lower]
+                    else:
+                        explicit_pk_cols = [analysis["explicit_pk"]] if analysis["explicit_pk"] else []
+
+                    result[sheet_name] = {
+                        "header_row": analysis["header_row"],
+                        "has_reward_group_id": "RewardGroupID" in db_columns,
+                        "has_reward_id": "RewardID" in db_columns,
+                        "columns": db_columns,
+                        "column_positions": analysis["column_positions"],
+                        "rows": analysis["rows"],
+                        "pk": explicit_pk_cols
+                    }
+                except Exception as e:
+                    logger.warning(f"시트 분석 실패: {sheet_name} - {e}")
+        return result
+    except Exception as e:
+        logger.error(f"엑셀 파일 분석 실패: {file_path} - {e}")
+        return {}
@@ -4,15 +4,16 @@ import sys  # 이 줄을 추가
 import pandas as pd
 import logging
 import time
-import sqlite3
 import json
 from typing import Dict, List, Union, Optional, Any, Tuple
 import openpyxl  # 추가 - 엑셀 파일 직접 처리용
 import traceback  # 추가 - 오류 추적용
 import re  # 추가 - 정규식 처리용
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from utils.common_utils import PathUtils, HashUtils, FileUtils, DBUtils, logger
 from utils.type_mappings import get_table_name_for_type, get_description_for_type, resolve_type_info
+from utils.excel_sheet_analyzer import analyze_workbook
 
 
 class ExcelFileManager:
@@ -135,146 +136,9 @@ class ExcelFileManager:
     def analyze_excel_file(file_path, db_folder=None, header_row_override=None, pk_override_dict=None):
         """
         엑셀 파일의 시트와 내용을 분석합니다. (예외 PK 처리 포함)
+        시트마다 한 번의 스트리밍 패스로 헤더 행, 컬럼 위치, PK 표시, 행 수를 수집합니다.
         """
-        result = {}
-
-        try:
-            with pd.ExcelFile(file_path, engine="openpyxl") as xls:
-                db_columns_cache = {}
-
-                for sheet_name in xls.sheet_names:
-                    try:
-                        if sheet_name.startswith("#"):
-                            continue
-
-                        sheet_meta = {}
-                        table_name = sheet_name.split("@")[0].replace(".xlsx", "")
-                        table_base_lower = table_name.lower()
-
-                        # DB 컬럼 캐시 처리
-                        if db_folder:
-                            if table_name not in db_columns_cache:
-                                db_path = os.path.join(db_folder, f"{table_name}.db")
-                                
-                                # 추가: 파일 존재 여부 확인 및 0KB 파일 검사
-                                if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
-                                    logger.debug(f"유효한 DB 파일 없음: {db_path}")
-                                    db_columns = []
-                                else:
-                                    try:
-                                        conn = sqlite3.connect(db_path)
-                                        cur = conn.cursor()
-                                        try:
-                                            cur.execute(f'PRAGMA table_info("{table_name}")')
-                                            db_columns = [row[1] for row in cur.fetchall()]
-                                        except:
-                                            cur.execute(f'PRAGMA table_info([{table_name}])')
-                                            db_columns = [row[1] for row in cur.fetchall()]
-                                        conn.close()
-                                    except Exception as e:
-                                        logger.error(f"DB 컬럼 조회 오류: {db_path}/{table_name} - {e}")
-                                        db_columns = []
-                                        # 추가: 오류 발생 후 0KB 파일이 생성되었다면 삭제
-                                        if os.path.exists(db_path) and os.path.getsize(db_path) == 0:
-                                            try:
-                                                os.remove(db_path)
-                                                logger.info(f"빈 DB 파일 삭제: {db_path}")
-                                            except Exception as del_e:
-                                                logger.error(f"빈 DB 파일 삭제 실패: {db_path} - {del_e}")
-                                        
-                                db_columns_cache[table_name] = db_columns
-                            db_columns = db_columns_cache.get(table_name, [])
-                        else:
-                            db_columns = []
-
-                        # 헤더 행 위치 결정
-                        header_row = header_row_override
-                        if header_row is None:
-                            header_row = ExcelFileManager.find_header_row(file_path, sheet_name, db_columns, xls)
-
-                        # 기본 :pk 방식
-                        explicit_pk_col = None
-                        try:
-                            df_top = pd.read_excel(xls, sheet_name=sheet_name, header=None, nrows=header_row + 1)
-                            for row_idx in range(header_row):
-                                for col_idx in range(len(df_top.columns)):
-                                    cell_val = df_top.iloc[row_idx, col_idx]
-                                    if isinstance(cell_val, str) and ":pk" in cell_val:
-                                        pk_candidate = df_top.iloc[header_row, col_idx]
-                                        if isinstance(pk_candidate, str):
-                                            explicit_pk_col = pk_candidate.strip()
-                                            break
-                                if explicit_pk_col:
-                                    break
-                            del df_top
-                        except Exception as e:
-                            logger.warning(f"[PK 검색 오류] {file_path}/{sheet_name}: {e}")
-
-                        # 예외 규칙 적용
-                        if pk_override_dict and table_base_lower in pk_override_dict:
-                            explicit_pk_cols = pk_override_dict[table_base_lower]
-                            print(f"[{sheet_name}] 예외 PK 강제 적용: {explicit_pk_cols}")
-                        else:
-                            explicit_pk_cols = [explicit_pk_col] if explicit_pk_col else []
-
-                        # 컬럼 위치 정보 구성
-                        column_positions = {}
-                        try:
-                            df_header = pd.read_excel(xls, sheet_name=sheet_name, header=None, skiprows=header_row, nrows=1)
-                            header_row_data = df_header.iloc[0].tolist()
-                            for idx, col_name in enumerate(header_row_data, 1):
-                                if pd.notna(col_name):
-                                    col_str = str(col_name).strip().upper()
-                                    if 'VARCHAR' in col_str or 'NTEXT' in col_str or ':PK' in col_str:
-                                        if idx == 2:
-                                            column_positions["STRING_ID"] = idx
-                                        elif 3 <= idx < 15:
-                                            lang_mapping = {
-                                                3: "KR", 4: "EN", 5: "CN", 6: "TW",
-                                                7: "TH", 8: "PT", 9: "ES", 10: "DE",
-                                                11: "FR", 12: "JP"
-                                            }
-                                            if idx in lang_mapping:
-                                                column_positions[lang_mapping[idx]] = idx
-                                    else:
-                                        if col_str:
-                                            column_positions[col_str] = idx
-                            del df_header
-                        except Exception as e:
-                            logger.warning(f"컬럼 위치 분석 오류: {file_path}, {sheet_name} - {e}")
-
-                        # 실제 데이터 수
-                        try:
-                            df = pd.read_excel(xls, sheet_name=sheet_name, header=header_row)
-                            # 필요한 작업 수행
-                            sheet_meta = {
-                                "header_row": header_row,
-                                "has_reward_group_id": "RewardGroupID" in db_columns,
-                                "has_reward_id": "RewardID" in db_columns,
-                                "columns": db_columns,
-                                "column_positions": column_positions,
-                                "rows": len(df),
-                                "pk": explicit_pk_cols
-                            }
-                            
-                            # DataFrame 명시적으로 삭제
-                            del df
-                            
-                        except Exception as df_error:
-                            logger.warning(f"DataFrame 처리 오류: {sheet_name} - {df_error}")
-                            continue
-                        
-                        result[sheet_name] = sheet_meta
-                    except Exception as e:
-                        logger.warning(f"시트 분석 실패: {sheet_name} - {e}")
-
-                if 'db_columns_cache' in locals():
-                    del db_columns_cache
-
-            return result
-        except Exception as e:
-            logger.error(f"엑셀 파일 분석 실패: {file_path} - {e}")
-            return {}
+        return analyze_workbook(file_path, db_folder, header_row_override, pk_override_dict)
 
 
     def find_explicit_pk_from_excel(file_path, sheet_name, header_row):
@@ -334,14 +198,16 @@ class ExcelFileManager:
 
 
     @staticmethod
-    def update_excel_cache(folder_path, cache_path=None, progress_callback=None):
+    def update_excel_cache(folder_path, cache_path=None, progress_callback=None, max_workers=None):
         """
         지정된 폴더의 모든 엑셀 파일을 스캔하여 캐시를 업데이트합니다.
+        변경된 파일만 작업 프로세스 풀에서 병렬로 분석하고, 캐시는 마지막에 한 번만 저장합니다.
         
         Args:
             folder_path: 엑셀 파일이 있는 폴더 경로
             cache_path: 캐시 저장 경로 (기본값: .cache/excel_cache.json)
             progress_callback: 진행 상황 콜백 함수 (선택적)
+            max_workers: 분석 프로세스 수 (기본값: CPU 수, 1이면 순차 처리)
             
         Returns:
             업데이트된 캐시 데이터 (dict)
@@ -379,15 +245,35 @@ class ExcelFileManager:
                     else:
                         new_cache[rel_path] = old_cache[rel_path]
         
-        # 변경된 파일만 분석
+        # 변경된 파일만 분석 (PK 예외 규칙은 한 번만 로드)
         total_files = len(files_to_scan)
-        for idx, (rel_path, path, mtime) in enumerate(files_to_scan):
-            if progress_callback:
-                progress_callback(f"엑셀 분석 중 [{idx+1}/{total_files}]: {os.path.basename(path)}")
-            
-            pk_override_dict = ExcelFileManager.load_pk_overrides()
-            sheets_result = ExcelFileManager.analyze_excel_file(path, folder_path, pk_override_dict=pk_override_dict)
+        pk_override_dict = ExcelFileManager.load_pk_overrides() if files_to_scan else {}
+        worker_count = min(max_workers or os.cpu_count() or 1, total_files)
+        results = {}
+
+        if worker_count <= 1:
+            for idx, (rel_path, path, mtime) in enumerate(files_to_scan):
+                if progress_callback:
+                    progress_callback(f"엑셀 분석 중 [{idx+1}/{total_files}]: {os.path.basename(path)}")
+                results[rel_path] = analyze_workbook(path, folder_path, None, pk_override_dict)
+        else:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                futures = {
+                    executor.submit(analyze_workbook, path, folder_path, None, pk_override_dict): (rel_path, path)
+                    for rel_path, path, _ in files_to_scan
+                }
+                for idx, future in enumerate(as_completed(futures)):
+                    rel_path, path = futures[future]
+                    if progress_callback:
+                        progress_callback(f"엑셀 분석 중 [{idx+1}/{total_files}]: {os.path.basename(path)}")
+                    try:
+                        results[rel_path] = future.result()
+                    except Exception as e:
+                        logger.error(f"엑셀 파일 분석 실패: {path} - {e}")
 
+        # 스캔 순서대로 캐시에 반영
+        for rel_path, path, mtime in files_to_scan:
+            sheets_result = results.get(rel_path)
             if sheets_result:
                 new_cache[rel_path] = {
                     "path": path,
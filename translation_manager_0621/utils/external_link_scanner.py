@@ -0,0 +1,146 @@
+# utils/external_link_scanner.py
+"""
+xlsx 외부 링크 사전 검사 (zip 수준)
+
+외부 링크를 확인하려고 워크북 전체를 openpyxl로 열고 명명된 범위와 앞쪽 셀 100개만 정규식으로 보면
+느리고, 100개 밖의 셀에 있는 외부 참조는 놓칩니다.
+xlsx에서 외부 통합 문서 참조는 셀 수식이 아니라
+- xl/_rels/workbook.xml.rels 의 externalLink 관계와 xl/externalLinks/externalLinkN.xml (+ 그 rels의 실제 경로)
+- workbook.xml 의 definedNames
+에 기록되며, 셀 수식의 외부 참조도 '[1]Sheet1!A1'처럼 externalLink 번호로 저장됩니다.
+그래서 zip 중앙 디렉터리와 이 작은 부품들만 읽으면 셀을 읽지 않고도 전체 워크북을 정확히 검사할 수 있습니다.
+"""
+
+import os
+import posixpath
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from utils.xlsx_stream_reader import STREAMABLE_EXTENSIONS, read_workbook_relationships
+
+_EXTERNAL_LINK_SUFFIX = "/externalLink"
+
+_RELATIONSHIP = re.compile(rb'<Relationship\b([^>]*)/?>')
+_ATTR = re.compile(rb'([\w:]+)="([^"]*)"')
+_DEFINED_NAME = re.compile(rb'<definedName\b([^>]*)>(.*?)</definedName>', re.S)
+_EXTERNAL_BOOK_REF = re.compile(r'\[\d+\]')
+_EXTERNAL_PATH_REF = re.compile(r"'?[^'!]*\.xl[a-z]{1,2}'?!|\[[^\]]*\.xl[a-z]{1,2}\]", re.I)
+_REF_ERROR = "#REF!"
+
+# 발견 항목 종류
+WORKBOOK_LINK = "workbook_link"             # externalLink 부품 (외부 통합 문서)
+EXTERNAL_TARGET = "external_target"         # TargetMode="External" 관계 (통합 문서 관계)
+NAME_LINK = "defined_name_link"             # 외부 통합 문서를 참조하는 명명된 범위
+NAME_REF_ERROR = "defined_name_ref_error"   # #REF! 명명된 범위
+
+LINK_KINDS = frozenset((WORKBOOK_LINK, EXTERNAL_TARGET, NAME_LINK))
+
+MAX_WORKERS = 16
+
+
+class UnreadableWorkbookError(Exception):
+    """[신규] xlsx/xlsm(zip) 부품을 읽을 수 없어 외부 링크를 검사하지 못한 파일 (링크 없음과 구분)"""
+
+
+class ExternalLinkFinding(NamedTuple):
+    """외부 링크 검사 결과 한 건"""
+    kind: str
+    name: str
+    detail: str
+
+    def describe(self) -> str:
+        labels = {
+            WORKBOOK_LINK: "워크북_외부링크", EXTERNAL_TARGET: "외부_관계",
+            NAME_LINK: "명명된_범위_외부링크", NAME_REF_ERROR: "명명된_범위_REF오류",
+        }
+        return f"{labels.get(self.kind, self.kind)}:{self.name} - {self.detail[:50]}"
+
+
+def _unescape(value: bytes) -> str:
+    text = value.decode("utf-8", "replace")
+    return (text.replace("&quot;", '"').replace("&apos;", "'")
+            .replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&"))
+
+
+def _relationships(data: bytes) -> List[Dict[str, str]]:
+    return [{key.decode(): _unescape(value) for key, value in _ATTR.findall(m.group(1))}
+            for m in _RELATIONSHIP.finditer(data)]
+
+
+def scan_external_links(file_path: str) -> List[ExternalLinkFinding]:
+    """
+    파일 하나의 외부 링크를 zip 부품만 읽어 찾습니다.
+
+    Raises:
+        zipfile.BadZipFile: xlsx(zip) 파일이 아님
+        KeyError: 워크북 부품이 없음
+    """
+    findings: List[ExternalLinkFinding] = []
+    with zipfile.ZipFile(file_path) as archive:
+        workbook_part, rels_path, _ = read_workbook_relationships(archive)
+        names = archive.NameToInfo
+        base_dir = posixpath.dirname(workbook_part)
+
+        if rels_path in names:
+            for rel in _relationships(archive.read(rels_path)):
+                rel_type, target = rel.get("Type", ""), rel.get("Target", "")
+                if rel.get("TargetMode") == "External":
+                    findings.append(ExternalLinkFinding(EXTERNAL_TARGET, rel.get("Id", ""), target))
+                    continue
+                if not rel_type.endswith(_EXTERNAL_LINK_SUFFIX):
+                    continue
+                # externalLinkN.xml 의 rels에 실제 외부 파일 경로가 있음
+                part = posixpath.normpath(posixpath.join(base_dir, target)) if not target.startswith("/") else target.lstrip("/")
+                link_rels = posixpath.join(posixpath.dirname(part), "_rels", posixpath.basename(part) + ".rels")
+                paths = []
+                if link_rels in names:
+                    paths = [r.get("Target", "") for r in _relationships(archive.read(link_rels))
+                             if r.get("TargetMode") == "External"]
+                findings.append(ExternalLinkFinding(WORKBOOK_LINK, posixpath.basename(part), ", ".join(paths) or part))
+
+        if workbook_part in names:
+            for m in _DEFINED_NAME.finditer(archive.read(workbook_part)):
+                attrs = {key.decode(): _unescape(value) for key, value in _ATTR.findall(m.group(1))}
+                formula = _unescape(m.group(2))
+                name = attrs.get("name", "")
+                if _REF_ERROR in formula:
+                    findings.append(ExternalLinkFinding(NAME_REF_ERROR, name, formula))
+                elif _EXTERNAL_BOOK_REF.search(formula) or _EXTERNAL_PATH_REF.search(formula):
+                    findings.append(ExternalLinkFinding(NAME_LINK, name, formula))
+    return findings
+
+
+def has_external_links(findings: Iterable[ExternalLinkFinding]) -> bool:
+    """외부 통합 문서 링크가 있는지 (#REF! 명명된 범위만 있으면 False)"""
+    return any(finding.kind in LINK_KINDS for finding in findings)
+
+
+def scan_many(file_paths: Iterable[str], max_workers: Optional[int] = None
+              ) -> Dict[str, Union[List[ExternalLinkFinding], UnreadableWorkbookError]]:
+    """
+    여러 파일을 스레드 풀로 동시에 검사합니다. (파일마다 작은 부품만 읽으므로 I/O 위주)
+    xlsx/xlsm이 아니거나 zip 부품을 읽을 수 없는 파일은 빈 목록(링크 없음)이 아니라
+    UnreadableWorkbookError를 돌려주므로 호출하는 쪽에서 따로 알려야 합니다.
+
+    Returns:
+        {파일 경로: 발견 항목 목록 또는 UnreadableWorkbookError}
+    """
+    file_paths = list(file_paths)
+
+    def scan(path):
+        if not path.lower().endswith(STREAMABLE_EXTENSIONS):
+            return path, UnreadableWorkbookError(f"xlsx/xlsm 파일이 아닙니다 ({os.path.splitext(path)[1] or '확장자 없음'})")
+        try:
+            return path, scan_external_links(path)
+        except zipfile.BadZipFile:
+            return path, UnreadableWorkbookError("xlsx(zip) 형식이 아니거나 손상된 파일입니다")
+        except Exception as e:
+            return path, UnreadableWorkbookError(f"파일을 읽을 수 없습니다: {e}")
+
+    if not file_paths:
+        return {}
+    workers = max_workers or min(MAX_WORKERS, len(file_paths), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(scan, file_paths))
@@ -0,0 +1,116 @@
+# utils/parallel_apply.py
+"""
+여러 엑셀 파일 번역 적용을 프로세스 풀로 병렬 처리
+
+번역 적용은 파일마다 openpyxl 로드/저장이 대부분이라 스레드로는 빨라지지 않으므로
+파일을 작업 프로세스에 나눠 줍니다. 번역 캐시(translation_cache / kr_reverse_cache)는
+작업마다 피클링해서 보내지 않고, 한 번 번역 스냅샷 파일로 쓴 뒤 각 작업 프로세스가
+시작할 때 mmap으로 열어 공유합니다. (이미 스냅샷에서 불러온 캐시라면 그 파일을 그대로 사용)
+
+작업 프로세스의 로그는 결과에 담아 돌려주고, 부모 프로세스에서 매니저의 log_message로 출력합니다.
+"""
+
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.translation_snapshot import SnapshotIndexView, TranslationSnapshot, write_cache_snapshot
+
+logger = logging.getLogger('app')
+
+# 작업 프로세스마다 한 번 만드는 매니저 (스냅샷 캐시 사용)
+_worker_manager = None
+_worker_logs: List[str] = []
+
+
+def default_worker_count(file_count: int) -> int:
+    """파일 수와 CPU 수로 작업 프로세스 수를 정합니다. (UI용으로 코어 하나는 남김)"""
+    return max(1, min(file_count, (os.cpu_count() or 2) - 1))
+
+
+def _init_worker(manager_class, snapshot_path: str):
+    """작업 프로세스 초기화: 스냅샷을 열고 로그를 모으는 매니저를 만듭니다."""
+    global _worker_manager
+    snapshot = TranslationSnapshot(snapshot_path)
+    manager = manager_class(parent_window=None)
+    manager.snapshot = snapshot
+    manager.translation_cache = snapshot.id_view()
+    manager.kr_reverse_cache = snapshot.kr_view()
+    manager.log_message = _worker_logs.append
+    _worker_manager = manager
+
+
+def _apply_in_worker(method_name: str, file_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 프로세스에서 파일 하나에 번역을 적용하고 결과와 로그를 반환합니다."""
+    del _worker_logs[:]
+    try:
+        result = getattr(_worker_manager, method_name)(file_path, options)
+    except Exception as e:
+        result = {"status": "error", "message": str(e), "error_type": "processing_error"}
+    result = dict(result)
+    result["log_messages"] = list(_worker_logs)
+    return result
+
+
+def _shared_snapshot_path(manager) -> Optional[str]:
+    """두 캐시가 같은 스냅샷의 뷰라면 그 스냅샷 경로를 반환합니다."""
+    id_cache, kr_cache = manager.translation_cache, manager.kr_reverse_cache
+    if isinstance(id_cache, SnapshotIndexView) and isinstance(kr_cache, SnapshotIndexView):
+        if id_cache.snapshot is kr_cache.snapshot:
+            return id_cache.snapshot.path
+    return None
+
+
+def iter_parallel_apply(manager, method_name: str, file_paths: List[str], options: Dict[str, Any],
+                        max_workers: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    매니저의 파일 단위 적용 메서드를 여러 파일에 병렬로 실행합니다.
+
+    Args:
+        manager: translation_cache / kr_reverse_cache / log_message 를 가진 번역 적용 매니저
+        method_name: 작업 프로세스에서 호출할 메서드 이름 (file_path, options를 받음)
+        file_paths: 적용할 엑셀 파일 경로 목록
+        options: 적용 옵션 (모든 파일에 동일)
+        max_workers: 작업 프로세스 수 (없으면 default_worker_count)
+
+    Yields:
+        완료된 순서대로 (파일 경로, 결과 딕셔너리)
+    """
+    if not file_paths:
+        return
+
+    snapshot_path = _shared_snapshot_path(manager)
+    temp_path = None
+    if snapshot_path is None:
+        fd, temp_path = tempfile.mkstemp(prefix="translation_apply_", suffix=".snapshot")
+        os.close(fd)
+        write_cache_snapshot(manager.translation_cache, manager.kr_reverse_cache, temp_path)
+        snapshot_path = temp_path
+
+    workers = max_workers or default_worker_count(len(file_paths))
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(type(manager), snapshot_path)) as executor:
+            futures = {
+                executor.submit(_apply_in_worker, method_name, file_path, options): file_path
+                for file_path in file_paths
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # 작업 프로세스 비정상 종료 등
+                    result = {"status": "error", "message": str(e), "error_type": "worker_error",
+                              "log_messages": [f"   ❌ {os.path.basename(file_path)} 오류: {e}"]}
+                for message in result.pop("log_messages", []):
+                    manager.log_message(message)
+                yield file_path, result
+    finally:
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError as e:
+                logger.warning(f"임시 번역 스냅샷 삭제 실패: {temp_path} - {e}")
@@ -0,0 +1,139 @@
+# utils/resolution_store.py
+"""
+번역 충돌 해결 내용 저장소 (user_resolutions.db)
+
+해결 내용을 저장할 때마다 연결을 새로 열고 커밋하면 충돌 수천 건을 해결할 때
+같은 수만큼 fsync가 일어납니다. 이 저장소는
+- 연결 하나를 WAL 모드로 계속 열어 두고
+- 저장할 해결 내용을 메모리에 모았다가 (같은 KR은 마지막 값만)
+  대화상자를 닫을 때나 flush_threshold 건이 쌓였을 때 executemany 한 번(트랜잭션 하나)으로 기록하며
+- 현재 KR 목록의 해결 내용은 임시 테이블 조인 한 번으로 조회합니다.
+
+UI 스레드와 작업 스레드에서 함께 쓰므로 연결 사용은 잠금으로 보호합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger('app')
+
+DEFAULT_FLUSH_THRESHOLD = 500
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ResolutionStore:
+    """resolved_translations 테이블을 연결 하나로 묶어서 읽고 쓰는 저장소"""
+
+    def __init__(self, db_path: str, flush_threshold: int = DEFAULT_FLUSH_THRESHOLD):
+        self.db_path = db_path
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[str, tuple] = {}
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS resolved_translations (
+                    kr_text TEXT PRIMARY KEY,
+                    cn_text TEXT,
+                    tw_text TEXT,
+                    resolved_at TEXT
+                )
+            ''')
+            self._conn.commit()
+        except Exception:
+            self._conn.close()
+            raise
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def queue(self, kr_text: str, cn_text: str, tw_text: str) -> None:
+        """해결 내용을 저장 대기열에 넣습니다. flush_threshold 건이 쌓이면 바로 기록합니다."""
+        with self._lock:
+            self._pending[kr_text] = (kr_text, cn_text, tw_text, _now())
+            if len(self._pending) >= self.flush_threshold:
+                self.flush()
+
+    def flush(self) -> int:
+        """대기 중인 해결 내용을 트랜잭션 하나로 기록하고 기록한 건수를 반환합니다."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = list(self._pending.values())
+            with self._conn:
+                self._conn.executemany('''
+                    INSERT OR REPLACE INTO resolved_translations (kr_text, cn_text, tw_text, resolved_at)
+                    VALUES (?, ?, ?, ?)
+                ''', rows)
+            self._pending.clear()
+            return len(rows)
+
+    def load(self, kr_texts: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, str]]:
+        """
+        해결 내용을 {KR: {'cn', 'tw'}} 형태로 반환합니다.
+
+        Args:
+            kr_texts: 조회할 KR 목록 (None이면 전체). 임시 테이블 조인 한 번으로 조회합니다.
+        """
+        with self._lock:
+            self.flush()
+            if kr_texts is None:
+                rows = self._conn.execute("SELECT kr_text, cn_text, tw_text FROM resolved_translations").fetchall()
+            else:
+                self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted_kr (kr_text TEXT PRIMARY KEY)")
+                try:
+                    self._conn.execute("DELETE FROM wanted_kr")
+                    self._conn.executemany("INSERT OR IGNORE INTO wanted_kr (kr_text) VALUES (?)",
+                                           ((kr_text,) for kr_text in kr_texts))
+                    rows = self._conn.execute('''
+                        SELECT r.kr_text, r.cn_text, r.tw_text
+                        FROM wanted_kr w JOIN resolved_translations r ON r.kr_text = w.kr_text
+                    ''').fetchall()
+                finally:
+                    self._conn.execute("DELETE FROM wanted_kr")
+                    self._conn.commit()
+        return {kr_text: {'cn': cn_text, 'tw': tw_text} for kr_text, cn_text, tw_text in rows}
+
+    def all(self) -> List[dict]:
+        """모든 해결 내역을 최근 순으로 반환합니다."""
+        with self._lock:
+            self.flush()
+            cursor = self._conn.execute(
+                "SELECT kr_text, cn_text, tw_text, resolved_at FROM resolved_translations ORDER BY resolved_at DESC"
+            )
+            columns = [col[0] for col in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def update(self, kr_text: str, cn_text: str, tw_text: str) -> None:
+        """이미 저장된 해결 내역 하나를 수정합니다."""
+        with self._lock:
+            self.flush()
+            with self._conn:
+                self._conn.execute('''
+                    UPDATE resolved_translations SET cn_text = ?, tw_text = ?, resolved_at = ?
+                    WHERE kr_text = ?
+                ''', (cn_text, tw_text, _now(), kr_text))
+
+    def delete(self, kr_text: str) -> None:
+        """해결 내역 하나를 삭제합니다. (대기 중인 내용 포함)"""
+        with self._lock:
+            self._pending.pop(kr_text, None)
+            with self._conn:
+                self._conn.execute("DELETE FROM resolved_translations WHERE kr_text = ?", (kr_text,))
+
+    def close(self) -> None:
+        """대기 중인 내용을 기록하고 연결을 닫습니다."""
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                self._conn.close()
@@ -0,0 +1,261 @@
+# utils/string_sheet_reader.py
+"""
+String 시트 공용 리더
+
+번역 도구의 모든 매니저가 같은 규칙으로 String 시트를 읽도록
+헤더 탐지, 언어 별칭(ZH -> CN) 처리, 데이터 행 스트리밍을 한 곳에 모아 둡니다.
+헤더는 시트당 한 번만 찾고, 데이터 행은 필요한 컬럼만 담은 튜플로 생성기에서 반환합니다.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+# 헤더 탐색 범위 (1행부터 이 행까지)
+HEADER_SCAN_ROWS = 10
+STRING_ID_HEADER = "STRING_ID"
+
+# 엑셀 헤더 별칭 -> 표준 언어 코드
+LANGUAGE_ALIASES = {"ZH": "CN"}
+
+ACTIVE_STATUS = "active"
+INACTIVE_STATUS = "비활성"
+
+
+def is_string_sheet(sheet_name: str) -> bool:
+    """번역 대상 String 시트인지 확인합니다. ('#'으로 시작하는 시트는 제외)"""
+    return sheet_name.lower().startswith("string") and not sheet_name.startswith("#")
+
+
+def normalize_header(value: Any) -> str:
+    """헤더 값을 비교용 문자열(앞뒤 공백 제거, 대문자)로 변환합니다."""
+    if value is None:
+        return ""
+    return str(value).strip().upper()
+
+
+def row_status(first_cell: Any) -> str:
+    """A열 값이 '#'으로 시작하면 비활성 행으로 판단합니다."""
+    return INACTIVE_STATUS if str(first_cell or "").strip().startswith("#") else ACTIVE_STATUS
+
+
+class SheetHeader(NamedTuple):
+    """시트의 헤더 정보"""
+    row: int                    # 헤더 행 번호 (1부터)
+    string_id_col: int          # STRING_ID 컬럼 번호 (1부터)
+    columns: Dict[str, int]     # 정규화된 헤더명 -> 컬럼 번호 (중복 시 첫 번째 컬럼)
+    labels: Dict[int, str]      # 컬럼 번호 -> 원본 헤더 텍스트 (공백 제거)
+
+    def find(self, name: str) -> Optional[int]:
+        """헤더명으로 컬럼 번호를 찾습니다. (대소문자, 앞뒤 공백 무시)"""
+        return self.columns.get(normalize_header(name))
+
+    def language_columns(self, languages: Iterable[str], aliases: Dict[str, str] = LANGUAGE_ALIASES) -> Dict[str, int]:
+        """
+        언어 코드별 컬럼 번호를 찾습니다.
+
+        Args:
+            languages: 찾을 언어 코드 목록 (예: ["KR", "CN"])
+            aliases: 헤더 별칭 -> 표준 언어 코드 (예: {"ZH": "CN"})
+
+        Returns:
+            {표준 언어 코드(대문자): 컬럼 번호} - 시트에 있는 언어만 포함
+        """
+        lang_cols = {}
+        for lang in languages:
+            lang_upper = normalize_header(lang)
+            col = self.columns.get(lang_upper)
+            if col is None:
+                for alias, main in aliases.items():
+                    if normalize_header(main) == lang_upper and normalize_header(alias) in self.columns:
+                        col = self.columns[normalize_header(alias)]
+                        break
+            if col is not None:
+                lang_cols[lang_upper] = col
+        return lang_cols
+
+
+class StringRow(NamedTuple):
+    """String 시트의 데이터 행 하나"""
+    row: int                    # 엑셀 행 번호 (1부터)
+    string_id: Any              # STRING_ID 원본 값
+    status: str                 # 'active' 또는 '비활성'
+    values: Tuple[Any, ...]     # StringSheet.fields 순서의 원본 값
+
+
+def parse_header(rows: Iterable[Sequence[Any]], scan_rows: int = HEADER_SCAN_ROWS) -> Optional[SheetHeader]:
+    """
+    행 값 목록에서 STRING_ID 헤더 행을 찾습니다.
+
+    기존 매니저들과 같이 대소문자를 무시하고 "STRING_ID"를 포함하는 셀이 있는 첫 행을 헤더로 봅니다.
+    (예: "#STRING_ID", "String_ID(키)") 한 행에 여러 개면 정확히 "STRING_ID"인 셀을, 없으면 첫 셀을 씁니다.
+    STRING_ID 컬럼은 원래 헤더명과 관계없이 find("STRING_ID")로도 찾을 수 있습니다.
+
+    Args:
+        rows: 1행부터 시작하는 행 값 시퀀스
+        scan_rows: 탐색할 최대 행 수
+
+    Returns:
+        SheetHeader 또는 None (헤더가 없을 때)
+    """
+    for row_idx, values in enumerate(rows, start=1):
+        if row_idx > scan_rows:
+            break
+        if not values:
+            continue
+
+        columns = {}
+        labels = {}
+        for col_idx, value in enumerate(values, start=1):
+            if value is None:
+                continue
+            label = str(value).strip()
+            if not label:
+                continue
+            labels[col_idx] = label
+            columns.setdefault(label.upper(), col_idx)
+
+        string_id_col = columns.get(STRING_ID_HEADER) or next(
+            (col for name, col in columns.items() if STRING_ID_HEADER in name), None
+        )
+        if string_id_col is not None:
+            columns.setdefault(STRING_ID_HEADER, string_id_col)
+            return SheetHeader(row_idx, string_id_col, columns, labels)
+    return None
+
+
+def read_header(worksheet, scan_rows: int = HEADER_SCAN_ROWS) -> Optional[SheetHeader]:
+    """워크시트 상단에서 헤더를 한 번만 읽어 반환합니다."""
+    return parse_header(worksheet.iter_rows(min_row=1, max_row=scan_rows, values_only=True), scan_rows)
+
+
+class StringSheet:
+    """헤더가 확인된 String 시트와 읽을 컬럼 구성"""
+
+    __slots__ = ("worksheet", "header", "fields", "columns", "_positions")
+
+    def __init__(self, worksheet, header: SheetHeader, fields: Dict[str, int]):
+        self.worksheet = worksheet
+        self.header = header
+        self.fields = tuple(fields)              # 값 튜플의 필드 이름 순서
+        self.columns = dict(fields)              # 필드 이름 -> 컬럼 번호
+        self._positions = {name: i for i, name in enumerate(self.fields)}
+
+    @property
+    def string_id_col(self) -> int:
+        return self.header.string_id_col
+
+    @property
+    def header_row(self) -> int:
+        return self.header.row
+
+    def has(self, field: str) -> bool:
+        return field in self._positions
+
+    def index(self, field: str) -> Optional[int]:
+        """필드 이름에 해당하는 값 튜플 위치를 반환합니다."""
+        return self._positions.get(field)
+
+    def value(self, row: StringRow, field: str, default: Any = None) -> Any:
+        pos = self._positions.get(field)
+        return default if pos is None else row.values[pos]
+
+    def to_dict(self, row: StringRow) -> Dict[str, Any]:
+        """행 값을 {소문자 필드명: 값} 딕셔너리로 변환합니다."""
+        return {name.lower(): value for name, value in zip(self.fields, row.values)}
+
+    def rows(self, require_string_id: bool = True) -> Iterator[StringRow]:
+        """
+        헤더 다음 행부터 데이터 행을 스트리밍합니다.
+
+        Args:
+            require_string_id: True면 STRING_ID가 빈 행은 건너뜁니다.
+
+        Yields:
+            StringRow
+        """
+        sid_pos = self.header.string_id_col - 1
+        positions = [col - 1 for col in self.columns.values()]
+        max_col = max([self.header.string_id_col, 1] + list(self.columns.values()))
+
+        kwargs = {}
+        if getattr(self.worksheet, "supports_column_filter", False):
+            # 스트리밍 리더는 A열(상태), STRING_ID, 읽을 필드 컬럼의 값만 만듭니다.
+            kwargs["columns"] = {1, self.header.string_id_col, *self.columns.values()}
+        row_iter = self.worksheet.iter_rows(min_row=self.header.row + 1, max_col=max_col, values_only=True, **kwargs)
+        for row_idx, values in enumerate(row_iter, start=self.header.row + 1):
+            length = len(values) if values else 0
+            string_id = values[sid_pos] if sid_pos < length else None
+            if require_string_id and not string_id:
+                continue
+            first_cell = values[0] if length else None
+            yield StringRow(
+                row_idx,
+                string_id,
+                row_status(first_cell),
+                tuple(values[pos] if pos < length else None for pos in positions),
+            )
+
+
+def open_string_sheet(worksheet, languages: Iterable[str] = (), extra_columns: Iterable[str] = (),
+                      aliases: Dict[str, str] = LANGUAGE_ALIASES, header: Optional[SheetHeader] = None) -> Optional[StringSheet]:
+    """
+    워크시트의 헤더를 찾아 읽을 컬럼을 구성합니다.
+
+    Args:
+        worksheet: openpyxl 워크시트 또는 XlsxStreamSheet (iter_rows(values_only=True) 지원 객체)
+        languages: 읽을 언어 코드 목록 (별칭 자동 처리, 필드명은 대문자 언어 코드)
+        extra_columns: 추가로 읽을 헤더명 목록 (필드명은 전달한 이름 그대로)
+        aliases: 언어 별칭 매핑
+        header: 이미 읽은 헤더 (없으면 새로 탐지)
+
+    Returns:
+        StringSheet 또는 None (STRING_ID 헤더가 없을 때)
+    """
+    if header is None:
+        header = read_header(worksheet)
+    if header is None:
+        return None
+
+    fields = dict(header.language_columns(languages, aliases))
+    for name in extra_columns:
+        col = header.find(name)
+        if col is not None and name not in fields:
+            fields[name] = col
+    return StringSheet(worksheet, header, fields)
+
+
+def iter_string_sheets(workbook, languages: Iterable[str] = (), extra_columns: Iterable[str] = (),
+                       require_languages: bool = False,
+                       aliases: Dict[str, str] = LANGUAGE_ALIASES,
+                       only_sheets: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, StringSheet]]:
+    """
+    워크북의 String 시트를 순회하며 (시트명, StringSheet)를 반환합니다.
+
+    Args:
+        workbook: openpyxl 워크북
+        languages: 읽을 언어 코드 목록
+        extra_columns: 추가로 읽을 헤더명 목록
+        require_languages: True면 언어 컬럼이 하나도 없는 시트는 건너뜁니다.
+        aliases: 언어 별칭 매핑
+        only_sheets: 지정하면 이 목록에 있는 시트만 읽습니다.
+    """
+    languages = list(languages)
+    extra_columns = list(extra_columns)
+    only_sheets = set(only_sheets) if only_sheets is not None else None
+    for sheet_name in workbook.sheetnames:
+        if not is_string_sheet(sheet_name):
+            continue
+        if only_sheets is not None and sheet_name not in only_sheets:
+            continue
+        sheet = open_string_sheet(workbook[sheet_name], languages, extra_columns, aliases)
+        if sheet is None:
+            continue
+        if require_languages and not any(sheet.has(normalize_header(lang)) for lang in languages):
+            continue
+        yield sheet_name, sheet
+
+
+def header_map_by_column(header: Optional[SheetHeader]) -> Tuple[Optional[Dict[int, str]], int]:
+    """기존 UI 코드 호환용: ({컬럼 번호: 대문자 헤더명}, 헤더 행) 형태로 변환합니다."""
+    if header is None:
+        return None, -1
+    return {col: label.upper() for col, label in header.labels.items()}, header.row
@@ -0,0 +1,236 @@
+# utils/translation_apply_engine.py
+"""
+번역 적용 엔진 (행 단위 일괄 읽기 + 변경 목록)
+
+기존 적용 루프는 데이터 행마다 worksheet.cell(row, col)로 요청 컬럼, 키 컬럼, KR 컬럼,
+언어 컬럼을 하나씩 읽고 바로 썼습니다.
+이 엔진은 String 시트에서 필요한 컬럼만 StringSheet.rows()로 한 번에 읽어
+"어느 셀에 어떤 값/채우기를 쓸지" 변경 목록(SheetChangeSet)을 먼저 계산하고,
+실제 쓰기는 write_file_changes()가 변경 목록을 utils.xlsx_patch_writer.save_edits()에 넘겨 변경되는 셀만 고칩니다.
+ID 기반/KR 기반 적용이 같은 엔진을 사용하며, 조회 캐시만 다르게 넘깁니다.
+
+변경 목록은 읽기 전용 워크북(utils.xlsx_stream_reader.open_workbook_for_read)에서도 계산할 수 있으므로
+적용은 두 단계로 나뉩니다.
+1) 계획: 모든 대상 파일을 읽기 전용으로 읽어 파일별 변경 목록을 만듭니다. (미리보기는 여기서 끝)
+2) 쓰기: 변경 목록이 있는 파일만 write_file_changes()로 저장합니다.
+   xlsx/xlsm 은 시트 XML을 직접 수정하고(utils.xlsx_patch_writer), 직접 수정할 수 없는 파일만 openpyxl로 엽니다.
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from utils.string_sheet_reader import StringSheet
+from utils.xlsx_patch_writer import CellEdit, save_edits
+
+REQUEST_COLUMN = "#번역요청"
+
+# 셀 채우기 종류
+FILL_NEW = "new"                # 빈 칸에 신규 적용
+FILL_OVERWRITE = "overwrite"    # 기존 값 덮어씀
+FILL_FILTERED = "filtered"      # 특수 필터 캐시로 신규 적용
+
+# 채우기 종류별 단색 RGB
+FILL_COLORS = {
+    FILL_NEW: "DAF2D0",
+    FILL_OVERWRITE: "FFDDC1",   # '덮어씀' 표시용
+    FILL_FILTERED: "D0E7FF",
+}
+
+
+class CellChange(NamedTuple):
+    """쓸 셀 하나"""
+    row: int
+    column: int
+    value: Any
+    fill: Optional[str] = None  # FILL_* 또는 None (채우기 유지)
+
+
+class ApplyRules(NamedTuple):
+    """적용 옵션을 엔진용으로 정리한 규칙"""
+    mode: str = "id"                            # 'id' 또는 'kr'
+    languages: Tuple[str, ...] = ()             # 적용할 언어 코드 (KR 제외)
+    kr_match_check: bool = True                 # ID 모드에서 KR 일치 여부 확인
+    kr_mismatch_delete: bool = False            # KR 불일치 시 번역 삭제
+    overwrite: bool = False                     # 값이 다른 셀 덮어쓰기
+    allowed_statuses: Tuple[str, ...] = ()      # 적용할 #번역요청 값 (소문자)
+    applied_mark: Optional[str] = None          # 적용한 행의 #번역요청에 쓸 값 (None이면 기록 안 함)
+    new_fill: str = FILL_NEW                    # 신규 적용 셀의 채우기 종류
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any], languages, filtered: bool = False) -> "ApplyRules":
+        """번역 적용 옵션 딕셔너리로 규칙을 만듭니다."""
+        mode = options.get("mode", "id")
+        kr_match_check = options.get("kr_match_check", True)
+        overwrite = (mode == 'id' and kr_match_check and options.get("kr_overwrite", False)) or \
+                    (mode == 'kr' and options.get("kr_overwrite_on_kr_mode", False))
+        mark = ("특수필터적용" if filtered else "적용") if options.get("record_date", True) else None
+        return cls(
+            mode=mode,
+            languages=tuple(lang for lang in languages if lang != 'KR'),
+            kr_match_check=kr_match_check,
+            kr_mismatch_delete=options.get("kr_mismatch_delete", False),
+            overwrite=bool(overwrite),
+            allowed_statuses=tuple(status.lower() for status in options.get("allowed_statuses", []) or []),
+            applied_mark=mark,
+            new_fill=FILL_FILTERED if filtered else FILL_NEW,
+        )
+
+
+class SheetChangeSet:
+    """시트 하나의 적용 계획 (변경할 셀, 통계, 덮어쓴 항목)"""
+
+    __slots__ = ("changes", "stats", "lang_counts", "overwritten")
+
+    def __init__(self, languages):
+        self.changes: List[CellChange] = []
+        self.stats = defaultdict(int)           # updated / overwritten / conditional_skipped / kr_mismatch_*
+        self.lang_counts = {lang: 0 for lang in languages}
+        self.overwritten: List[Dict[str, Any]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+
+def _text(value: Any) -> str:
+    """셀 값을 비교용 문자열로 변환합니다. (None -> '')"""
+    return str(value or '').strip()
+
+
+def plan_sheet_changes(sheet: StringSheet, rules: ApplyRules, id_cache: Mapping,
+                       kr_cache: Optional[Mapping] = None) -> SheetChangeSet:
+    """
+    String 시트를 한 번 읽어 적용할 변경 목록을 계산합니다. (워크시트는 수정하지 않음)
+
+    Args:
+        sheet: 언어 컬럼과 #번역요청 컬럼을 포함해 연 StringSheet
+        rules: 적용 규칙
+        id_cache: {STRING_ID: 번역 데이터} (ID 모드)
+        kr_cache: {KR 텍스트: 번역 데이터} (KR 모드)
+
+    Returns:
+        SheetChangeSet
+    """
+    plan = SheetChangeSet(rules.languages)
+    changes, stats = plan.changes, plan.stats
+
+    kr_pos = sheet.index('KR')
+    request_pos = sheet.index(REQUEST_COLUMN)
+    request_col = sheet.columns.get(REQUEST_COLUMN)
+    targets = [(lang, lang.lower(), sheet.index(lang), sheet.columns[lang])
+               for lang in rules.languages if sheet.has(lang)]
+    check_status = bool(rules.allowed_statuses) and request_pos is not None
+    by_kr = rules.mode != 'id'
+    lookup = kr_cache if by_kr else id_cache
+    check_kr = not by_kr and rules.kr_match_check
+    mark = rules.applied_mark if request_col else None
+
+    for row in sheet.rows(require_string_id=False):
+        values = row.values
+        if check_status and _text(values[request_pos]).lower() not in rules.allowed_statuses:
+            stats["conditional_skipped"] += 1
+            continue
+
+        if by_kr:
+            if kr_pos is None:
+                continue
+            key_value = _text(values[kr_pos])
+        else:
+            key_value = _text(row.string_id)
+        trans_data = lookup.get(key_value) if key_value else None
+        if not trans_data:
+            continue
+
+        row_no = row.row
+        if check_kr:
+            current_kr = _text(values[kr_pos]) if kr_pos is not None else ''
+            if current_kr != _text(trans_data.get('kr')):
+                if rules.kr_mismatch_delete:
+                    deleted = [CellChange(row_no, col, "") for _, _, pos, col in targets if values[pos]]
+                    if deleted:
+                        changes.extend(deleted)
+                        stats["kr_mismatch_deleted"] += 1
+                else:
+                    stats["kr_mismatch_skipped"] += 1
+                continue
+
+        row_changed = False
+        for lang, lang_lower, pos, col in targets:
+            cached_val = _text(trans_data.get(lang_lower))
+            if not cached_val:
+                continue
+            original = values[pos]
+            current_val = _text(original)
+            if current_val == cached_val:
+                continue
+            if rules.overwrite:
+                changes.append(CellChange(row_no, col, cached_val, FILL_OVERWRITE))
+                stats["overwritten"] += 1
+                plan.overwritten.append({
+                    "string_id": trans_data.get('string_id', key_value),
+                    "language": lang, "kr_text": trans_data.get('kr', ''),
+                    "original_text": "" if original is None else str(original).strip(),
+                    "overwritten_text": cached_val
+                })
+            elif not current_val:
+                changes.append(CellChange(row_no, col, cached_val, rules.new_fill))
+                stats["updated"] += 1
+            else:
+                continue
+            plan.lang_counts[lang] += 1
+            row_changed = True
+
+        if row_changed and mark:
+            changes.append(CellChange(row_no, request_col, mark))
+    return plan
+
+
+def write_file_changes(file_path: str, sheet_changes: Mapping[str, List[CellChange]]) -> int:
+    """
+    변경할 시트가 있는 파일에만 변경 목록을 쓰고 저장합니다.
+    (xlsx/xlsm 은 시트 XML 직접 수정, 직접 수정할 수 없으면 openpyxl로 저장)
+
+    Args:
+        sheet_changes: {시트명: 변경 목록} (비어 있으면 파일을 열지 않음)
+
+    Returns:
+        쓴 셀 수
+    """
+    return save_edits(file_path, [
+        CellEdit(sheet_name, change.row, change.column, change.value,
+                 FILL_COLORS[change.fill] if change.fill is not None else None)
+        for sheet_name, changes in sheet_changes.items() for change in changes
+    ])
+
+
+def dry_run_report(planned_files: List[Tuple[str, Mapping[str, int]]]) -> Tuple[str, List[str]]:
+    """
+    [신규] 미리보기(dry run) 결과 보고서를 만듭니다.
+
+    Args:
+        planned_files: [(파일명, {시트명: 변경 예정 셀 수})] - 적용 결과의 planned_changes
+
+    Returns:
+        (요약 한 줄, 파일/시트별 상세 줄 목록) - 변경 예정이 없는 파일은 제외
+    """
+    files = [(file_name, sheets) for file_name, sheets in planned_files if sheets]
+    cell_count = sum(sum(sheets.values()) for _, sheets in files)
+    summary = f"미리보기: {len(files)}개 파일, 셀 {cell_count:,}개 변경 예정 — 저장 안 함"
+    lines = []
+    for file_name, sheets in files:
+        lines.append(f"📄 {file_name}: 셀 {sum(sheets.values()):,}개")
+        lines.extend(f"   • {sheet_name}: {count:,}개" for sheet_name, count in sheets.items())
+    return summary, lines
+
+
+def plan_hash(sheet_changes: Mapping[str, List[CellChange]]) -> str:
+    """
+    변경 목록의 지문(sha1)을 반환합니다. 같은 파일에 같은 변경을 계획했는지 비교하는 데 씁니다.
+    (적용 작업 저널에 파일별로 기록)
+    """
+    digest = hashlib.sha1()
+    for sheet_name in sorted(sheet_changes):
+        digest.update(repr(sheet_name).encode("utf-8"))
+        for change in sheet_changes[sheet_name]:
+            digest.update(repr(tuple(change)).encode("utf-8"))
+    return digest.hexdigest()
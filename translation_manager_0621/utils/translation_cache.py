@@ -0,0 +1,307 @@
+# utils/translation_cache.py
+"""
+번역 DB 메모리 캐시 (컬럼 저장소 + 인덱스 맵)
+
+기존 load_translation_cache 계열 함수는 행마다 레코드를 만들고
+파일별/시트별/STRING_ID별 딕셔너리와 KR 역방향 딕셔너리를 각각 채우면서
+행마다 파일명/시트명 .lower()를 반복했습니다.
+
+TranslationCache는
+- 행 데이터를 컬럼별 리스트 하나에 보관하고 (파일명/시트명은 이름 표의 번호로 저장)
+- 파일/시트/STRING_ID/KR 조회 단계는 {키: 행 번호} 인덱스 맵으로만 가지며
+- TranslationRecord는 조회될 때 한 번만 만듭니다.
+파일명/시트명 소문자 변환은 서로 다른 이름마다 한 번만 수행합니다.
+
+작업 폴더의 temp_db/translation_cache 아래에 DB별 바이너리 스냅샷(marshal)을 저장해 두면
+DB가 바뀌지 않은 경우 다음 실행에서 쿼리와 딕셔너리 재구성 없이 바로 불러옵니다.
+기존 코드가 그대로 쓸 수 있도록 translation_cache / translation_file_cache /
+translation_sheet_cache / kr_reverse_cache 는 읽기 전용 매핑 뷰로 제공합니다.
+
+캐시는 만든 뒤 바뀌지 않으므로 utils.cache_registry 로 여러 탭이 같은 객체를 함께 씁니다.
+조회되는 레코드도 FrozenTranslationRecord(읽기 전용)이므로 한 탭이 다른 탭의 데이터를 바꿀 수 없습니다.
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import sqlite3
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.cache_registry import get_cache_registry
+from utils.translation_record import RECORD_FIELDS, FrozenTranslationRecord, intern_text
+
+logger = logging.getLogger('app')
+
+# 스냅샷 형식이 바뀌면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".cache"
+SNAPSHOT_DIR_NAME = "translation_cache"
+
+# 행마다 값을 그대로 저장하는 컬럼 (file_name/sheet_name은 이름 표 번호로 저장)
+VALUE_FIELDS = ("string_id", "kr", "en", "cn", "tw", "th", "status", "update_date")
+
+
+def snapshot_path(db_path: str) -> str:
+    """
+    DB의 캐시 스냅샷 경로 (작업 폴더/temp_db/translation_cache/<DB 파일명>-<경로 해시>.cache)를 반환합니다.
+    사용자 DB 폴더에는 쓰지 않으며, 이름이 같은 다른 폴더의 DB와는 경로 해시로 구분합니다.
+    """
+    normalized = os.path.normcase(os.path.abspath(db_path))
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    file_name = f"{os.path.basename(normalized)}-{digest}{SNAPSHOT_SUFFIX}"
+    return os.path.join(os.getcwd(), "temp_db", SNAPSHOT_DIR_NAME, file_name)
+
+
+def db_signature(db_path: str) -> List[int]:
+    """
+    DB 내용이 바뀌었는지 판단하는 서명 (DB 파일과 WAL 파일의 크기/수정 시간)을 반환합니다.
+    """
+    signature = []
+    for path in (db_path, db_path + "-wal"):
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature += [stat.st_size, stat.st_mtime_ns]
+        else:
+            signature += [0, 0]
+    return signature
+
+
+class RecordIndexView(Mapping):
+    """{키: 행 번호} 인덱스 맵을 {키: FrozenTranslationRecord}처럼 읽는 읽기 전용 뷰"""
+
+    __slots__ = ("_cache", "_index")
+
+    def __init__(self, cache: "TranslationCache", index: Dict[Any, int]):
+        self._cache = cache
+        self._index = index
+
+    def __getitem__(self, key) -> FrozenTranslationRecord:
+        return self._cache.record(self._index[key])
+
+    def get(self, key, default=None):
+        row = self._index.get(key)
+        return default if row is None else self._cache.record(row)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class TranslationCache:
+    """번역 DB의 활성 행을 담는 캐시 (행 저장소 1개 + 조회 단계별 인덱스 맵)"""
+
+    def __init__(self, columns: Dict[str, list], file_names: List[str], sheet_names: List[str],
+                 by_id: Dict[Any, int], by_file: Dict[str, Dict[Any, int]], by_sheet: Dict[str, Dict[Any, int]],
+                 by_kr: Dict[str, int], duplicate_ids: Dict[Any, List[str]]):
+        self._columns = columns
+        self._file_names = [intern_text(name) for name in file_names]
+        self._sheet_names = [intern_text(name) for name in sheet_names]
+        self._records: List[Optional[FrozenTranslationRecord]] = [None] * len(columns["string_id"])
+        self.by_id = by_id
+        self.by_file = by_file
+        self.by_sheet = by_sheet
+        self.by_kr = by_kr
+        self.duplicate_ids = duplicate_ids
+
+        self.translation_cache = RecordIndexView(self, by_id)
+        # 여러 탭이 같은 캐시를 공유하므로 단계별 매핑도 읽기 전용으로 제공
+        self.translation_file_cache = MappingProxyType({name: RecordIndexView(self, index) for name, index in by_file.items()})
+        self.translation_sheet_cache = MappingProxyType({name: RecordIndexView(self, index) for name, index in by_sheet.items()})
+        self.kr_reverse_cache = RecordIndexView(self, by_kr)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, row: int) -> FrozenTranslationRecord:
+        """행 번호의 읽기 전용 레코드를 반환합니다. (처음 조회할 때 한 번만 생성)"""
+        record = self._records[row]
+        if record is None:
+            columns = self._columns
+            values = []
+            for field in RECORD_FIELDS:
+                if field == "file_name":
+                    values.append((field, self._file_names[columns["file_name"][row]]))
+                elif field == "sheet_name":
+                    values.append((field, self._sheet_names[columns["sheet_name"][row]]))
+                else:
+                    values.append((field, columns[field][row]))
+            record = FrozenTranslationRecord(values)
+            self._records[row] = record
+        return record
+
+    def lookup(self, string_id: Any, file_name: Optional[str] = None, sheet_name: Optional[str] = None) -> Optional[FrozenTranslationRecord]:
+        """파일명 -> 시트명 -> STRING_ID 순서로 레코드를 찾습니다."""
+        for name, tier in ((file_name, self.by_file), (sheet_name, self.by_sheet)):
+            if name:
+                row = tier.get(name.lower(), {}).get(string_id)
+                if row is not None:
+                    return self.record(row)
+        row = self.by_id.get(string_id)
+        return None if row is None else self.record(row)
+
+    # --- 생성 ---
+    @classmethod
+    def from_db(cls, db_path: str) -> "TranslationCache":
+        """translation_data의 활성 행을 한 번 읽어 캐시를 만듭니다."""
+        columns = {field: [] for field in VALUE_FIELDS}
+        columns["file_name"] = []
+        columns["sheet_name"] = []
+        file_names, sheet_names = [], []
+        file_slots, sheet_slots = {}, {}
+        file_tiers, sheet_tiers = [], []      # 이름 표 번호 -> 해당 파일/시트의 인덱스 맵
+        by_id, by_file, by_sheet, by_kr = {}, {}, {}, {}
+        files_by_id = {}
+
+        conn = sqlite3.connect(db_path)
+        try:
+            cursor = conn.execute(
+                "SELECT string_id, file_name, sheet_name, kr, en, cn, tw, th, status, update_date "
+                "FROM translation_data WHERE status = 'active'"
+            )
+            appenders = [columns[field].append for field in VALUE_FIELDS]
+            append_file = columns["file_name"].append
+            append_sheet = columns["sheet_name"].append
+            row_no = 0
+            for string_id, file_name, sheet_name, kr, en, cn, tw, th, status, update_date in cursor:
+                if not string_id:
+                    continue
+                for append, value in zip(appenders, (string_id, kr, en, cn, tw, th, status, update_date)):
+                    append(value)
+
+                # 파일명/시트명은 서로 다른 이름마다 한 번만 소문자 변환
+                file_slot = file_slots.get(file_name)
+                if file_slot is None:
+                    file_slot = file_slots[file_name] = len(file_names)
+                    file_names.append(file_name)
+                    file_tiers.append(by_file.setdefault(intern_text(file_name.lower()), {}) if file_name else None)
+                sheet_slot = sheet_slots.get(sheet_name)
+                if sheet_slot is None:
+                    sheet_slot = sheet_slots[sheet_name] = len(sheet_names)
+                    sheet_names.append(sheet_name)
+                    sheet_tiers.append(by_sheet.setdefault(intern_text(sheet_name.lower()), {}) if sheet_name else None)
+                append_file(file_slot)
+                append_sheet(sheet_slot)
+
+                file_tier = file_tiers[file_slot]
+                if file_tier is not None:
+                    file_tier[string_id] = row_no
+                sheet_tier = sheet_tiers[sheet_slot]
+                if sheet_tier is not None:
+                    sheet_tier[string_id] = row_no
+                if string_id in by_id:
+                    files_by_id.setdefault(string_id, [file_names[columns["file_name"][by_id[string_id]]]]).append(file_name)
+                by_id[string_id] = row_no
+
+                if kr:
+                    kr_text = str(kr).strip()
+                    if kr_text and kr_text not in by_kr:
+                        by_kr[kr_text] = row_no
+                row_no += 1
+        finally:
+            conn.close()
+        return cls(columns, file_names, sheet_names, by_id, by_file, by_sheet, by_kr, files_by_id)
+
+    # --- 스냅샷 ---
+    def save_snapshot(self, path: str, signature: List[int]) -> bool:
+        """캐시를 marshal 바이너리 스냅샷으로 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+        payload = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "signature": signature,
+            "columns": self._columns,
+            "file_names": self._file_names,
+            "sheet_names": self._sheet_names,
+            "by_id": self.by_id,
+            "by_file": self.by_file,
+            "by_sheet": self.by_sheet,
+            "by_kr": self.by_kr,
+            "duplicate_ids": self.duplicate_ids,
+        }
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = marshal.dumps(payload)
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            return True
+        except (OSError, ValueError) as e:
+            logger.warning(f"번역 캐시 스냅샷 저장 실패: {path} - {e}")
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+    @classmethod
+    def load_snapshot(cls, path: str, signature: Optional[List[int]] = None) -> Optional["TranslationCache"]:
+        """
+        스냅샷을 불러옵니다.
+
+        Args:
+            signature: 지정하면 저장 당시 DB 서명과 같을 때만 불러옵니다.
+
+        Returns:
+            TranslationCache 또는 None (스냅샷 없음/형식 불일치/DB 변경)
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            # marshal.load(파일)은 객체마다 파일을 읽어 느리므로 한 번에 읽어서 변환
+            with open(path, "rb") as f:
+                payload = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.warning(f"번역 캐시 스냅샷 읽기 실패: {path} - {e}")
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+        if signature is not None and payload.get("signature") != signature:
+            return None
+        return cls(
+            payload["columns"], payload["file_names"], payload["sheet_names"],
+            payload["by_id"], payload["by_file"], payload["by_sheet"], payload["by_kr"], payload["duplicate_ids"]
+        )
+
+
+def _load_translation_cache(db_path: str, use_snapshot: bool) -> Tuple[TranslationCache, bool]:
+    if not use_snapshot:
+        return TranslationCache.from_db(db_path), False
+
+    path = snapshot_path(db_path)
+    signature = db_signature(db_path)
+    cache = TranslationCache.load_snapshot(path, signature)
+    if cache is not None:
+        return cache, True
+
+    cache = TranslationCache.from_db(db_path)
+    cache.save_snapshot(path, signature)
+    return cache, False
+
+
+def load_translation_cache(db_path: str, use_snapshot: bool = True, shared: bool = True) -> Tuple[TranslationCache, bool]:
+    """
+    DB의 번역 캐시를 불러옵니다.
+    DB가 바뀌지 않았다면 스냅샷에서, 아니면 DB에서 만들고 스냅샷을 새로 저장합니다.
+
+    shared=True이면 프로세스 공용 레지스트리(utils.cache_registry)를 거쳐
+    같은 DB를 불러온 다른 탭과 캐시 객체 하나를 함께 씁니다.
+
+    Returns:
+        (TranslationCache, DB를 다시 읽지 않았는지 여부 - 스냅샷 또는 공유 캐시 사용)
+    """
+    if not shared:
+        return _load_translation_cache(db_path, use_snapshot)
+    (cache, from_snapshot), reused = get_cache_registry().get(
+        db_path, tuple(db_signature(db_path)),
+        lambda: _load_translation_cache(db_path, use_snapshot),
+        filter_key=("translation_cache", "active"),
+    )
+    return cache, from_snapshot or reused
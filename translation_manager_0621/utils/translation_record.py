@@ -0,0 +1,190 @@
+# utils/translation_record.py
+"""
+번역 데이터 한 건을 담는 압축 레코드
+
+translation_cache / translation_file_cache / translation_sheet_cache / kr_reverse_cache,
+DB 구축/업데이트의 unique_data 등은 STRING_ID마다 7~10개 키를 가진 딕셔너리를 만들었고,
+일부는 같은 내용을 한 번 더 복사해 두었기 때문에 50만 건 규모에서는 수 GB를 사용했습니다.
+
+TranslationRecord는 __slots__ 기반이라 딕셔너리보다 훨씬 작고,
+파일명/시트명/상태처럼 반복되는 문자열은 intern해서 한 객체만 공유합니다.
+기존 코드가 그대로 동작하도록 딕셔너리와 같은 방식(get, [], in, keys, items, dict(), {**record})으로 읽을 수 있습니다.
+값을 넣지 않은 필드는 딕셔너리에 그 키가 없는 것과 같게 취급합니다.
+
+여러 탭이 함께 쓰는 캐시는 FrozenTranslationRecord(읽기 전용)를 돌려주며,
+수정이 필요하면 copy()로 만든 일반 TranslationRecord를 고쳐 씁니다.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# 고정 필드 (이 외의 키는 _extra 딕셔너리에 보관)
+RECORD_FIELDS = (
+    "string_id", "file_name", "sheet_name",
+    "kr", "en", "cn", "tw", "th",
+    "status", "update_date",
+)
+_FIELD_SET = frozenset(RECORD_FIELDS)
+
+# 값이 반복되는 필드 (intern 대상)
+INTERNED_FIELDS = frozenset(("file_name", "sheet_name", "status", "update_date"))
+
+
+def intern_text(value: Any) -> Any:
+    """문자열이면 intern한 객체를, 아니면 값 그대로 반환합니다."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class TranslationRecord(Mapping):
+    """번역 데이터 한 건 (읽기는 딕셔너리와 동일, 필드 값 변경 가능)"""
+
+    __slots__ = RECORD_FIELDS + ("_extra",)
+
+    def __init__(self, data: Optional[Mapping] = None, **fields):
+        if data is not None:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_row(cls, row, columns: Optional[Iterable[str]] = None) -> "TranslationRecord":
+        """
+        sqlite3.Row 또는 (컬럼명 목록, 값 튜플)로 레코드를 만듭니다.
+
+        Args:
+            row: sqlite3.Row 또는 값 튜플
+            columns: row가 튜플일 때 컬럼명 목록 (cursor.description 순서)
+        """
+        record = cls()
+        if columns is None:
+            columns = row.keys()
+        for name, value in zip(columns, row):
+            record[name] = value
+        return record
+
+    # --- 딕셔너리 호환 (읽기) ---
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        extra = self._get_extra()
+        if extra is None or key not in extra:
+            raise KeyError(key)
+        return extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for name in RECORD_FIELDS:
+            if hasattr(self, name):
+                yield name
+        extra = self._get_extra()
+        if extra:
+            yield from extra
+
+    def __len__(self) -> int:
+        extra = self._get_extra()
+        return sum(1 for name in RECORD_FIELDS if hasattr(self, name)) + (len(extra) if extra else 0)
+
+    def __contains__(self, key) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        extra = self._get_extra()
+        return bool(extra) and key in extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        extra = self._get_extra()
+        if extra is None:
+            return default
+        return extra.get(key, default)
+
+    # --- 값 변경 ---
+    def __setitem__(self, key: str, value: Any):
+        if key in _FIELD_SET:
+            setattr(self, key, intern_text(value) if key in INTERNED_FIELDS else value)
+        else:
+            extra = self._get_extra()
+            if extra is None:
+                extra = self._extra = {}
+            extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        else:
+            extra = self._get_extra()
+            if extra is None or key not in extra:
+                raise KeyError(key)
+            del extra[key]
+
+    def update(self, data: Any = (), **fields):
+        """dict.update와 같은 방식으로 값을 갱신합니다."""
+        items = data.items() if hasattr(data, "items") else data
+        for key, value in items:
+            self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    def copy(self) -> "TranslationRecord":
+        record = TranslationRecord()
+        for name in RECORD_FIELDS:
+            if hasattr(self, name):
+                setattr(record, name, getattr(self, name))
+        extra = self._get_extra()
+        if extra:
+            record._extra = dict(extra)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def _get_extra(self) -> Optional[Dict[str, Any]]:
+        return getattr(self, "_extra", None)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TranslationRecord({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # 작업 프로세스 결과로 전달할 수 있도록 딕셔너리로 직렬화
+        return (TranslationRecord, (self.to_dict(),))
+
+
+class FrozenTranslationRecord(TranslationRecord):
+    """
+    [신규] 읽기 전용 번역 레코드 (공유 캐시용)
+    값을 바꾸려고 하면 TypeError가 나며, copy()는 수정 가능한 TranslationRecord를 반환합니다.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, data: Optional[Mapping] = None, **fields):
+        extra = {}
+        for source in (data or (), fields):
+            items = source.items() if hasattr(source, "items") else source
+            for key, value in items:
+                if key in _FIELD_SET:
+                    object.__setattr__(self, key, intern_text(value) if key in INTERNED_FIELDS else value)
+                else:
+                    extra[key] = value
+        if extra:
+            object.__setattr__(self, "_extra", extra)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("공유 캐시의 번역 레코드는 읽기 전용입니다. copy()로 복사본을 만들어 수정하세요.")
+
+    __setitem__ = __delitem__ = update = __setattr__ = __delattr__ = _read_only
@@ -0,0 +1,194 @@
+# utils/translation_revisions.py
+"""
+translation_data 변경 이력 (리비전 로그)
+
+DB 구축/업데이트, 중복 항목 반영 작업마다 리비전을 하나 만들고,
+그 작업에서 바뀐 행의 컬럼별 이전 값/새 값을 추가 전용(append-only) 테이블에 기록합니다.
+두 DB 전체를 비교하지 않고도 "리비전 N 이후 / 특정 날짜 이후 변경 내역"이나
+STRING_ID별 이력을 인덱스 범위 조회로 바로 구할 수 있습니다.
+
+테이블:
+- translation_revisions: 리비전 번호, 생성 시각, 작업 종류, 설명, 변경된 STRING_ID 수
+- translation_changes: 리비전 번호, STRING_ID, 컬럼명, 이전 값, 새 값, 변경 시각
+
+변경 내용은 작업 중인 연결에만 만드는 임시 트리거로 수집하므로
+UPSERT/UPDATE ... FROM 같은 집합 단위 SQL도 행마다 따로 조회하지 않고 기록됩니다.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 이력을 남기는 컬럼 (id, update_date 제외)
+TRACKED_COLUMNS = ("file_name", "sheet_name", "string_id", "kr", "en", "cn", "tw", "th", "status")
+
+# 작업 종류
+SOURCE_BUILD = "build"
+SOURCE_UPDATE = "update"
+SOURCE_EXCEL_UPDATE = "excel_update"
+SOURCE_RESOLVED = "resolved"
+
+_UPDATE_TRIGGER = "translation_revision_update"
+_INSERT_TRIGGER = "translation_revision_insert"
+
+
+def ensure_revision_tables(cursor):
+    """리비전/변경 이력 테이블과 조회용 인덱스를 만듭니다."""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS translation_revisions (
+        revision_id INTEGER PRIMARY KEY,
+        created_at TEXT,
+        source TEXT,
+        description TEXT,
+        changed_rows INTEGER DEFAULT 0
+    )''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS translation_changes (
+        id INTEGER PRIMARY KEY,
+        revision_id INTEGER NOT NULL,
+        string_id,
+        column_name TEXT,
+        old_value,
+        new_value,
+        changed_at TEXT
+    )''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translation_changes_revision ON translation_changes(revision_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translation_changes_string_id ON translation_changes(string_id, revision_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translation_changes_changed_at ON translation_changes(changed_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translation_revisions_created_at ON translation_revisions(created_at)')
+
+
+def begin_revision(cursor, source: str, description: str = "", track_changes: bool = True,
+                   timestamp: Optional[str] = None) -> int:
+    """
+    새 리비전을 만들고, track_changes=True면 이 연결에서 translation_data의 변경을 기록하기 시작합니다.
+
+    Args:
+        cursor: translation_data가 있는 DB의 커서
+        source: 작업 종류 (SOURCE_* 상수)
+        description: 리비전 설명
+        track_changes: False면 리비전만 기록 (새로 구축한 DB의 기준 리비전 등)
+        timestamp: 변경 시각 문자열 (없으면 현재 시각)
+
+    Returns:
+        리비전 번호
+    """
+    ensure_revision_tables(cursor)
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    cursor.execute(
+        "INSERT INTO translation_revisions (created_at, source, description) VALUES (?, ?, ?)",
+        (timestamp, source, description)
+    )
+    revision_id = cursor.lastrowid
+    _drop_triggers(cursor)
+    if track_changes:
+        _create_triggers(cursor, revision_id, timestamp)
+    return revision_id
+
+
+def finish_revision(cursor, revision_id: int, changed_rows: Optional[int] = None) -> int:
+    """
+    변경 기록을 멈추고 리비전의 변경된 STRING_ID 수를 기록합니다.
+
+    Args:
+        changed_rows: 직접 지정할 변경 행 수 (없으면 기록된 이력에서 계산)
+
+    Returns:
+        변경된 행 수
+    """
+    _drop_triggers(cursor)
+    if changed_rows is None:
+        cursor.execute(
+            "SELECT COUNT(DISTINCT string_id) FROM translation_changes WHERE revision_id = ?", (revision_id,)
+        )
+        changed_rows = cursor.fetchone()[0]
+    cursor.execute(
+        "UPDATE translation_revisions SET changed_rows = ? WHERE revision_id = ?", (changed_rows, revision_id)
+    )
+    return changed_rows
+
+
+def _create_triggers(cursor, revision_id: int, timestamp: str):
+    """변경 이력을 기록하는 임시 트리거를 만듭니다. (다른 연결에는 영향 없음)"""
+    changed_at = timestamp.replace("'", "''")
+    old_new = " UNION ALL ".join(
+        f"SELECT '{col}' AS c, OLD.{col} AS o, NEW.{col} AS n" for col in TRACKED_COLUMNS
+    )
+    new_only = " UNION ALL ".join(
+        f"SELECT '{col}' AS c, NEW.{col} AS n" for col in TRACKED_COLUMNS
+    )
+    cursor.execute(f'''
+    CREATE TEMP TRIGGER {_UPDATE_TRIGGER} AFTER UPDATE ON main.translation_data
+    BEGIN
+        INSERT INTO translation_changes (revision_id, string_id, column_name, old_value, new_value, changed_at)
+        SELECT {int(revision_id)}, NEW.string_id, c, o, n, '{changed_at}' FROM ({old_new}) WHERE o IS NOT n;
+    END''')
+    cursor.execute(f'''
+    CREATE TEMP TRIGGER {_INSERT_TRIGGER} AFTER INSERT ON main.translation_data
+    BEGIN
+        INSERT INTO translation_changes (revision_id, string_id, column_name, old_value, new_value, changed_at)
+        SELECT {int(revision_id)}, NEW.string_id, c, NULL, n, '{changed_at}' FROM ({new_only}) WHERE n IS NOT NULL;
+    END''')
+
+
+def _drop_triggers(cursor):
+    cursor.execute(f"DROP TRIGGER IF EXISTS temp.{_UPDATE_TRIGGER}")
+    cursor.execute(f"DROP TRIGGER IF EXISTS temp.{_INSERT_TRIGGER}")
+
+
+# --- 조회 ---
+def _has_revision_tables(cursor) -> bool:
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='translation_changes'")
+    return cursor.fetchone() is not None
+
+
+def _fetch_dicts(cursor) -> List[Dict[str, Any]]:
+    names = [desc[0] for desc in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def list_revisions(cursor, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """최근 리비전부터 리비전 목록을 반환합니다."""
+    if not _has_revision_tables(cursor):
+        return []
+    query = "SELECT * FROM translation_revisions ORDER BY revision_id DESC"
+    if limit:
+        query += f" LIMIT {int(limit)}"
+    cursor.execute(query)
+    return _fetch_dicts(cursor)
+
+
+def changes_since(cursor, revision_id: Optional[int] = None, since: Optional[str] = None,
+                  string_id: Any = None) -> List[Dict[str, Any]]:
+    """
+    리비전 번호 또는 날짜 이후의 변경 내역을 반환합니다.
+
+    Args:
+        revision_id: 이 리비전 이후(초과)의 변경만 조회
+        since: 이 시각 이후(이상)의 변경만 조회 ("YYYY-MM-DD" 또는 "YYYY-MM-DD HH:MM:SS")
+        string_id: 지정하면 해당 STRING_ID의 변경만 조회
+
+    Returns:
+        [{"revision_id", "string_id", "column_name", "old_value", "new_value", "changed_at"}, ...] (기록 순서)
+    """
+    if not _has_revision_tables(cursor):
+        return []
+    conditions, params = [], []
+    if revision_id is not None:
+        conditions.append("revision_id > ?")
+        params.append(revision_id)
+    if since:
+        conditions.append("changed_at >= ?")
+        params.append(since)
+    if string_id is not None:
+        conditions.append("string_id = ?")
+        params.append(string_id)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cursor.execute(f'''
+    SELECT revision_id, string_id, column_name, old_value, new_value, changed_at
+    FROM translation_changes {where} ORDER BY id''', params)
+    return _fetch_dicts(cursor)
+
+
+def string_id_history(cursor, string_id: Any) -> List[Dict[str, Any]]:
+    """STRING_ID 하나의 전체 변경 이력을 반환합니다."""
+    return changes_since(cursor, string_id=string_id)
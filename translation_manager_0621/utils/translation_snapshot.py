@@ -0,0 +1,416 @@
+# utils/translation_snapshot.py
+"""
+번역 DB 컬럼형 스냅샷 (mmap 공유용 읽기 전용 파일)
+
+번역 적용/비교 작업마다 translation_data 전체를 파이썬 객체로 읽는 대신,
+번역 데이터를 한 번 바이너리 파일로 내보내고 작업 프로세스는 그 파일을 mmap으로 열어
+필요한 행만 읽습니다. 파일은 읽기 전용이라 여러 프로세스가 같은 페이지를 공유합니다.
+
+파일 구성 (모든 정수는 리틀 엔디언):
+- 헤더: MAGIC(8), 버전(u32), 행 수(u32), 섹션 수(u32), 예비(u32)
+- 섹션 목록: [이름 길이(u16) + 이름(utf-8) + 오프셋(u64) + 길이(u64)] * 섹션 수
+- 컬럼마다 세 섹션 (8바이트 정렬)
+    <컬럼>.offsets : u64[행 수 + 1]  값 i는 blob[offsets[i]:offsets[i+1]]
+    <컬럼>.flags   : u8[행 수]       0=값, 1=NULL, 2=필드 없음
+    <컬럼>.blob    : utf-8 문자열을 이어 붙인 바이트
+- 조회 키 인덱스 (id: STRING_ID, kr: KR 텍스트) - 키 바이트 순으로 정렬
+    key.<이름>.offsets : u64[키 수 + 1]
+    key.<이름>.blob    : 키 utf-8 바이트
+    key.<이름>.rows    : u32[키 수]  키가 가리키는 행 번호
+
+조회는 정렬된 키에 대한 이진 탐색이며, 찾은 행만 TranslationRecord로 만듭니다.
+DB뿐 아니라 메모리 캐시(translation_cache / kr_reverse_cache)도 그대로 내보낼 수 있어
+필터링/충돌 해결이 반영된 캐시를 작업 프로세스에 공유할 때 사용합니다.
+"""
+
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from utils.translation_record import RECORD_FIELDS, TranslationRecord
+
+MAGIC = b"TRSNAP01"
+FORMAT_VERSION = 2
+SNAPSHOT_SUFFIX = ".snapshot"
+
+_HEADER = struct.Struct("<8sIIII")
+_SECTION_NAME = struct.Struct("<H")
+_SECTION_RANGE = struct.Struct("<QQ")
+_ALIGN = 8
+
+# 스냅샷에 담는 컬럼 (TranslationRecord 필드와 같은 순서)
+SNAPSHOT_COLUMNS = RECORD_FIELDS
+KEY_INDEXES = ("id", "kr")
+
+# 컬럼 값 표시
+_VALUE, _NULL, _ABSENT_FLAG = 0, 1, 2
+ABSENT = object()   # 레코드에 필드가 없음 (None과 구분)
+
+
+def default_snapshot_path(db_path: str) -> str:
+    """DB 파일 옆의 스냅샷 경로를 반환합니다."""
+    return os.path.splitext(db_path)[0] + SNAPSHOT_SUFFIX
+
+
+def _to_little_endian(arr: array) -> bytes:
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _encode(value: Any) -> bytes:
+    return (value if isinstance(value, str) else str(value)).encode("utf-8")
+
+
+class _BlobWriter:
+    """문자열 값 목록을 오프셋 표 + blob으로 모읍니다."""
+
+    __slots__ = ("offsets", "blob")
+
+    def __init__(self):
+        self.offsets = array("Q", [0])
+        self.blob = bytearray()
+
+    def append(self, data: bytes):
+        self.blob += data
+        self.offsets.append(len(self.blob))
+
+
+class SnapshotWriter:
+    """행과 조회 키를 모아 스냅샷 파일로 씁니다."""
+
+    def __init__(self):
+        self._columns = {name: (_BlobWriter(), bytearray()) for name in SNAPSHOT_COLUMNS}
+        self._keys: Dict[str, Dict[bytes, int]] = {name: {} for name in KEY_INDEXES}
+        self.row_count = 0
+
+    def add_row(self, values: Sequence[Any]) -> int:
+        """SNAPSHOT_COLUMNS 순서의 값(None 또는 ABSENT 가능)을 한 행으로 추가하고 행 번호를 반환합니다."""
+        for (blob, flags), value in zip(self._columns.values(), values):
+            if value is ABSENT:
+                flags.append(_ABSENT_FLAG)
+                blob.append(b"")
+            elif value is None:
+                flags.append(_NULL)
+                blob.append(b"")
+            else:
+                flags.append(_VALUE)
+                blob.append(_encode(value))
+        row = self.row_count
+        self.row_count += 1
+        return row
+
+    def add_record(self, record: Mapping) -> int:
+        """레코드(딕셔너리/TranslationRecord)를 한 행으로 추가합니다. 없는 필드는 없는 그대로 기록합니다."""
+        return self.add_row(tuple(record.get(name, ABSENT) for name in SNAPSHOT_COLUMNS))
+
+    def set_key(self, index: str, key: Any, row: int):
+        """조회 키가 행을 가리키도록 등록합니다. (같은 키는 마지막 등록이 우선)"""
+        self._keys[index][_encode(key)] = row
+
+    def has_key(self, index: str, key: Any) -> bool:
+        return _encode(key) in self._keys[index]
+
+    def write(self, output_path: str) -> int:
+        """스냅샷 파일을 씁니다. (임시 파일에 쓴 뒤 교체) 기록한 행 수를 반환합니다."""
+        sections = []
+        for name, (blob, flags) in self._columns.items():
+            sections.append((f"{name}.offsets", _to_little_endian(blob.offsets)))
+            sections.append((f"{name}.flags", bytes(flags)))
+            sections.append((f"{name}.blob", bytes(blob.blob)))
+        for name, keys in self._keys.items():
+            key_blob = _BlobWriter()
+            rows = array("I")
+            for key in sorted(keys):
+                key_blob.append(key)
+                rows.append(keys[key])
+            sections.append((f"key.{name}.offsets", _to_little_endian(key_blob.offsets)))
+            sections.append((f"key.{name}.blob", bytes(key_blob.blob)))
+            sections.append((f"key.{name}.rows", _to_little_endian(rows)))
+
+        # 섹션 목록 크기를 먼저 계산해 데이터 시작 위치를 정함
+        table_size = sum(_SECTION_NAME.size + len(name.encode("utf-8")) + _SECTION_RANGE.size for name, _ in sections)
+        position = _HEADER.size + table_size
+        layout = []
+        for name, data in sections:
+            position += (-position) % _ALIGN
+            layout.append((name, position, len(data)))
+            position += len(data)
+
+        temp_path = output_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, self.row_count, len(sections), 0))
+            for name, offset, length in layout:
+                encoded = name.encode("utf-8")
+                f.write(_SECTION_NAME.pack(len(encoded)))
+                f.write(encoded)
+                f.write(_SECTION_RANGE.pack(offset, length))
+            for (_, data), (_, offset, _) in zip(sections, layout):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(data)
+        os.replace(temp_path, output_path)
+        return self.row_count
+
+
+def export_db_snapshot(db_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    translation_data의 활성 행을 스냅샷 파일로 내보냅니다.
+    KR 키는 앞뒤 공백을 제거한 KR이며, 같은 KR은 먼저 나온 행을 가리킵니다.
+
+    Returns:
+        {"path": 스냅샷 경로, "rows": 행 수}
+    """
+    output_path = output_path or default_snapshot_path(db_path)
+    writer = SnapshotWriter()
+    sid_pos = SNAPSHOT_COLUMNS.index("string_id")
+    kr_pos = SNAPSHOT_COLUMNS.index("kr")
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute(
+            f"SELECT {', '.join(SNAPSHOT_COLUMNS)} FROM translation_data "
+            "WHERE status = 'active' AND string_id IS NOT NULL AND string_id <> '' ORDER BY id"
+        )
+        for values in cursor:
+            row = writer.add_row(values)
+            writer.set_key("id", values[sid_pos], row)
+            kr_text = str(values[kr_pos]).strip() if values[kr_pos] else ""
+            if kr_text and not writer.has_key("kr", kr_text):
+                writer.set_key("kr", kr_text, row)
+    finally:
+        conn.close()
+    return {"path": output_path, "rows": writer.write(output_path)}
+
+
+def write_cache_snapshot(translation_cache: Mapping, kr_reverse_cache: Mapping, output_path: str) -> int:
+    """
+    메모리 번역 캐시({STRING_ID: 레코드}, {KR: 레코드})를 키 그대로 스냅샷 파일로 씁니다.
+    두 캐시가 같은 레코드 객체를 가리키면 한 행으로 저장합니다.
+
+    Returns:
+        기록한 행 수
+    """
+    writer = SnapshotWriter()
+    rows_by_record = {}
+
+    def row_of(record) -> int:
+        row = rows_by_record.get(id(record))
+        if row is None:
+            row = rows_by_record[id(record)] = writer.add_record(record)
+        return row
+
+    for key, record in translation_cache.items():
+        writer.set_key("id", key, row_of(record))
+    for key, record in kr_reverse_cache.items():
+        writer.set_key("kr", key, row_of(record))
+    return writer.write(output_path)
+
+
+class _Column:
+    """mmap 위의 컬럼 하나 (오프셋 표/값 표시 뷰 + blob 시작 위치)"""
+
+    __slots__ = ("offsets", "flags", "data", "start")
+
+    def __init__(self, offsets: memoryview, flags: Optional[memoryview], data: mmap.mmap, start: int):
+        self.offsets = offsets
+        self.flags = flags
+        self.data = data
+        self.start = start
+
+    def raw(self, row: int) -> bytes:
+        start = self.start
+        return self.data[start + self.offsets[row]:start + self.offsets[row + 1]]
+
+
+class _KeyIndex:
+    """mmap 위의 정렬된 조회 키 (이진 탐색)"""
+
+    __slots__ = ("keys", "rows")
+
+    def __init__(self, keys: _Column, rows: memoryview):
+        self.keys = keys
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def find(self, key: Any) -> Optional[int]:
+        """키가 가리키는 행 번호를 반환합니다."""
+        if key is None:
+            return None
+        target = _encode(key)
+        keys = self.keys
+        lo, hi = 0, len(self.rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys.raw(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.rows) and keys.raw(lo) == target:
+            return self.rows[lo]
+        return None
+
+    def __iter__(self) -> Iterator[str]:
+        for pos in range(len(self.rows)):
+            yield self.keys.raw(pos).decode("utf-8")
+
+
+class TranslationSnapshot:
+    """mmap으로 연 번역 스냅샷 (읽기 전용, 이진 탐색 조회)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = None
+        self._views = []      # close() 전에 해제해야 하는 mmap 뷰
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._views.append(memoryview(self._mmap))
+            self._load_sections()
+        except Exception:
+            self.close()
+            raise
+
+    def _load_sections(self):
+        magic, version, row_count, section_count, _ = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 번역 스냅샷 형식입니다: {self.path}")
+        if sys.byteorder != "little":
+            raise ValueError("번역 스냅샷은 리틀 엔디언 환경에서만 mmap으로 열 수 있습니다.")
+
+        sections = {}
+        position = _HEADER.size
+        for _ in range(section_count):
+            (name_length,) = _SECTION_NAME.unpack_from(self._mmap, position)
+            position += _SECTION_NAME.size
+            name = bytes(self._mmap[position:position + name_length]).decode("utf-8")
+            position += name_length
+            offset, length = _SECTION_RANGE.unpack_from(self._mmap, position)
+            position += _SECTION_RANGE.size
+            sections[name] = (offset, length)
+
+        self.row_count = row_count
+        self._columns = {
+            name: _Column(
+                self._view(sections[f"{name}.offsets"], "Q"), self._view(sections[f"{name}.flags"]),
+                self._mmap, sections[f"{name}.blob"][0]
+            )
+            for name in SNAPSHOT_COLUMNS
+        }
+        self._indexes = {
+            name: _KeyIndex(
+                _Column(self._view(sections[f"key.{name}.offsets"], "Q"), None, self._mmap, sections[f"key.{name}.blob"][0]),
+                self._view(sections[f"key.{name}.rows"], "I")
+            )
+            for name in KEY_INDEXES
+        }
+
+    def _view(self, section, typecode: Optional[str] = None) -> memoryview:
+        """섹션 (오프셋, 길이)의 mmap 뷰를 만듭니다. (typecode를 주면 정수 배열로 변환)"""
+        offset, length = section
+        view = self._views[0][offset:offset + length]
+        self._views.append(view)
+        if typecode:
+            view = view.cast(typecode)
+            self._views.append(view)
+        return view
+
+    # --- 조회 ---
+    def __len__(self) -> int:
+        return len(self._indexes["id"])
+
+    def find_row(self, string_id: Any) -> Optional[int]:
+        """STRING_ID의 행 번호를 반환합니다."""
+        return self._indexes["id"].find(string_id)
+
+    def find_kr_row(self, kr_text: Any) -> Optional[int]:
+        """KR(앞뒤 공백 제거)에 해당하는 행 번호를 반환합니다."""
+        if kr_text is None:
+            return None
+        return self._indexes["kr"].find(str(kr_text).strip())
+
+    def record(self, row: int) -> TranslationRecord:
+        """행 하나를 TranslationRecord로 만듭니다. (없는 필드는 넣지 않음)"""
+        record = TranslationRecord()
+        for name, column in self._columns.items():
+            flag = column.flags[row]
+            if flag == _VALUE:
+                record[name] = column.raw(row).decode("utf-8")
+            elif flag == _NULL:
+                record[name] = None
+        return record
+
+    def get(self, string_id: Any, default=None) -> Optional[TranslationRecord]:
+        row = self.find_row(string_id)
+        return default if row is None else self.record(row)
+
+    def get_by_kr(self, kr_text: Any, default=None) -> Optional[TranslationRecord]:
+        row = self.find_kr_row(kr_text)
+        return default if row is None else self.record(row)
+
+    def __contains__(self, string_id) -> bool:
+        return self.find_row(string_id) is not None
+
+    def id_view(self) -> "SnapshotIndexView":
+        """translation_cache 대신 쓸 수 있는 {STRING_ID: 레코드} 읽기 전용 뷰"""
+        return SnapshotIndexView(self, "id")
+
+    def kr_view(self) -> "SnapshotIndexView":
+        """kr_reverse_cache 대신 쓸 수 있는 {KR: 레코드} 읽기 전용 뷰"""
+        return SnapshotIndexView(self, "kr")
+
+    # --- 정리 ---
+    def close(self):
+        # mmap을 닫기 전에 파생된 뷰부터 해제
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._columns = {}
+        self._indexes = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SnapshotIndexView(Mapping):
+    """스냅샷의 조회 키 인덱스를 딕셔너리처럼 읽는 뷰 (get/[]/in/len 지원, 순회는 키 정렬 순서)"""
+
+    __slots__ = ("snapshot", "_index")
+
+    def __init__(self, snapshot: TranslationSnapshot, index: str):
+        self.snapshot = snapshot
+        self._index = snapshot._indexes[index]
+
+    def __getitem__(self, key) -> TranslationRecord:
+        row = self._index.find(key)
+        if row is None:
+            raise KeyError(key)
+        return self.snapshot.record(row)
+
+    def get(self, key, default=None):
+        row = self._index.find(key)
+        return default if row is None else self.snapshot.record(row)
+
+    def __contains__(self, key) -> bool:
+        return self._index.find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,303 @@
+# utils/workbook_cache.py
+"""
+파싱된 String 시트 내용을 보관하는 디스크 캐시 (SQLite)
+
+DB 구축, 통합 비교, 요청 추출 등 여러 도구가 같은 String 워크북을 세션마다 반복해서 파싱하므로
+한 번 읽은 시트 내용을 파일 경로 + 크기 + 수정 시간을 키로 저장해 두고,
+파일이 바뀌지 않았다면 다시 파싱하지 않고 캐시에서 바로 돌려줍니다.
+
+저장 형식 (컬럼 단위):
+- workbooks: 파일 키와 전체 시트 이름 목록
+- sheets: String 시트별 헤더 행, 행 번호 목록(marshal)
+- sheet_columns: 시트의 컬럼별 값 목록(marshal, 행 번호 목록과 같은 순서)
+
+캐시 DB는 다른 캐시와 같이 작업 폴더의 temp_db 아래에 둡니다.
+A열(상태)과 헤더가 있는 컬럼만 저장하며, 헤더를 찾지 못한 시트는 저장하지 않고 원본에서 읽습니다.
+CachedWorkbook은 openpyxl 워크북과 같은 형태
+(sheetnames, wb[name], iter_rows(values_only=True), close())를 제공하므로
+utils.string_sheet_reader 에 그대로 넘길 수 있습니다.
+"""
+
+import bisect
+import logging
+import marshal
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.string_sheet_reader import is_string_sheet, read_header
+from utils.xlsx_stream_reader import XlsxStreamWorkbook
+
+logger = logging.getLogger('app')
+
+CACHE_FILE_NAME = "workbook_cache.db"
+
+# 캐시 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT_VERSION = 3
+
+
+def default_cache_path() -> str:
+    """기본 캐시 DB 경로 (작업 폴더/temp_db/workbook_cache.db)"""
+    return os.path.join(os.getcwd(), "temp_db", CACHE_FILE_NAME)
+
+
+def file_signature(file_path: str) -> Tuple[str, int, int]:
+    """캐시 키로 쓰는 (정규화 경로, 크기, 수정 시간 ns)를 반환합니다."""
+    path = os.path.normcase(os.path.abspath(file_path))
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+class CachedSheet:
+    """캐시에 저장된 String 시트 (읽기 전용)"""
+
+    supports_column_filter = True
+
+    def __init__(self, title: str, row_numbers: List[int], columns: Dict[int, List[Any]]):
+        self.title = title
+        self._row_numbers = row_numbers
+        self._columns = columns
+        self._width = max(columns) if columns else 0
+
+    @property
+    def max_row(self) -> int:
+        return self._row_numbers[-1] if self._row_numbers else 0
+
+    def iter_rows(self, min_row: int = 1, max_row: Optional[int] = None, max_col: Optional[int] = None,
+                  values_only: bool = True, columns: Optional[Iterable[int]] = None) -> Iterator[Tuple[Any, ...]]:
+        """XlsxStreamSheet.iter_rows와 같은 규칙으로 행 값을 반환합니다."""
+        if not values_only:
+            raise ValueError("CachedSheet는 values_only=True만 지원합니다.")
+
+        width = max_col if max_col else self._width
+        wanted = set(columns) if columns is not None else None
+        slots = []
+        for col in range(1, width + 1):
+            values = self._columns.get(col)
+            slots.append(values if values is not None and (wanted is None or col in wanted) else None)
+        empty_row = (None,) * max_col if max_col else ()
+
+        expected_row = min_row
+        start = bisect.bisect_left(self._row_numbers, min_row)
+        for pos in range(start, len(self._row_numbers)):
+            row_idx = self._row_numbers[pos]
+            if max_row is not None and row_idx > max_row:
+                break
+            while expected_row < row_idx:
+                yield empty_row
+                expected_row += 1
+            yield tuple(values[pos] if values is not None else None for values in slots)
+            expected_row = row_idx + 1
+
+
+class CachedWorkbook:
+    """캐시에서 읽은 워크북. 캐시에 없는 시트는 원본 파일에서 직접 읽습니다."""
+
+    def __init__(self, file_path: str, sheetnames: List[str], sheets: Dict[str, CachedSheet]):
+        self.file_path = file_path
+        self._sheetnames = sheetnames
+        self._sheets = sheets
+        self._source = None
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheetnames)
+
+    def __getitem__(self, sheet_name: str):
+        if sheet_name in self._sheets:
+            return self._sheets[sheet_name]
+        if self._source is None:
+            self._source = XlsxStreamWorkbook(self.file_path)
+        return self._source[sheet_name]
+
+    def close(self):
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def parse_string_sheets(workbook) -> Dict[str, Tuple[int, List[int], Dict[int, List[Any]]]]:
+    """
+    워크북의 String 시트를 컬럼 단위로 파싱합니다.
+
+    Returns:
+        {시트명: (헤더 행, 행 번호 목록, {컬럼 번호: 값 목록})}
+        헤더를 찾지 못한 시트는 넣지 않습니다. (다른 헤더 규칙을 쓰는 호출자는 원본에서 읽음)
+    """
+    parsed = {}
+    for sheet_name in workbook.sheetnames:
+        if not is_string_sheet(sheet_name):
+            continue
+        worksheet = workbook[sheet_name]
+        header = read_header(worksheet)
+        if header is None:
+            continue
+
+        cols = sorted({1, *header.labels})
+        max_col = cols[-1]
+        row_numbers = []
+        columns = {col: [] for col in cols}
+        row_iter = worksheet.iter_rows(min_row=1, max_col=max_col, values_only=True, columns=cols)
+        for row_idx, values in enumerate(row_iter, start=1):
+            cells = [values[col - 1] for col in cols]
+            if all(value is None for value in cells):
+                continue
+            row_numbers.append(row_idx)
+            for col, value in zip(cols, cells):
+                columns[col].append(value)
+        parsed[sheet_name] = (header.row, row_numbers, columns)
+    return parsed
+
+
+class WorkbookCache:
+    """파싱된 String 시트 디스크 캐시"""
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = cache_path or default_cache_path()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # UI 스레드/작업 스레드/작업 프로세스에서 모두 호출되므로 호출마다 연결을 엽니다.
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        conn = sqlite3.connect(self.cache_path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript('''
+            CREATE TABLE IF NOT EXISTS workbooks (
+                path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,
+                format_version INTEGER, sheetnames BLOB, cached_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS sheets (
+                path TEXT, sheet_name TEXT, header_row INTEGER, row_numbers BLOB,
+                PRIMARY KEY (path, sheet_name)
+            );
+            CREATE TABLE IF NOT EXISTS sheet_columns (
+                path TEXT, sheet_name TEXT, col INTEGER, data BLOB,
+                PRIMARY KEY (path, sheet_name, col)
+            );
+            ''')
+            self._initialized = True
+        return conn
+
+    def load(self, file_path: str) -> Optional[CachedWorkbook]:
+        """파일이 바뀌지 않았다면 캐시된 워크북을, 아니면 None을 반환합니다."""
+        path, size, mtime_ns = file_signature(file_path)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT size, mtime_ns, format_version, sheetnames FROM workbooks WHERE path = ?", (path,)
+            ).fetchone()
+            if not row or row[0] != size or row[1] != mtime_ns or row[2] != CACHE_FORMAT_VERSION:
+                return None
+
+            sheets = {}
+            for sheet_name, row_numbers in conn.execute(
+                "SELECT sheet_name, row_numbers FROM sheets WHERE path = ?", (path,)
+            ):
+                sheets[sheet_name] = CachedSheet(sheet_name, marshal.loads(row_numbers), {})
+            for sheet_name, col, data in conn.execute(
+                "SELECT sheet_name, col, data FROM sheet_columns WHERE path = ?", (path,)
+            ):
+                sheet = sheets.get(sheet_name)
+                if sheet is not None:
+                    sheet._columns[col] = marshal.loads(data)
+            for sheet in sheets.values():
+                sheet._width = max(sheet._columns) if sheet._columns else 0
+            return CachedWorkbook(file_path, marshal.loads(row[3]), sheets)
+        finally:
+            conn.close()
+
+    def store(self, file_path: str, sheetnames: List[str], parsed: Dict[str, Tuple[int, List[int], Dict[int, List[Any]]]]):
+        """파싱 결과를 캐시에 저장합니다. (같은 경로의 이전 항목은 교체)"""
+        path, size, mtime_ns = file_signature(file_path)
+        conn = self._connect()
+        try:
+            with conn:
+                self._delete(conn, path)
+                conn.execute(
+                    "INSERT INTO workbooks (path, size, mtime_ns, format_version, sheetnames, cached_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, size, mtime_ns, CACHE_FORMAT_VERSION, marshal.dumps(list(sheetnames)),
+                     datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                )
+                conn.executemany(
+                    "INSERT INTO sheets (path, sheet_name, header_row, row_numbers) VALUES (?, ?, ?, ?)",
+                    [(path, name, header_row, marshal.dumps(row_numbers))
+                     for name, (header_row, row_numbers, _) in parsed.items()]
+                )
+                conn.executemany(
+                    "INSERT INTO sheet_columns (path, sheet_name, col, data) VALUES (?, ?, ?, ?)",
+                    [(path, name, col, marshal.dumps(values))
+                     for name, (_, _, columns) in parsed.items() for col, values in columns.items()]
+                )
+        finally:
+            conn.close()
+
+    def open(self, file_path: str) -> CachedWorkbook:
+        """
+        캐시를 통해 워크북을 엽니다.
+        캐시가 없거나 파일이 바뀌었으면 스트리밍 리더로 파싱한 뒤 캐시에 저장합니다.
+        """
+        try:
+            cached = self.load(file_path)
+            if cached is not None:
+                return cached
+        except (sqlite3.Error, ValueError, EOFError, TypeError) as e:
+            logger.warning(f"워크북 캐시 읽기 실패, 원본을 다시 읽습니다: {file_path} ({e})")
+
+        with XlsxStreamWorkbook(file_path) as source:
+            sheetnames = source.sheetnames
+            parsed = parse_string_sheets(source)
+
+        try:
+            self.store(file_path, sheetnames, parsed)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"워크북 캐시 저장 실패: {file_path} ({e})")
+
+        sheets = {name: CachedSheet(name, row_numbers, columns) for name, (_, row_numbers, columns) in parsed.items()}
+        return CachedWorkbook(file_path, sheetnames, sheets)
+
+    def invalidate(self, file_path: str):
+        """특정 파일의 캐시를 삭제합니다. (파일을 직접 수정한 뒤 호출)"""
+        path = os.path.normcase(os.path.abspath(file_path))
+        conn = self._connect()
+        try:
+            with conn:
+                self._delete(conn, path)
+        finally:
+            conn.close()
+
+    def clear(self):
+        """캐시 전체를 비웁니다."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM sheet_columns")
+                conn.execute("DELETE FROM sheets")
+                conn.execute("DELETE FROM workbooks")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, path: str):
+        conn.execute("DELETE FROM sheet_columns WHERE path = ?", (path,))
+        conn.execute("DELETE FROM sheets WHERE path = ?", (path,))
+        conn.execute("DELETE FROM workbooks WHERE path = ?", (path,))
+
+
+_default_cache: Optional[WorkbookCache] = None
+
+
+def get_workbook_cache() -> WorkbookCache:
+    """프로세스 공용 캐시 인스턴스를 반환합니다."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = WorkbookCache()
+    return _default_cache
@@ -0,0 +1,378 @@
+# utils/xlsx_finalize.py
+"""
+저장된 xlsx 후처리 (Excel 다시 저장 대체)
+
+번역 적용 뒤 Excel(COM/xlwings)로 파일을 열어 다시 저장하면
+수식 값 재계산, 부품 목록 정리, 문자열 표 정리가 되지만 파일마다 Excel 프로세스를 띄워야 해서
+가장 느린 단계였고 Excel이 없는 환경에서는 쓸 수 없었습니다.
+
+이 모듈은 그중 필요한 부분만 zip/XML 수준에서 처리합니다.
+- [Content_Types].xml: 없는 부품의 Override 제거, 형식이 빠진 부품의 Override 추가
+- calcChain: 제거 (fullCalcOnLoad로 Excel이 열 때 다시 만듦)
+- workbook.xml calcPr: fullCalcOnLoad="1" (열 때 모든 수식 재계산 -> 캐시된 값 갱신)
+- sharedStrings: 인라인 문자열(xlsx_patch_writer가 씀)을 공유 문자열로 옮기고,
+  중복/미사용 항목을 정리하며 count/uniqueCount를 다시 계산
+  (시트/sst XML에 네임스페이스 접두사가 있거나 해석하지 못한 공유 문자열 셀이 있으면
+   번호를 잃지 않도록 문자열 정리는 건너뜀)
+
+바뀌지 않는 zip 항목은 압축된 바이트 그대로 복사합니다. (xlsx_patch_writer._copy_raw)
+finalize_workbooks 는 여러 파일을 프로세스 풀로 나눠 처리합니다.
+"""
+
+import logging
+import os
+import posixpath
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.xlsx_patch_writer import _CELL, _copy_raw, _remove_quietly, can_patch
+from utils.xlsx_stream_reader import read_workbook_parts, read_workbook_relationships
+
+logger = logging.getLogger('app')
+
+_CONTENT_TYPES = "[Content_Types].xml"
+_SHARED_STRINGS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"
+_SHARED_STRINGS_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"
+_SST_NS = b"http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+# 관계 형식 -> 부품 콘텐츠 형식 (Override가 빠졌을 때 보충)
+_PART_CONTENT_TYPES = {
+    "/worksheet": "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml",
+    "/chartsheet": "application/vnd.openxmlformats-officedocument.spreadsheetml.chartsheet+xml",
+    "/sharedStrings": _SHARED_STRINGS_TYPE,
+    "/styles": "application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml",
+    "/theme": "application/vnd.openxmlformats-officedocument.theme+xml",
+    "/externalLink": "application/vnd.openxmlformats-officedocument.spreadsheetml.externalLink+xml",
+}
+_CALC_CHAIN_SUFFIX = "/calcChain"
+
+# workbook.xml 에서 calcPr 뒤에 오는 요소 (calcPr이 없을 때 이 앞에 삽입)
+_AFTER_CALC_PR = (b"oleSize", b"customWorkbookViews", b"pivotCaches", b"smartTagPr", b"smartTagTypes",
+                  b"webPublishing", b"fileRecoveryPr", b"webPublishObjects", b"extLst")
+
+_OVERRIDE = re.compile(rb'<Override\b[^>]*?PartName="([^"]*)"[^>]*/>')
+_CALC_PR = re.compile(rb'<calcPr\b([^>]*?)(/?)>')
+_FULL_CALC = re.compile(rb'\sfullCalcOnLoad="[^"]*"')
+_SST_OPEN = re.compile(rb'<sst\b[^>]*?(/?)>')
+_SI = re.compile(rb'<si>(.*?)</si>|<si/>', re.S)
+_CELL_TYPE = re.compile(rb'\st="([^"]*)"')
+_VALUE = re.compile(rb'<v>(\d+)</v>')
+_INLINE = re.compile(rb'<is>(.*?)</is>|<is/>', re.S)
+_PRESERVED_TEXT = re.compile(rb'<t xml:space="preserve">([^<]*)</t>')
+_ROOT = re.compile(rb'<(?![?!])([\w.-]+:)?([\w.-]+)')
+_SHARED_CELL_TAG = re.compile(rb'<(?:[\w.-]+:)?c\b[^>]*?\st="s"')
+
+
+class _SharedStrings:
+    """공유 문자열 표 재구성 (원래 순서 유지, 같은 내용은 하나로)"""
+
+    def __init__(self, items: List[bytes]):
+        self.items = items
+        self.new_items: List[bytes] = []
+        self._slots: Dict[bytes, int] = {}
+        self.references = 0
+        self.inline = 0
+        self.unresolved = 0     # 번호를 해석하지 못한 공유 문자열 셀 수
+
+    def slot(self, content: bytes) -> int:
+        self.references += 1
+        index = self._slots.get(content)
+        if index is None:
+            index = self._slots[content] = len(self.new_items)
+            self.new_items.append(content)
+        return index
+
+    def is_identity(self) -> bool:
+        return self.new_items == self.items
+
+
+def _inline_content(content: bytes) -> bytes:
+    """인라인 문자열 내용을 공유 문자열 항목 형태로 맞춥니다. (앞뒤 공백이 없으면 xml:space 생략)"""
+    m = _PRESERVED_TEXT.fullmatch(content)
+    if m and m.group(1) == m.group(1).strip():
+        return b"<t>" + m.group(1) + b"</t>"
+    return content
+
+
+def _read_shared_items(data: Optional[bytes]) -> List[bytes]:
+    if not data:
+        return []
+    return [m.group(1) or b"" for m in _SI.finditer(data)]
+
+
+def _has_prefixed_root(xml: Optional[bytes]) -> bool:
+    """루트 요소에 네임스페이스 접두사가 붙어 있는지 (예: <x:worksheet>)"""
+    m = _ROOT.search(xml) if xml else None
+    return bool(m and m.group(1))
+
+
+def _scan_cells(sheet_xml: bytes, strings: _SharedStrings) -> bool:
+    """
+    첫 번째 단계: 사용하는 문자열을 시트 순서대로 새 표에 등록합니다.
+
+    Returns:
+        시트 XML을 다시 써야 하는지 (인라인 문자열이 있는지)
+    """
+    has_inline = False
+    items = strings.items
+    shared_cells = 0
+    for m in _CELL.finditer(sheet_xml):
+        type_match = _CELL_TYPE.search(m.group(1))
+        if not type_match:
+            continue
+        cell_type = type_match.group(1)
+        if cell_type == b"s":
+            shared_cells += 1
+            if m.group(2) is None:
+                continue
+            value = _VALUE.search(m.group(2))
+            if value and int(value.group(1)) < len(items):
+                strings.slot(items[int(value.group(1))])
+            elif value or b"<v" in m.group(2):
+                strings.unresolved += 1
+        elif m.group(2) is None:
+            continue
+        elif cell_type == b"inlineStr" and b"<f" not in m.group(2):
+            inline = _INLINE.search(m.group(2))
+            if inline:
+                strings.slot(_inline_content(inline.group(1) or b""))
+                strings.inline += 1
+                has_inline = True
+    # 정규식으로 찾지 못한 t="s" 셀 (접두사가 붙은 셀 등)
+    strings.unresolved += max(0, len(_SHARED_CELL_TAG.findall(sheet_xml)) - shared_cells)
+    return has_inline
+
+
+def _rewrite_cells(sheet_xml: bytes, strings: _SharedStrings) -> bytes:
+    """두 번째 단계: 공유 문자열 번호를 새 표 기준으로 바꾸고 인라인 문자열을 공유 문자열로 옮깁니다."""
+    items = strings.items
+    slots = strings._slots
+
+    def repl(m):
+        attrs, content = m.group(1), m.group(2)
+        type_match = _CELL_TYPE.search(attrs)
+        if not type_match or content is None:
+            return m.group(0)
+        cell_type = type_match.group(1)
+        if cell_type == b"s":
+            value = _VALUE.search(content)
+            if not value or int(value.group(1)) >= len(items):
+                return m.group(0)
+            new_index = slots[items[int(value.group(1))]]
+            return b"<c" + attrs + b"><v>%d</v></c>" % new_index
+        if cell_type == b"inlineStr" and b"<f" not in content:
+            inline = _INLINE.search(content)
+            if not inline:
+                return m.group(0)
+            new_attrs = attrs[:type_match.start()] + b' t="s"' + attrs[type_match.end():]
+            return b"<c" + new_attrs + b"><v>%d</v></c>" % slots[_inline_content(inline.group(1) or b"")]
+        return m.group(0)
+
+    return _CELL.sub(repl, sheet_xml)
+
+
+def _shared_strings_xml(original: Optional[bytes], strings: _SharedStrings) -> bytes:
+    """새 공유 문자열 표 XML (원래 sst 요소의 네임스페이스 선언 유지)"""
+    opening = b'<sst xmlns="' + _SST_NS + b'">'
+    if original:
+        m = _SST_OPEN.search(original)
+        if m:
+            opening = re.sub(rb'\s(?:count|uniqueCount)="[^"]*"', b"", m.group(0)).rstrip(b"/>").rstrip() + b">"
+    opening = opening[:-1] + b' count="%d" uniqueCount="%d">' % (strings.references, len(strings.new_items))
+    body = b"".join(b"<si>" + item + b"</si>" for item in strings.new_items)
+    return b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + opening + body + b"</sst>"
+
+
+def _set_full_calc_on_load(workbook_xml: bytes) -> bytes:
+    m = _CALC_PR.search(workbook_xml)
+    if m:
+        attrs = _FULL_CALC.sub(b"", m.group(1))
+        return workbook_xml[:m.start()] + b'<calcPr' + attrs + b' fullCalcOnLoad="1"' + m.group(2) + b">" + workbook_xml[m.end():]
+    positions = [pos for pos in (workbook_xml.find(b"<" + name) for name in _AFTER_CALC_PR) if pos != -1]
+    insert_at = min(positions) if positions else workbook_xml.rfind(b"</workbook>")
+    if insert_at == -1:
+        return workbook_xml
+    return workbook_xml[:insert_at] + b'<calcPr fullCalcOnLoad="1"/>' + workbook_xml[insert_at:]
+
+
+def _fix_content_types(types_xml: bytes, names: List[str], part_types: Dict[str, str]) -> bytes:
+    """없는 부품의 Override를 지우고, 형식이 정해지지 않은 부품의 Override를 추가합니다."""
+    existing = set(names)
+    types_xml = _OVERRIDE.sub(
+        lambda m: m.group(0) if m.group(1).decode("utf-8").lstrip("/") in existing else b"", types_xml
+    )
+    overridden = {m.group(1).decode("utf-8").lstrip("/") for m in _OVERRIDE.finditer(types_xml)}
+    additions = [
+        f'<Override PartName="/{part}" ContentType="{content_type}"/>'.encode("utf-8")
+        for part, content_type in part_types.items() if part in existing and part not in overridden
+    ]
+    if additions:
+        end = types_xml.rfind(b"</Types>")
+        types_xml = types_xml[:end] + b"".join(additions) + types_xml[end:]
+    return types_xml
+
+
+def _next_rel_id(rels_xml: bytes) -> str:
+    numbers = [int(n) for n in re.findall(rb'Id="rId(\d+)"', rels_xml)]
+    return f"rId{max(numbers, default=0) + 1}"
+
+
+def finalize_workbook(file_path: str, output_path: Optional[str] = None, normalize_strings: bool = True,
+                      compresslevel: Optional[int] = None) -> Dict[str, Any]:
+    """
+    저장된 xlsx/xlsm 파일을 Excel 다시 저장 없이 정리합니다.
+
+    Args:
+        file_path: 정리할 파일
+        output_path: 저장 경로 (없으면 원본에 덮어씀)
+        normalize_strings: 공유 문자열 표 정리 여부
+        compresslevel: 다시 쓰는 항목의 deflate 압축 수준
+
+    Returns:
+        {"status", "inline_converted", "shared_strings", "calc_chain_removed", "rewritten_parts",
+         "strings_skipped" (문자열 정리를 건너뛴 이유 또는 None)}
+    """
+    if not can_patch(file_path):
+        return {"status": "info", "message": "xlsx/xlsm 파일만 후처리할 수 있습니다."}
+    output_path = output_path or file_path
+    temp_path = output_path + ".finalize.tmp"
+    archive = zipfile.ZipFile(file_path)
+    try:
+        names = [info.filename for info in archive.infolist() if not info.filename.endswith("/")]
+        workbook_part, rels_path, rels = read_workbook_relationships(archive)
+        sheet_parts, shared_part = read_workbook_parts(archive)
+        parts: Dict[str, Optional[bytes]] = {}
+
+        # 1. 공유 문자열 정리 (인라인 문자열 -> 공유 문자열, 중복/미사용 제거)
+        inline_converted = 0
+        shared_count = None
+        strings_skipped = None
+        if normalize_strings:
+            worksheets = [part for part in sheet_parts.values() if part in archive.NameToInfo]
+            original_sst = archive.read(shared_part) if shared_part in archive.NameToInfo else None
+            sheet_data = {part: archive.read(part) for part in worksheets}
+            strings = _SharedStrings(_read_shared_items(original_sst))
+            if _has_prefixed_root(original_sst) or any(_has_prefixed_root(data) for data in sheet_data.values()):
+                strings_skipped = "네임스페이스 접두사가 붙은 XML"
+            else:
+                rewrite = [part for part, data in sheet_data.items() if _scan_cells(data, strings)]
+                if strings.unresolved:
+                    strings_skipped = f"해석할 수 없는 공유 문자열 셀 {strings.unresolved}개"
+            if strings_skipped:
+                # 표를 다시 쓰면 아직 참조 중인 번호가 사라질 수 있으므로 시트/sst는 그대로 둠
+                logger.warning(f"공유 문자열 정리 건너뜀: {os.path.basename(file_path)} ({strings_skipped})")
+            else:
+                inline_converted = strings.inline
+                if not strings.is_identity() or rewrite:
+                    if not strings.is_identity():
+                        rewrite = worksheets          # 번호가 바뀌면 모든 시트를 다시 씀
+                    for part in rewrite:
+                        parts[part] = _rewrite_cells(sheet_data[part], strings)
+                if strings.new_items or original_sst is not None:
+                    if shared_part is None:
+                        shared_part = posixpath.join(posixpath.dirname(workbook_part), "sharedStrings.xml")
+                        rels_xml = archive.read(rels_path)
+                        relationship = (f'<Relationship Id="{_next_rel_id(rels_xml)}" Type="{_SHARED_STRINGS_REL}" '
+                                        f'Target="sharedStrings.xml"/>').encode("utf-8")
+                        end = rels_xml.rfind(b"</Relationships>")
+                        parts[rels_path] = rels_xml[:end] + relationship + rels_xml[end:]
+                        rels = dict(rels, _shared=(_SHARED_STRINGS_REL, shared_part))
+                        names.append(shared_part)
+                    new_sst = _shared_strings_xml(original_sst, strings)
+                    if new_sst != original_sst:
+                        parts[shared_part] = new_sst
+                    shared_count = len(strings.new_items)
+            del sheet_data
+
+        # 2. calcChain 제거 + fullCalcOnLoad (Excel이 열 때 재계산하고 계산 체인을 다시 만듦)
+        calc_part = next((target for rel_type, target in rels.values() if rel_type.endswith(_CALC_CHAIN_SUFFIX)), None)
+        calc_chain_removed = calc_part is not None and calc_part in archive.NameToInfo
+        if calc_part is not None:
+            rels_xml = parts.get(rels_path) or archive.read(rels_path)
+            basename = re.escape(posixpath.basename(calc_part).encode("utf-8"))
+            parts[rels_path] = re.sub(rb'<Relationship\b[^>]*Target="[^"]*' + basename + rb'"[^>]*/>', b"", rels_xml)
+            rels = {rel_id: rel for rel_id, rel in rels.items() if rel[1] != calc_part}
+            if calc_chain_removed:
+                parts[calc_part] = None
+                names.remove(calc_part)
+        workbook_xml = archive.read(workbook_part)
+        new_workbook_xml = _set_full_calc_on_load(workbook_xml)
+        if new_workbook_xml != workbook_xml:
+            parts[workbook_part] = new_workbook_xml
+
+        # 3. [Content_Types].xml 정리
+        part_types = {}
+        for rel_type, target in rels.values():
+            for suffix, content_type in _PART_CONTENT_TYPES.items():
+                if rel_type.endswith(suffix):
+                    part_types[target] = content_type
+        types_xml = archive.read(_CONTENT_TYPES)
+        new_types_xml = _fix_content_types(types_xml, names, part_types)
+        if new_types_xml != types_xml:
+            parts[_CONTENT_TYPES] = new_types_xml
+
+        if not parts:
+            return {"status": "success", "inline_converted": 0, "shared_strings": shared_count,
+                    "calc_chain_removed": False, "rewritten_parts": 0, "strings_skipped": strings_skipped}
+
+        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+            written = set()
+            for info in archive.infolist():
+                written.add(info.filename)
+                if info.filename not in parts:
+                    _copy_raw(archive, target, info)
+                elif parts[info.filename] is not None:
+                    entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    entry.compress_type = zipfile.ZIP_DEFLATED
+                    entry.external_attr = info.external_attr
+                    target.writestr(entry, parts[info.filename], compresslevel=compresslevel)
+            for name, data in parts.items():         # 새로 만든 부품 (sharedStrings.xml)
+                if name not in written and data is not None:
+                    target.writestr(name, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+    except Exception:
+        archive.close()
+        _remove_quietly(temp_path)
+        raise
+    archive.close()
+    os.replace(temp_path, output_path)
+    return {"status": "success", "inline_converted": inline_converted, "shared_strings": shared_count,
+            "calc_chain_removed": calc_chain_removed, "rewritten_parts": sum(1 for data in parts.values() if data is not None),
+            "strings_skipped": strings_skipped}
+
+
+def _finalize_in_worker(file_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return finalize_workbook(file_path, **options)
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+def finalize_workbooks(file_paths: List[str], max_workers: Optional[int] = None,
+                       **options: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    여러 파일을 프로세스 풀로 나눠 finalize_workbook 합니다.
+
+    Yields:
+        완료된 순서대로 (파일 경로, 결과 딕셔너리)
+    """
+    from utils.parallel_apply import default_worker_count
+
+    file_paths = [path for path in file_paths if can_patch(path)]
+    if not file_paths:
+        return
+    workers = max_workers or default_worker_count(len(file_paths))
+    if workers <= 1 or len(file_paths) == 1:
+        for file_path in file_paths:
+            yield file_path, _finalize_in_worker(file_path, options)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_finalize_in_worker, path, options): path for path in file_paths}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "error", "message": str(e)}
+            yield file_path, result
@@ -0,0 +1,685 @@
+# utils/xlsx_patch_writer.py
+"""
+xlsx 시트 XML 직접 수정 저장 (셀 몇 개만 바꿀 때)
+
+번역 적용, 스트링 동기화, 단어 치환, '전달' 표시는 셀 몇 개를 바꾸려고
+큰 워크북 전체를 openpyxl로 load_workbook + save 했기 때문에 느리고,
+openpyxl이 완전히 되살리지 못하는 서식/부품까지 다시 쓰였습니다.
+
+이 모듈은 (시트, 행, 열, 값, 채우기 색) 편집 목록을 받아
+- 편집이 있는 sheetN.xml 의 해당 <row>만 바꾸고 (행 위치는 이진 탐색)
+- 채우기가 필요하면 styles.xml 에 fill/xf 를 추가하며
+- 그 외 zip 항목은 압축된 바이트 그대로 복사합니다.
+문자열은 인라인 문자열(t="inlineStr")로 써서 sharedStrings.xml 은 건드리지 않습니다.
+
+처리할 수 없는 구조(행 번호가 없는 행, 공유 수식 원본 셀, 날짜 값, 접두사가 붙은 XML 등)를 만나면
+patch_workbook 은 XlsxPatchError 를 발생시킵니다. save_edits / XlsxPatchWorkbook.save 는 이 경우
+같은 편집을 openpyxl로 열어 저장하므로, 일반 코드는 open_workbook_for_update 로 워크북을 열면 됩니다.
+"""
+
+import logging
+import os
+import re
+import struct
+import zipfile
+from copy import copy
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from utils.xlsx_stream_reader import (
+    STREAMABLE_EXTENSIONS, XlsxStreamWorkbook, column_index, read_workbook_parts, read_workbook_relationships
+)
+
+logger = logging.getLogger('app')
+
+_STYLES_SUFFIX = "/styles"
+_CALC_CHAIN_SUFFIX = "/calcChain"
+_CONTENT_TYPES = "[Content_Types].xml"
+
+_SHEET_DATA = re.compile(rb'<sheetData\b[^>]*?(/?)>')
+_ROW_OPEN = re.compile(rb'<row\b([^>]*)>')
+_ROW_NUMBER = re.compile(rb'\sr="(\d+)"')
+_SPANS = re.compile(rb'\sspans="[^"]*"')
+_CELL = re.compile(rb'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_ATTR = re.compile(rb'([\w:]+)="([^"]*)"')
+_DIMENSION = re.compile(rb'<dimension\s+ref="([^"]*)"\s*/>')
+_CELL_REF = re.compile(r'^([A-Z]+)(\d+)$')
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class XlsxPatchError(Exception):
+    """XML 직접 수정으로 처리할 수 없는 워크북"""
+
+
+class CellEdit(NamedTuple):
+    """셀 편집 하나"""
+    sheet: str
+    row: int
+    column: int
+    value: Any
+    fill: Optional[str] = None      # 단색 채우기 RGB (예: "DAF2D0"), None이면 서식 유지
+
+
+def can_patch(file_path: str) -> bool:
+    """XML 직접 수정을 시도할 수 있는 형식(xlsx/xlsm)인지 확인합니다."""
+    return file_path.lower().endswith(STREAMABLE_EXTENSIONS)
+
+
+def column_letter(column: int) -> str:
+    """컬럼 번호(1부터)를 'A', 'AB' 형태로 변환합니다."""
+    letters = ""
+    while column > 0:
+        column, rem = divmod(column - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+# --- 셀 XML ---
+def _cell_xml(ref: str, style: Optional[str], value: Any) -> bytes:
+    """값 하나를 <c> 요소로 만듭니다. (빈 값은 서식만 남긴 빈 셀)"""
+    attrs = f'r="{ref}"'
+    if style and style != "0":
+        attrs += f' s="{style}"'
+    if value is None or value == "":
+        return f'<c {attrs}/>'.encode("utf-8")
+    if isinstance(value, bool):
+        return f'<c {attrs} t="b"><v>{int(value)}</v></c>'.encode("utf-8")
+    if isinstance(value, (int, float)):
+        return f'<c {attrs}><v>{value!r}</v></c>'.encode("utf-8")
+    if isinstance(value, str):
+        if _ILLEGAL_XML_CHARS.search(value):
+            raise XlsxPatchError(f"{ref}: XML에 쓸 수 없는 문자가 포함되어 있습니다.")
+        return f'<c {attrs} t="inlineStr"><is><t xml:space="preserve">{escape(value)}</t></is></c>'.encode("utf-8")
+    raise XlsxPatchError(f"{ref}: 직접 쓸 수 없는 값 형식입니다 ({type(value).__name__})")
+
+
+class _RowPatch:
+    """행 하나에 적용할 편집 {컬럼: (값, 채우기)}"""
+
+    __slots__ = ("row", "cells")
+
+    def __init__(self, row: int):
+        self.row = row
+        self.cells: Dict[int, Tuple[Any, Optional[str]]] = {}
+
+
+def _patch_row(row_no: int, tag: bytes, content: bytes, edits: Dict[int, Tuple[Any, Optional[str]]],
+               style_for: Callable[[Optional[str], str], str]) -> Tuple[bytes, bool]:
+    """
+    <row> 요소 하나에 편집을 적용합니다.
+
+    Returns:
+        (새 <row> 요소 바이트, 수식 셀을 덮어썼는지 여부)
+    """
+    pieces = []
+    pending = sorted(edits.items())
+    formula_replaced = False
+    next_col = 1
+
+    def new_cell(col, style, value, fill):
+        if fill:
+            style = style_for(style, fill)
+        return _cell_xml(f"{column_letter(col)}{row_no}", style, value)
+
+    for m in _CELL.finditer(content):
+        attrs = dict(_ATTR.findall(m.group(1)))
+        ref = attrs.get(b"r")
+        col = column_index(ref.decode("ascii")) if ref else next_col
+        next_col = col + 1
+        while pending and pending[0][0] < col:
+            edit_col, (value, fill) = pending.pop(0)
+            pieces.append(new_cell(edit_col, None, value, fill))
+        if pending and pending[0][0] == col:
+            _, (value, fill) = pending.pop(0)
+            inner = m.group(2) or b""
+            if b"<f" in inner:
+                if b'ref="' in inner and b't="shared"' in inner:
+                    raise XlsxPatchError(f"{column_letter(col)}{row_no}: 공유 수식의 원본 셀은 직접 수정할 수 없습니다.")
+                formula_replaced = True
+            style = attrs.get(b"s")
+            pieces.append(new_cell(col, style.decode("ascii") if style else None, value, fill))
+        else:
+            pieces.append(m.group(0))
+    for edit_col, (value, fill) in pending:
+        pieces.append(new_cell(edit_col, None, value, fill))
+
+    tag = _SPANS.sub(b"", tag).rstrip(b"/")
+    return tag + b">" + b"".join(pieces) + b"</row>", formula_replaced
+
+
+def _row_number(m) -> int:
+    found = _ROW_NUMBER.search(m.group(1))
+    if not found:
+        raise XlsxPatchError("행 번호(r)가 없는 행이 있어 직접 수정할 수 없습니다.")
+    return int(found.group(1))
+
+
+def _find_row(data: bytes, start: int, end: int, target: int):
+    """[start, end) 범위에서 행 번호가 target 이상인 첫 <row> 태그를 이진 탐색으로 찾습니다."""
+    lo, hi = start, end
+    best = None
+    while lo < hi:
+        mid = (lo + hi) // 2
+        m = _ROW_OPEN.search(data, mid, end)
+        if m is None or m.start() >= hi:
+            hi = mid
+            continue
+        if _row_number(m) >= target:
+            best = m
+            hi = mid
+        else:
+            lo = m.end()
+    return best
+
+
+def _expand_dimension(data: bytes, max_row: int, max_col: int) -> bytes:
+    """<dimension ref>가 편집한 셀을 포함하도록 넓힙니다."""
+    m = _DIMENSION.search(data)
+    if not m:
+        return data
+    refs = m.group(1).decode("ascii").split(":")
+    first = _CELL_REF.match(refs[0])
+    last = _CELL_REF.match(refs[-1])
+    if not first or not last:
+        return data
+    last_col = max(column_index(last.group(1)), max_col)
+    last_row = max(int(last.group(2)), max_row)
+    new_ref = f"{refs[0]}:{column_letter(last_col)}{last_row}"
+    return data[:m.start(1)] + new_ref.encode("ascii") + data[m.end(1):]
+
+
+def patch_sheet_xml(data: bytes, rows: Dict[int, _RowPatch],
+                    style_for: Callable[[Optional[str], str], str]) -> Tuple[bytes, bool]:
+    """
+    시트 XML에서 편집이 있는 행만 바꿉니다.
+
+    Returns:
+        (새 시트 XML, 수식 셀을 덮어썼는지 여부)
+    """
+    m = _SHEET_DATA.search(data)
+    if not m:
+        raise XlsxPatchError("sheetData를 찾을 수 없습니다.")
+    if m.group(1):      # <sheetData/>
+        data = data[:m.start()] + b"<sheetData></sheetData>" + data[m.end():]
+        m = _SHEET_DATA.search(data)
+    start = m.end()
+    end = data.find(b"</sheetData>", start)
+    if end < 0:
+        raise XlsxPatchError("sheetData 끝을 찾을 수 없습니다.")
+
+    pieces = [data[:start]]
+    cursor = start
+    formula_replaced = False
+    for row_no in sorted(rows):
+        edits = rows[row_no].cells
+        found = _find_row(data, cursor, end, row_no)
+        if found is not None and _row_number(found) == row_no:
+            if found.group(1).endswith(b"/"):
+                row_end, content = found.end(), b""
+            else:
+                close = data.find(b"</row>", found.end(), end)
+                if close < 0:
+                    raise XlsxPatchError(f"{row_no}행의 끝을 찾을 수 없습니다.")
+                row_end, content = close + len(b"</row>"), data[found.end():close]
+            new_row, replaced = _patch_row(row_no, data[found.start():found.end() - 1], content, edits, style_for)
+            formula_replaced = formula_replaced or replaced
+            pieces.append(data[cursor:found.start()])
+            pieces.append(new_row)
+            cursor = row_end
+        else:
+            insert_at = found.start() if found is not None else end
+            new_row, _ = _patch_row(row_no, f'<row r="{row_no}"'.encode("ascii"), b"", edits, style_for)
+            pieces.append(data[cursor:insert_at])
+            pieces.append(new_row)
+            cursor = insert_at
+    pieces.append(data[cursor:])
+    patched = b"".join(pieces)
+
+    max_row = max(rows)
+    max_col = max(max(patch.cells) for patch in rows.values())
+    return _expand_dimension(patched, max_row, max_col), formula_replaced
+
+
+# --- 스타일 ---
+class _Styles:
+    """styles.xml 의 fills / cellXfs 에 채우기 서식을 추가합니다."""
+
+    _FILLS = re.compile(rb'(<fills\b[^>]*>)(.*?)(</fills>)', re.S)
+    _CELL_XFS = re.compile(rb'(<cellXfs\b[^>]*>)(.*?)(</cellXfs>)', re.S)
+    _FILL = re.compile(rb'<fill\b[^>]*?(?:/>|>.*?</fill>)', re.S)
+    _XF = re.compile(rb'<xf\b[^>]*?(?:/>|>.*?</xf>)', re.S)
+
+    def __init__(self, data: bytes):
+        fills = self._FILLS.search(data)
+        xfs = self._CELL_XFS.search(data)
+        if not fills or not xfs:
+            raise XlsxPatchError("styles.xml 에서 fills/cellXfs 를 찾을 수 없습니다.")
+        self.data = data
+        self.fills = self._FILL.findall(fills.group(2))
+        self.xfs = self._XF.findall(xfs.group(2))
+        self.modified = False
+        self._cache: Dict[Tuple[Optional[str], str], str] = {}
+
+    @staticmethod
+    def _fill_xml(rgb: str) -> bytes:
+        color = ("00" + rgb if len(rgb) == 6 else rgb).upper()
+        return (f'<fill><patternFill patternType="solid"><fgColor rgb="{color}"/>'
+                f'<bgColor rgb="{color}"/></patternFill></fill>').encode("ascii")
+
+    @staticmethod
+    def _set_attr(element: bytes, name: bytes, value: bytes) -> bytes:
+        pattern = re.compile(rb'\s' + name + rb'="[^"]*"')
+        if pattern.search(element):
+            return pattern.sub(b" " + name + b'="' + value + b'"', element, count=1)
+        return element.replace(b"<xf", b"<xf " + name + b'="' + value + b'"', 1)
+
+    def with_fill(self, style: Optional[str], rgb: str) -> str:
+        """기존 셀 서식(s)에 단색 채우기만 바꾼 서식 번호를 반환합니다. (같은 서식이 있으면 재사용)"""
+        key = (style, rgb)
+        if key in self._cache:
+            return self._cache[key]
+
+        fill = self._fill_xml(rgb)
+        if fill in self.fills:
+            fill_id = self.fills.index(fill)
+        else:
+            fill_id = len(self.fills)
+            self.fills.append(fill)
+            self.modified = True
+
+        base_index = int(style) if style else 0
+        if base_index >= len(self.xfs):
+            raise XlsxPatchError(f"셀 서식 번호 {base_index}가 styles.xml 에 없습니다.")
+        xf = self._set_attr(self.xfs[base_index], b"fillId", str(fill_id).encode("ascii"))
+        xf = self._set_attr(xf, b"applyFill", b"1")
+        if xf in self.xfs:
+            xf_id = self.xfs.index(xf)
+        else:
+            xf_id = len(self.xfs)
+            self.xfs.append(xf)
+            self.modified = True
+        self._cache[key] = str(xf_id)
+        return self._cache[key]
+
+    def to_bytes(self) -> bytes:
+        def replace(pattern, items):
+            def repl(m):
+                opening = re.sub(rb'\scount="\d+"', b"", m.group(1)).replace(b">", b' count="%d">' % len(items), 1)
+                return opening + b"".join(items) + m.group(3)
+            return repl
+
+        data = self._FILLS.sub(replace(self._FILLS, self.fills), self.data, count=1)
+        return self._CELL_XFS.sub(replace(self._CELL_XFS, self.xfs), data, count=1)
+
+
+# --- zip ---
+def _copy_raw(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """압축을 풀지 않고 zip 항목을 그대로 복사합니다."""
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(30)
+    if header[:4] != b"PK\x03\x04":
+        raise XlsxPatchError(f"zip 항목 헤더가 올바르지 않습니다: {info.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.fp.seek(info.header_offset + 30 + name_length + extra_length)
+    payload = source.fp.read(info.compress_size)
+
+    entry = copy(info)
+    entry.flag_bits &= ~0x08          # 크기/CRC를 로컬 헤더에 기록 (데이터 디스크립터 없음)
+    entry.header_offset = target.fp.tell()
+    target.fp.write(entry.FileHeader())
+    target.fp.write(payload)
+    target.filelist.append(entry)
+    target.NameToInfo[entry.filename] = entry
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def _drop_calc_chain(parts: Dict[str, bytes], archive: zipfile.ZipFile, rels_path: str, calc_part: str) -> None:
+    """수식 셀을 값으로 바꾼 경우 calcChain.xml 을 제거합니다. (Excel이 다시 만듦)"""
+    basename = calc_part.rsplit("/", 1)[-1]
+    rels = parts.get(rels_path) or archive.read(rels_path)
+    parts[rels_path] = re.sub(rb'<Relationship\b[^>]*Target="[^"]*' + re.escape(basename.encode()) + rb'"[^>]*/>', b"", rels)
+    types = parts.get(_CONTENT_TYPES) or archive.read(_CONTENT_TYPES)
+    parts[_CONTENT_TYPES] = re.sub(rb'<Override\b[^>]*PartName="/' + re.escape(calc_part.encode()) + rb'"[^>]*/>', b"", types)
+    parts[calc_part] = None     # 삭제 표시
+
+
+def patch_workbook(file_path: str, edits: Iterable[CellEdit], output_path: Optional[str] = None,
+                   compresslevel: Optional[int] = None) -> int:
+    """
+    편집 목록을 워크북에 직접 씁니다. (편집한 시트/스타일만 다시 쓰고 나머지 zip 항목은 그대로 복사)
+
+    Args:
+        file_path: 원본 xlsx/xlsm 경로
+        edits: CellEdit 목록 (같은 셀은 마지막 편집이 우선)
+        output_path: 저장 경로 (없으면 원본에 덮어씀)
+        compresslevel: 다시 쓰는 항목의 deflate 압축 수준 (없으면 zlib 기본값)
+
+    Returns:
+        쓴 셀 수
+
+    Raises:
+        XlsxPatchError: 직접 수정할 수 없는 구조 (원본 파일은 바뀌지 않음)
+    """
+    by_sheet: Dict[str, Dict[int, _RowPatch]] = {}
+    count = 0
+    for edit in edits:
+        if edit.row < 1 or edit.column < 1:
+            raise XlsxPatchError(f"잘못된 셀 위치입니다: {edit.sheet}!{edit.row},{edit.column}")
+        rows = by_sheet.setdefault(edit.sheet, {})
+        rows.setdefault(edit.row, _RowPatch(edit.row)).cells[edit.column] = (edit.value, edit.fill)
+        count += 1
+    output_path = output_path or file_path
+    if not by_sheet:
+        return 0
+
+    try:
+        archive = zipfile.ZipFile(file_path)
+    except zipfile.BadZipFile as e:
+        raise XlsxPatchError(f"xlsx(zip) 파일이 아닙니다: {e}")
+    temp_path = output_path + ".patch.tmp"
+    try:
+        sheet_parts, _ = read_workbook_parts(archive)
+        _, rels_path, rels = read_workbook_relationships(archive)
+        styles_part = next((target for rel_type, target in rels.values() if rel_type.endswith(_STYLES_SUFFIX)), None)
+        calc_part = next((target for rel_type, target in rels.values() if rel_type.endswith(_CALC_CHAIN_SUFFIX)), None)
+
+        styles = None
+
+        def style_for(style: Optional[str], rgb: str) -> str:
+            nonlocal styles
+            if styles is None:
+                if not styles_part:
+                    raise XlsxPatchError("styles.xml 이 없어 채우기를 쓸 수 없습니다.")
+                styles = _Styles(archive.read(styles_part))
+            return styles.with_fill(style, rgb)
+
+        parts: Dict[str, Optional[bytes]] = {}
+        formula_replaced = False
+        for sheet_name, rows in by_sheet.items():
+            if sheet_name not in sheet_parts:
+                raise XlsxPatchError(f"시트를 찾을 수 없습니다: {sheet_name}")
+            part = sheet_parts[sheet_name]
+            parts[part], replaced = patch_sheet_xml(archive.read(part), rows, style_for)
+            formula_replaced = formula_replaced or replaced
+        if styles is not None and styles.modified:
+            parts[styles_part] = styles.to_bytes()
+        if formula_replaced and calc_part and calc_part in archive.NameToInfo:
+            _drop_calc_chain(parts, archive, rels_path, calc_part)
+
+        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+            for info in archive.infolist():
+                if info.filename not in parts:
+                    _copy_raw(archive, target, info)
+                elif parts[info.filename] is not None:
+                    entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    entry.compress_type = zipfile.ZIP_DEFLATED
+                    entry.external_attr = info.external_attr
+                    target.writestr(entry, parts[info.filename], compresslevel=compresslevel)
+    except XlsxPatchError:
+        archive.close()
+        _remove_quietly(temp_path)
+        raise
+    except Exception as e:
+        archive.close()
+        _remove_quietly(temp_path)
+        raise XlsxPatchError(f"직접 수정 중 오류: {e}")
+    archive.close()
+    os.replace(temp_path, output_path)
+    return count
+
+
+def _save_edits_with_openpyxl(file_path: str, edits: List[CellEdit], output_path: str) -> int:
+    """직접 수정할 수 없는 파일에 같은 편집을 openpyxl로 씁니다."""
+    from openpyxl import load_workbook
+    from openpyxl.styles import PatternFill
+
+    workbook = load_workbook(file_path, keep_vba=file_path.lower().endswith(".xlsm"))
+    try:
+        fills = {}
+        for edit in edits:
+            cell = workbook[edit.sheet].cell(row=edit.row, column=edit.column)
+            cell.value = edit.value
+            if edit.fill:
+                if edit.fill not in fills:
+                    fills[edit.fill] = PatternFill(start_color=edit.fill, end_color=edit.fill, fill_type="solid")
+                cell.fill = fills[edit.fill]
+        workbook.save(output_path)
+    finally:
+        workbook.close()
+    return len(edits)
+
+
+def save_edits(file_path: str, edits: Iterable[CellEdit], output_path: Optional[str] = None) -> int:
+    """
+    편집 목록을 저장합니다. xlsx/xlsm 은 XML을 직접 수정하고, 안 되면 openpyxl로 저장합니다.
+
+    Returns:
+        쓴 셀 수
+    """
+    edits = list(edits)
+    if not edits:
+        return 0
+    output_path = output_path or file_path
+    if can_patch(file_path):
+        try:
+            return patch_workbook(file_path, edits, output_path)
+        except XlsxPatchError as e:
+            logger.info(f"XML 직접 수정 불가, openpyxl로 저장: {file_path} - {e}")
+    return _save_edits_with_openpyxl(file_path, edits, output_path)
+
+
+def _remove_quietly(path: str):
+    if os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# --- openpyxl 워크시트처럼 쓰는 편집기 ---
+class PatchCell:
+    """PatchSheet.cell()이 반환하는 셀 (value 읽기/쓰기, fill 쓰기)"""
+
+    __slots__ = ("_sheet", "row", "column")
+
+    def __init__(self, sheet: "PatchSheet", row: int, column: int):
+        self._sheet = sheet
+        self.row = row
+        self.column = column
+
+    @property
+    def value(self) -> Any:
+        return self._sheet.get_value(self.row, self.column)
+
+    @value.setter
+    def value(self, value: Any):
+        self._sheet.set_value(self.row, self.column, value)
+
+    @property
+    def fill(self) -> Optional[str]:
+        return self._sheet.get_fill(self.row, self.column)
+
+    @fill.setter
+    def fill(self, rgb: Optional[str]):
+        """단색 채우기 RGB (예: "DAF2D0")"""
+        self._sheet.set_fill(self.row, self.column, rgb)
+
+
+class PatchSheet:
+    """
+    openpyxl 워크시트처럼 cell(row, column).value 로 읽고 쓰는 시트.
+    값은 원본을 스트리밍으로 한 번 읽어 두고, 쓴 값은 편집 목록으로만 모읍니다.
+    """
+
+    def __init__(self, workbook: "XlsxPatchWorkbook", title: str):
+        self.parent = workbook
+        self.title = title
+        self._rows: Optional[List[Tuple[Any, ...]]] = None
+        self._edits: Dict[Tuple[int, int], List[Any]] = {}    # (행, 열) -> [값, 채우기]
+
+    def _load(self) -> List[Tuple[Any, ...]]:
+        if self._rows is None:
+            self._rows = list(self.parent.reader[self.title].iter_rows(values_only=True))
+        return self._rows
+
+    def get_value(self, row: int, column: int) -> Any:
+        edit = self._edits.get((row, column))
+        if edit is not None:
+            return edit[0]
+        rows = self._load()
+        if row > len(rows):
+            return None
+        values = rows[row - 1]
+        return values[column - 1] if column <= len(values) else None
+
+    def set_value(self, row: int, column: int, value: Any):
+        edit = self._edits.get((row, column))
+        if edit is None:
+            self._edits[(row, column)] = [value, None]
+        else:
+            edit[0] = value
+
+    def get_fill(self, row: int, column: int) -> Optional[str]:
+        edit = self._edits.get((row, column))
+        return edit[1] if edit is not None else None
+
+    def set_fill(self, row: int, column: int, rgb: Optional[str]):
+        edit = self._edits.get((row, column))
+        if edit is None:
+            self._edits[(row, column)] = [self.get_value(row, column), rgb]
+        else:
+            edit[1] = rgb
+
+    def cell(self, row: int, column: int, value: Any = None) -> PatchCell:
+        cell = PatchCell(self, row, column)
+        if value is not None:
+            cell.value = value
+        return cell
+
+    @property
+    def max_row(self) -> int:
+        rows = self._load()
+        edited = max((row for row, _ in self._edits), default=0)
+        return max(len(rows), edited, 1)
+
+    @property
+    def max_column(self) -> int:
+        rows = self._load()
+        edited = max((col for _, col in self._edits), default=0)
+        return max(max((len(values) for values in rows), default=0), edited, 1)
+
+    def iter_rows(self, min_row: int = 1, max_row: Optional[int] = None, max_col: Optional[int] = None,
+                  values_only: bool = True):
+        """
+        편집을 반영한 행 값을 반환합니다. (values_only=True만 지원)
+        시트를 아직 읽지 않았다면 필요한 행만 스트리밍으로 읽습니다. (헤더 찾기 등)
+        """
+        if not values_only:
+            raise ValueError("PatchSheet는 values_only=True만 지원합니다.")
+        if self._rows is not None:
+            source = iter(self._rows[min_row - 1:max_row])
+        else:
+            source = self.parent.reader[self.title].iter_rows(min_row=min_row, max_row=max_row)
+
+        edited: Dict[int, Dict[int, Any]] = {}
+        for (row, col), (value, _) in self._edits.items():
+            edited.setdefault(row, {})[col] = value
+
+        row = min_row - 1
+        for row, values in enumerate(source, min_row):
+            yield self._merge(values, edited.get(row), max_col)
+        last_row = max_row or max(edited, default=0)
+        for row in range(row + 1, last_row + 1):
+            yield self._merge((), edited.get(row), max_col)
+
+    @staticmethod
+    def _merge(values, edits: Optional[Dict[int, Any]], max_col: Optional[int]) -> Tuple[Any, ...]:
+        if edits:
+            values = list(values)
+            values.extend([None] * (max(edits) - len(values)))
+            for col, value in edits.items():
+                values[col - 1] = value
+        if max_col:
+            values = tuple(values[:max_col]) + (None,) * (max_col - len(values))
+        return tuple(values)
+
+    def edits(self) -> List[CellEdit]:
+        return [CellEdit(self.title, row, col, value, fill) for (row, col), (value, fill) in sorted(self._edits.items())]
+
+
+class XlsxPatchWorkbook:
+    """
+    셀 단위 편집을 모았다가 patch_workbook 으로 한 번에 저장하는 워크북.
+    (sheetnames, wb[name], cell(), save(), close() 로 openpyxl 워크북 대신 사용)
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._reader: Optional[XlsxStreamWorkbook] = None
+        self._sheets: Dict[str, PatchSheet] = {}
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                self._sheetnames = list(read_workbook_parts(archive)[0])
+        except (zipfile.BadZipFile, KeyError) as e:
+            raise XlsxPatchError(f"xlsx(zip) 파일을 열 수 없습니다: {e}")
+
+    @property
+    def reader(self) -> XlsxStreamWorkbook:
+        """값 읽기용 스트리밍 워크북 (처음 읽을 때 엶)"""
+        if self._reader is None:
+            self._reader = XlsxStreamWorkbook(self.file_path)
+        return self._reader
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheetnames)
+
+    def __getitem__(self, sheet_name: str) -> PatchSheet:
+        if sheet_name not in self._sheetnames:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        if sheet_name not in self._sheets:
+            self._sheets[sheet_name] = PatchSheet(self, sheet_name)
+        return self._sheets[sheet_name]
+
+    def edits(self) -> List[CellEdit]:
+        return [edit for sheet in self._sheets.values() for edit in sheet.edits()]
+
+    def save(self, output_path: Optional[str] = None) -> int:
+        """모은 편집을 저장하고 쓴 셀 수를 반환합니다. (편집이 없으면 파일을 쓰지 않음)"""
+        edits = self.edits()
+        if not edits:
+            return 0
+        self.close()
+        written = save_edits(self.file_path, edits, output_path)
+        for sheet in self._sheets.values():
+            sheet._rows = None
+            sheet._edits.clear()
+        return written
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def open_workbook_for_update(file_path: str, **load_kwargs):
+    """
+    셀 값을 고쳐 저장할 워크북을 엽니다.
+
+    xlsx/xlsm 은 XlsxPatchWorkbook (저장 시 바뀐 셀만 XML 직접 수정),
+    그 외 형식이거나 zip으로 열 수 없으면 openpyxl 워크북을 반환합니다. (load_kwargs는 openpyxl용)
+    """
+    if can_patch(file_path):
+        try:
+            return XlsxPatchWorkbook(file_path)
+        except XlsxPatchError as e:
+            logger.info(f"XML 직접 수정 불가, openpyxl로 엽니다: {file_path} - {e}")
+    from openpyxl import load_workbook
+    return load_workbook(file_path, **load_kwargs)
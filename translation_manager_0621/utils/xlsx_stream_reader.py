@@ -0,0 +1,320 @@
+# utils/xlsx_stream_reader.py
+"""
+xlsx 원본 XML 스트리밍 리더 (읽기 전용)
+
+openpyxl 읽기 전용 모드는 행마다 셀 객체를 만들고 공유 문자열을 변환하기 때문에
+수백 개 파일로 DB를 구축할 때 대부분의 시간이 iter_rows 안에서 소비됩니다.
+이 모듈은 zip 안의 시트 XML을 iterparse로 직접 읽어
+- sharedStrings 표는 파일당 한 번만 읽어 intern된 리스트로 보관하고
+- 요청한 컬럼의 값만 만들어 반환합니다.
+
+openpyxl 워크북/워크시트와 같은 형태(sheetnames, wb[name], iter_rows(values_only=True), close())를
+제공하므로 utils.string_sheet_reader 에 그대로 넘길 수 있습니다.
+날짜 서식은 해석하지 않으며 숫자 값 그대로 반환합니다.
+"""
+
+import posixpath
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_REL_NS = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "http://purl.oclc.org/ooxml/officeDocument/relationships",
+)
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_OFFICE_DOCUMENT_SUFFIX = "/officeDocument"
+_SHARED_STRINGS_SUFFIX = "/sharedStrings"
+
+STREAMABLE_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+def _local(tag: str) -> str:
+    """'{namespace}tag' 형태에서 태그 이름만 반환합니다."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def column_index(ref: str) -> int:
+    """셀 주소(예: 'AB12')의 컬럼 번호(1부터)를 반환합니다."""
+    col = 0
+    for ch in ref:
+        code = ord(ch)
+        if 65 <= code <= 90:
+            col = col * 26 + code - 64
+        elif 97 <= code <= 122:
+            col = col * 26 + code - 96
+        else:
+            break
+    return col
+
+
+def _cast_number(text: str) -> Any:
+    """openpyxl과 같은 규칙으로 숫자 문자열을 int/float로 변환합니다."""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _resolve_target(base_dir: str, target: str) -> str:
+    """관계(Relationship) Target을 zip 내부 경로로 변환합니다."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _read_relationships(archive: zipfile.ZipFile, rels_path: str, base_dir: str) -> Dict[str, Tuple[str, str]]:
+    """rels 파일을 읽어 {Id: (Type, zip 내부 경로)}를 반환합니다."""
+    if rels_path not in archive.namelist():
+        return {}
+    root = ET.fromstring(archive.read(rels_path))
+    rels = {}
+    for rel in root.iter("{%s}Relationship" % _PKG_REL_NS):
+        if rel.get("TargetMode") == "External":
+            continue
+        rels[rel.get("Id")] = (rel.get("Type", ""), _resolve_target(base_dir, rel.get("Target", "")))
+    return rels
+
+
+def _string_item_text(si) -> str:
+    """<si>/<is> 요소의 텍스트를 반환합니다. (서식 run 결합, 윗주(rPh) 제외)"""
+    parts = []
+    for child in si:
+        name = _local(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            for sub in child:
+                if _local(sub.tag) == "t":
+                    parts.append(sub.text or "")
+    return "".join(parts)
+
+
+def read_workbook_relationships(archive: zipfile.ZipFile) -> Tuple[str, str, Dict[str, Tuple[str, str]]]:
+    """
+    workbook.xml의 위치와 관계 파일을 읽습니다.
+
+    Returns:
+        (workbook.xml 경로, 관계 파일 경로, {Id: (Type, zip 내부 경로)})
+    """
+    root_rels = _read_relationships(archive, "_rels/.rels", "")
+    workbook_part = next(
+        (target for rel_type, target in root_rels.values() if rel_type.endswith(_OFFICE_DOCUMENT_SUFFIX)),
+        "xl/workbook.xml",
+    )
+    base_dir = posixpath.dirname(workbook_part)
+    rels_path = posixpath.join(base_dir, "_rels", posixpath.basename(workbook_part) + ".rels")
+    return workbook_part, rels_path, _read_relationships(archive, rels_path, base_dir)
+
+
+def read_workbook_parts(archive: zipfile.ZipFile) -> Tuple[Dict[str, str], Optional[str]]:
+    """
+    workbook.xml과 관계 파일만 읽어 시트별 zip 내부 경로를 찾습니다.
+
+    Returns:
+        ({시트명: 시트 XML 경로}, sharedStrings 경로 또는 None)
+    """
+    workbook_part, _, rels = read_workbook_relationships(archive)
+
+    sheet_parts = {}
+    root = ET.fromstring(archive.read(workbook_part))
+    for elem in root.iter():
+        if _local(elem.tag) != "sheet":
+            continue
+        rel_id = None
+        for ns in _REL_NS:
+            rel_id = elem.get("{%s}id" % ns)
+            if rel_id:
+                break
+        if rel_id in rels:
+            sheet_parts[elem.get("name")] = rels[rel_id][1]
+
+    shared_part = next(
+        (target for rel_type, target in rels.values() if rel_type.endswith(_SHARED_STRINGS_SUFFIX)),
+        None,
+    )
+    return sheet_parts, shared_part
+
+
+def sheet_fingerprints(file_path: str) -> Dict[str, str]:
+    """
+    시트별 내용 지문을 zip 항목의 CRC32로 계산합니다. (압축 해제 없음)
+
+    문자열 셀 값은 sharedStrings에 있으므로 셀 문구만 바뀌면 시트 XML은 그대로일 수 있습니다.
+    그래서 지문은 '시트 XML CRC32-sharedStrings CRC32' 형태로 만듭니다.
+    xlsx/xlsm이 아니면 빈 딕셔너리를 반환합니다.
+
+    Returns:
+        {시트명: 지문 문자열}
+    """
+    if not file_path.lower().endswith(STREAMABLE_EXTENSIONS):
+        return {}
+    with zipfile.ZipFile(file_path) as archive:
+        sheet_parts, shared_part = read_workbook_parts(archive)
+        infos = {info.filename: info for info in archive.infolist()}
+    shared_crc = infos[shared_part].CRC if shared_part in infos else 0
+    return {
+        sheet_name: f"{infos[part].CRC:08x}-{shared_crc:08x}"
+        for sheet_name, part in sheet_parts.items() if part in infos
+    }
+
+
+class XlsxStreamSheet:
+    """시트 XML을 스트리밍으로 읽는 읽기 전용 워크시트"""
+
+    # 컬럼 필터(columns 인자)를 지원함을 알리는 표시 (string_sheet_reader에서 사용)
+    supports_column_filter = True
+
+    def __init__(self, workbook: "XlsxStreamWorkbook", title: str, part: str):
+        self.parent = workbook
+        self.title = title
+        self._part = part
+
+    def iter_rows(self, min_row: int = 1, max_row: Optional[int] = None, max_col: Optional[int] = None,
+                  values_only: bool = True, columns: Optional[Iterable[int]] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        openpyxl iter_rows(values_only=True)와 같은 형태로 행 값을 반환합니다.
+
+        Args:
+            min_row: 시작 행 (1부터)
+            max_row: 마지막 행 (None이면 시트 끝까지)
+            max_col: 반환할 최대 컬럼 수 (지정하면 부족한 칸은 None으로 채움)
+            values_only: 값만 반환 (True만 지원)
+            columns: 값을 만들 컬럼 번호 집합 (나머지 칸은 None)
+
+        Yields:
+            행 값 튜플 (중간에 비어 있는 행은 빈 행으로 채움)
+        """
+        if not values_only:
+            raise ValueError("XlsxStreamSheet는 values_only=True만 지원합니다.")
+
+        wanted = frozenset(columns) if columns is not None else None
+        if wanted is not None and max_col is None and wanted:
+            max_col = max(wanted)
+        empty_row = (None,) * max_col if max_col else ()
+        shared = self.parent.shared_strings
+
+        expected_row = min_row
+        with self.parent.archive.open(self._part) as stream:
+            for _, elem in ET.iterparse(stream, events=("end",)):
+                if _local(elem.tag) != "row":
+                    continue
+
+                row_attr = elem.get("r")
+                row_idx = int(row_attr) if row_attr else expected_row
+                if row_idx < min_row:
+                    elem.clear()
+                    continue
+                if max_row is not None and row_idx > max_row:
+                    break
+
+                # 중간에 비어 있는 행 채우기 (openpyxl 읽기 전용 모드와 동일)
+                while expected_row < row_idx:
+                    yield empty_row
+                    expected_row += 1
+
+                cells: Dict[int, Any] = {}
+                last_col = 0
+                next_col = 1
+                for c in elem:
+                    ref = c.get("r")
+                    col = column_index(ref) if ref else next_col
+                    next_col = col + 1
+                    if (max_col is not None and col > max_col) or (wanted is not None and col not in wanted):
+                        continue
+
+                    cell_type = c.get("t", "n")
+                    value = None
+                    if cell_type == "inlineStr":
+                        for child in c:
+                            if _local(child.tag) == "is":
+                                value = _string_item_text(child)
+                    else:
+                        text = None
+                        for child in c:
+                            if _local(child.tag) == "v":
+                                text = child.text
+                                break
+                        if text is not None:
+                            if cell_type == "s":
+                                value = shared[int(text)]
+                            elif cell_type == "n":
+                                value = _cast_number(text)
+                            elif cell_type == "b":
+                                value = text == "1"
+                            else:  # str, e, d
+                                value = text
+                    if value is not None:
+                        cells[col] = value
+                        if col > last_col:
+                            last_col = col
+                elem.clear()
+
+                width = max_col if max_col else last_col
+                yield tuple(cells.get(col) for col in range(1, width + 1))
+                expected_row = row_idx + 1
+                if max_row is not None and row_idx >= max_row:
+                    break
+
+
+class XlsxStreamWorkbook:
+    """xlsx 파일을 zip에서 직접 읽는 읽기 전용 워크북"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.archive = zipfile.ZipFile(file_path)
+        try:
+            self._sheet_parts, shared_part = read_workbook_parts(self.archive)
+            self.shared_strings = self._read_shared_strings(shared_part)
+        except Exception:
+            self.archive.close()
+            raise
+
+    def _read_shared_strings(self, shared_part: Optional[str]) -> List[str]:
+        """sharedStrings 표를 한 번만 읽어 intern된 문자열 리스트로 반환합니다."""
+        if not shared_part or shared_part not in self.archive.namelist():
+            return []
+        strings = []
+        intern = sys.intern
+        with self.archive.open(shared_part) as stream:
+            for _, elem in ET.iterparse(stream, events=("end",)):
+                if _local(elem.tag) == "si":
+                    strings.append(intern(_string_item_text(elem)))
+                    elem.clear()
+        return strings
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheet_parts)
+
+    def __getitem__(self, sheet_name: str) -> XlsxStreamSheet:
+        if sheet_name not in self._sheet_parts:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return XlsxStreamSheet(self, sheet_name, self._sheet_parts[sheet_name])
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def open_workbook_for_read(file_path: str, use_cache: bool = True):
+    """
+    값 읽기 전용으로 워크북을 엽니다.
+
+    xlsx/xlsm 파일은 파싱된 워크북 캐시(utils.workbook_cache)를 거쳐 열고,
+    use_cache=False이면 XlsxStreamWorkbook으로 직접 엽니다.
+    그 외 형식은 openpyxl 읽기 전용 모드로 엽니다.
+    """
+    if file_path.lower().endswith(STREAMABLE_EXTENSIONS):
+        if use_cache:
+            from utils.workbook_cache import get_workbook_cache
+            return get_workbook_cache().open(file_path)
+        return XlsxStreamWorkbook(file_path)
+    from openpyxl import load_workbook
+    return load_workbook(file_path, read_only=True, data_only=True)